@@ -30,3 +30,16 @@ caa.logger.warning("Stay alert, stay safe, bee kind!")
 
 # [2020-06-13 11:12:09,096] INFO in example_14: Hello world!
 # [2020-06-13 11:12:09,096] WARNING in example_14: Stay alert, stay safe, bee kind!
+
+# the log output can be switched to json records, the COM call context is added to them.
+from pycatia.cat_logger import com_call, silence, use_json_format
+
+use_json_format()
+with com_call("Documents.Open", file_name="my_part.CATPart"):
+    caa.logger.info("Opening %s.", "my_part.CATPart")
+
+# {"time": "2020-06-13 11:12:09,096", "level": "INFO", "module": "example__logging__001",
+#  "message": "Opening my_part.CATPart.", "com_call": {"name": "Documents.Open", "file_name": "my_part.CATPart"}}
+
+# silence the logger. calls to the logger return immediately.
+silence()
@@ -18,10 +18,17 @@
 
 import os
 
-from pycatia.base_interfaces.base_application import catia_application as catia
-from pycatia.base_interfaces.context import CATIADocHandler
 from .version import version
 
+try:
+    from pycatia.base_interfaces.base_application import catia_application as catia
+    from pycatia.base_interfaces.context import CATIADocHandler
+except ModuleNotFoundError as e:
+    # pywin32 is only available on Windows. The offline readers, such as
+    # pycatia.types.document_header, can still be used without it.
+    if e.name not in ('win32com', 'pythoncom', 'pywintypes'):
+        raise
+
 __author__ = 'Paul Bourne'
 __author_email = 'evereux@gmail.com'
 __description__ = 'A python module to interface with the CATIA V5 COM object.'
@@ -16,6 +16,8 @@ class PyCATIA:
     @property
     def logger(self) -> logging.Logger:
         """
+        The pycatia logger. It is created once and shared by all objects.
+
         :rtype: logging.Logger
         """
         return create_logger()
@@ -30,7 +32,7 @@ class PyCATIA:
         :param str name:
         """
         if current < required:
-            self.logger.info(f'"{name}" was introduced in R{required}. You are running R{current}.')
+            self.logger.info('"%s" was introduced in R%s. You are running R%s.', name, required, current)
 
     def __repr__(self):
         return 'PyCATIA()'
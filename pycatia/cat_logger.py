@@ -1,5 +1,9 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import json
 import logging
 import sys
+import time
 
 from typing import Optional
 
@@ -35,26 +39,181 @@ def has_level_handler(logger: Optional[logging.Logger]):
     return False
 
 
+#: ``[%(asctime)s] %(levelname)s in %(module)s: %(message)s``.
+default_format = "[%(asctime)s] %(levelname)s in %(module)s: %(message)s"
+
+#: The COM call being made when a record is logged, see :func:`com_call`.
+_com_call_context: ContextVar[Optional[dict]] = ContextVar('pycatia_com_call', default=None)
+
+_logger: Optional[logging.Logger] = None
+_default_handler: Optional[logging.Handler] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """
+
+    Formats records as one json object per line. The COM call context (see
+    :func:`com_call`) is added to the record under the key "com_call".
+
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'module': record.module,
+            'message': record.getMessage(),
+        }
+        com_call_context = getattr(record, 'com_call', None)
+        if com_call_context is not None:
+            data['com_call'] = com_call_context
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            data['suppressed'] = suppressed
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+
+        return json.dumps(data, default=str)
+
+
+class ContextFilter(logging.Filter):
+    """
+    Adds the current COM call context to the record.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.com_call = _com_call_context.get()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+
+    Drops records logged again from the same place (same level, file and
+    line) within interval seconds, e.g. a warning logged in a loop. The number of records
+    dropped is added to the next record let through.
+
+    Only records at level or above are limited.
+
+    """
+
+    def __init__(self, interval: float = 1.0, level: int = logging.WARNING):
+        super().__init__()
+        self.interval = interval
+        self.level = level
+        self._last_seen = {}
+        self._suppressed = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level or self.interval <= 0:
+            return True
+
+        key = (record.levelno, record.pathname, record.lineno)
+        now = time.monotonic()
+        last_seen = self._last_seen.get(key)
+        if last_seen is not None and now - last_seen < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+
+        self._last_seen[key] = now
+        record.suppressed = self._suppressed.pop(key, 0)
+        if record.suppressed:
+            record.msg = f'{record.msg} ({record.suppressed} similar messages suppressed)'
+
+        return True
+
+
 def create_logger() -> logging.Logger:
     """
 
+    Returns the pycatia logger. The logger and its handler are only created
+    on the first call, later calls return the same logger.
+
     :return: Logger
     :rtype: logging.Logger
     """
 
-    #: ``[%(asctime)s] %(levelname)s in %(module)s: %(message)s``.
-    default_handler = logging.StreamHandler(sys.stderr)
-    default_handler.setFormatter(
-        logging.Formatter("[%(asctime)s] %(levelname)s in %(module)s: %(message)s")
-    )
+    global _logger, _default_handler
+
+    if _logger is not None:
+        return _logger
+
+    _default_handler = logging.StreamHandler(sys.stderr)
+    _default_handler.setFormatter(logging.Formatter(default_format))
+    _default_handler.addFilter(ContextFilter())
+    _default_handler.addFilter(RateLimitFilter())
 
     logger = logging.getLogger('pycatia')
 
     logger.setLevel(logging.INFO)
-    
+
     # clear existed Handlers
     logger.handlers.clear()
-    
-    logger.addHandler(default_handler)
+
+    logger.addHandler(_default_handler)
+
+    _logger = logger
 
     return logger
+
+
+def use_json_format(enabled: bool = True) -> None:
+    """
+
+    Switches the pycatia log output between json records and the default text
+    format.
+
+    :param bool enabled:
+    """
+
+    create_logger()
+    _default_handler.setFormatter(JSONFormatter() if enabled else logging.Formatter(default_format))
+
+
+def set_rate_limit(interval: float, level: int = logging.WARNING) -> None:
+    """
+
+    Sets the number of seconds during which a repeated record is dropped.
+    0 disables the rate limit.
+
+    :param float interval:
+    :param int level: records below level are never limited.
+    """
+
+    create_logger()
+    for log_filter in _default_handler.filters:
+        if isinstance(log_filter, RateLimitFilter):
+            log_filter.interval = interval
+            log_filter.level = level
+
+
+def silence(enabled: bool = True) -> None:
+    """
+
+    Silences the pycatia logger. When silenced calls to the logger return
+    immediately without creating records.
+
+    :param bool enabled:
+    """
+
+    create_logger().disabled = enabled
+
+
+@contextmanager
+def com_call(name: str, **context):
+    """
+
+    Adds the COM call name and context to the records logged within the block.
+
+    >>> with com_call('Documents.Open', file_name=file_name):
+    >>>     logger.info('Opening document.')
+
+    :param str name: the COM method or property called.
+    :param context: any other information to log with the records.
+    """
+
+    token = _com_call_context.set({'name': name, **context})
+    try:
+        yield
+    finally:
+        _com_call_context.reset(token)
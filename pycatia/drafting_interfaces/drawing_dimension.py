@@ -12,6 +12,7 @@
 from pycatia.drafting_interfaces.drawing_dim_ext_line import DrawingDimExtLine
 from pycatia.drafting_interfaces.drawing_dim_line import DrawingDimLine
 from pycatia.drafting_interfaces.drawing_dim_value import DrawingDimValue
+from pycatia.enumeration.int_enums import decode
 from pycatia.knowledge_interfaces.parameters import Parameters
 from pycatia.system_interfaces.any_object import AnyObject
 
@@ -107,7 +108,7 @@ class DrawingDimension(AnyObject):
         :rtype: int
         """
 
-        return self.drawing_dimension.DimType
+        return decode('cat_dim_type', self.drawing_dimension.DimType)
 
     @property
     def dual_value(self) -> int:
@@ -23,6 +23,7 @@ from pycatia.drafting_interfaces.drawing_threads import DrawingThreads
 from pycatia.drafting_interfaces.drawing_view_generative_behavior import DrawingViewGenerativeBehavior
 from pycatia.drafting_interfaces.drawing_view_generative_links import DrawingViewGenerativeLinks
 from pycatia.drafting_interfaces.drawing_weldings import DrawingWeldings
+from pycatia.enumeration.int_enums import decode
 from pycatia.mec_mod_interfaces.geometric_elements import GeometricElements
 from pycatia.sketcher_interfaces.factory_2D import Factory2D
 from pycatia.system_interfaces.any_object import AnyObject
@@ -647,7 +648,7 @@ class DrawingView(AnyObject):
         :rtype: int
         """
 
-        return self.drawing_view.ViewType
+        return decode('cat_drawing_view_type', self.drawing_view.ViewType)
 
     @property
     def weldings(self) -> DrawingWeldings:
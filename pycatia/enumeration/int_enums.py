@@ -0,0 +1,133 @@
+#! /usr/bin/python3.9
+
+"""
+
+    IntEnum representation of the enumerations in
+    :mod:`pycatia.enumeration.enumeration_types`.
+
+    The enumeration types are tuples, the value of an enumeration being the
+    index of its name. Finding the value of a name with tuple.index() scans the
+    tuple, the IntEnum classes built here give constant time lookups both ways.
+    They are built the first time they are used.
+
+    >>> from pycatia.enumeration.int_enums import cat_capture_format
+    >>> cat_capture_format.catCaptureFormatBMP
+    <CatCaptureFormat.catCaptureFormatBMP: 4>
+    >>> cat_capture_format(4).name
+    'catCaptureFormatBMP'
+
+    Names that aren't valid python identifiers have their invalid characters
+    replaced by underscores ('Solid / Volume' becomes 'Solid_Volume'). Use
+    :func:`enum_value` and :func:`enum_name` to work with the original names.
+
+"""
+
+from enum import IntEnum
+import functools
+import re
+from typing import Type, Union
+
+from pycatia.enumeration import enumeration_types
+
+_re_invalid = re.compile(r'\W+')
+
+
+def _member_name(name: str) -> str:
+    member_name = _re_invalid.sub('_', name).strip('_')
+    if not member_name.isidentifier():
+        member_name = f'_{member_name}'
+    return member_name
+
+
+def _class_name(enum_type: str) -> str:
+    return ''.join(word.capitalize() for word in enum_type.split('_'))
+
+
+def _enum_names(enum_type: str) -> tuple:
+    names = getattr(enumeration_types, enum_type, None)
+    if not isinstance(names, tuple):
+        raise AttributeError(f'"{enum_type}" is not an enumeration type.')
+    return names
+
+
+@functools.lru_cache(maxsize=None)
+def get_enum(enum_type: str) -> Type[IntEnum]:
+    """
+
+    Returns the IntEnum class of the enumeration type enum_type.
+
+    >>> get_enum('cat_capture_format').catCaptureFormatBMP
+    >>> # <CatCaptureFormat.catCaptureFormatBMP: 4>
+
+    :param str enum_type: the name of the tuple in enumeration_types.
+    :rtype: IntEnum
+    """
+
+    names = _enum_names(enum_type)
+    return IntEnum(_class_name(enum_type), [(_member_name(name), value) for value, name in enumerate(names)])
+
+
+@functools.lru_cache(maxsize=None)
+def _name_to_value(enum_type: str) -> dict:
+    return {name: value for value, name in enumerate(_enum_names(enum_type))}
+
+
+def enum_value(enum_type: str, name: str) -> int:
+    """
+
+    Returns the value of the enumeration name. The same as
+    enumeration_types.enum_type.index(name) without scanning the tuple.
+
+    :param str enum_type:
+    :param str name:
+    :rtype: int
+    """
+
+    try:
+        return _name_to_value(enum_type)[name]
+    except KeyError:
+        raise ValueError(f'"{name}" is not in {enum_type}.')
+
+
+def enum_name(enum_type: str, value: int) -> str:
+    """
+
+    Returns the name of the enumeration value.
+
+    :param str enum_type:
+    :param int value:
+    :rtype: str
+    """
+
+    names = _enum_names(enum_type)
+    if not 0 <= value < len(names):
+        raise ValueError(f'{value} is not a value of {enum_type}.')
+    return names[value]
+
+
+def decode(enum_type: str, value: int) -> Union[IntEnum, int]:
+    """
+
+    Converts the value returned by CATIA into the IntEnum member of enum_type.
+    Values unknown to pycatia, from newer CATIA releases for example, are
+    returned unchanged.
+
+    :param str enum_type:
+    :param int value:
+    :rtype: IntEnum
+    """
+
+    try:
+        return get_enum(enum_type)(value)
+    except ValueError:
+        return value
+
+
+def __getattr__(name: str) -> Type[IntEnum]:
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return get_enum(name)
+
+
+def __dir__() -> list:
+    return [name for name, value in vars(enumeration_types).items() if isinstance(value, tuple)]
@@ -0,0 +1,249 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Translates the COM errors raised by CATIA (pywintypes.com_error) into typed
+    pycatia exceptions and retries the calls CATIA rejected because it was busy.
+
+    >>> from pycatia.exception_handling.com_errors import translate_com_errors
+    >>> @translate_com_errors('Could not open "{file_name}".')
+    >>> def open_document(documents, file_name):
+    >>>     return documents.Open(file_name)
+
+    The translated exceptions derive from both CATIAApplicationException and
+    pywintypes.com_error so existing ``except`` clauses keep working.
+
+    The retry policy is set with :data:`default_retry_policy` and the number of
+    errors and retries can be monitored with :func:`get_com_error_counters`.
+
+"""
+
+from collections import Counter
+import functools
+import inspect
+import time
+from typing import Callable, Optional
+
+from pywintypes import com_error
+
+from pycatia.cat_logger import create_logger
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+# HRESULTs returned by CATIA and the COM runtime.
+RPC_E_CALL_REJECTED = -2147418111  # 0x80010001
+RPC_E_SERVERCALL_RETRYLATER = -2147417846  # 0x8001010A
+RPC_E_DISCONNECTED = -2147417848  # 0x80010108
+RPC_S_SERVER_UNAVAILABLE = -2147023174  # 0x800706BA
+RPC_S_CALL_FAILED = -2147023170  # 0x800706BE
+E_FAIL = -2147467259  # 0x80004005
+E_INVALIDARG = -2147024809  # 0x80070057
+DISP_E_MEMBERNOTFOUND = -2147352573  # 0x80020003
+DISP_E_TYPEMISMATCH = -2147352571  # 0x80020005
+DISP_E_PARAMNOTFOUND = -2147352572  # 0x80020004
+DISP_E_EXCEPTION = -2147352567  # 0x80020009
+DISP_E_BADPARAMCOUNT = -2147352562  # 0x8002000E
+
+
+class CATIAComException(CATIAApplicationException, com_error):
+    """
+
+    A COM error raised by CATIA. The arguments of the original com_error are
+    kept in args, the hresult and CATIA description are also available as
+    attributes.
+
+    """
+
+    def __init__(self, message: str, hresult: int, description: Optional[str] = None, com_args: tuple = ()):
+        super().__init__(message)
+        self.args = com_args
+        self.hresult = hresult
+        self.description = description
+
+    def __str__(self):
+        return self.message
+
+
+class CATIABusyException(CATIAComException):
+    """
+    CATIA rejected the call as it is busy. The call can be retried.
+    """
+    pass
+
+
+class CATIADisconnectedException(CATIAComException):
+    """
+    The CATIA session can no longer be reached, it has been closed or has crashed.
+    """
+    pass
+
+
+class CATIAInvalidArgumentException(CATIAComException):
+    """
+    The arguments given to the CATIA method are of the wrong type or number.
+    """
+    pass
+
+
+class CATIAMethodFailedException(CATIAComException):
+    """
+    The CATIA method was called but failed.
+    """
+    pass
+
+
+#: maps the HRESULTs to the exception raised.
+hresult_exceptions = {
+    RPC_E_CALL_REJECTED: CATIABusyException,
+    RPC_E_SERVERCALL_RETRYLATER: CATIABusyException,
+    RPC_E_DISCONNECTED: CATIADisconnectedException,
+    RPC_S_SERVER_UNAVAILABLE: CATIADisconnectedException,
+    RPC_S_CALL_FAILED: CATIADisconnectedException,
+    E_INVALIDARG: CATIAInvalidArgumentException,
+    DISP_E_TYPEMISMATCH: CATIAInvalidArgumentException,
+    DISP_E_PARAMNOTFOUND: CATIAInvalidArgumentException,
+    DISP_E_BADPARAMCOUNT: CATIAInvalidArgumentException,
+    DISP_E_MEMBERNOTFOUND: CATIAInvalidArgumentException,
+    E_FAIL: CATIAMethodFailedException,
+    DISP_E_EXCEPTION: CATIAMethodFailedException,
+}
+
+_counters = Counter()
+
+
+class RetryPolicy:
+    """
+
+    How calls raising a retryable exception are retried. The delay between
+    attempts starts at delay seconds and is multiplied by backoff after each
+    attempt, up to max_delay.
+
+    :param int retries: the number of retries, 0 disables retrying.
+    :param float delay: seconds.
+    :param float backoff:
+    :param float max_delay: seconds.
+    :param tuple retry_on: the exceptions to retry.
+    """
+
+    def __init__(self, retries: int = 5, delay: float = 0.1, backoff: float = 2.0, max_delay: float = 2.0,
+                 retry_on: tuple = (CATIABusyException,)):
+        self.retries = retries
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        :param int attempt: the number of the retry, starting at 0.
+        :rtype: float
+        """
+        return min(self.delay * self.backoff ** attempt, self.max_delay)
+
+    def __repr__(self):
+        return f'RetryPolicy(retries={self.retries}, delay={self.delay}, backoff={self.backoff})'
+
+
+#: the policy used when translate_com_errors isn't given one.
+default_retry_policy = RetryPolicy()
+
+
+def translate_com_error(error: com_error, message: Optional[str] = None) -> CATIAComException:
+    """
+
+    Returns the pycatia exception for the com_error error.
+
+    :param com_error error:
+    :param str message: (optional) prefixed to the CATIA error description.
+    :rtype: CATIAComException
+    """
+
+    hresult, strerror, excepinfo, _ = (tuple(error.args) + (None,) * 4)[:4]
+    description = strerror
+
+    # with DISP_E_EXCEPTION the error raised by CATIA is in the exception info.
+    if hresult == DISP_E_EXCEPTION and excepinfo:
+        description = excepinfo[2] or description
+        scode = excepinfo[5]
+        if scode in hresult_exceptions:
+            hresult = scode
+
+    exception_type = hresult_exceptions.get(hresult, CATIAComException)
+    full_message = ' '.join(text for text in (message, description) if text)
+
+    return exception_type(full_message, hresult, description, tuple(error.args))
+
+
+def translate_com_errors(message: Optional[str] = None, retry_policy: Optional[RetryPolicy] = None) -> Callable:
+    """
+
+    Decorator translating the com_errors raised by the function into pycatia
+    exceptions and retrying the call according to the retry policy.
+
+    message is formatted with the arguments of the function, for example
+    'Could not open "{file_name}".'
+
+    :param str message: (optional)
+    :param RetryPolicy retry_policy: (optional) defaults to :data:`default_retry_policy`.
+    :rtype: Callable
+    """
+
+    def decorator(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            policy = retry_policy or default_retry_policy
+            attempt = 0
+            while True:
+                try:
+                    return function(*args, **kwargs)
+                except com_error as e:
+                    if isinstance(e, CATIAComException):
+                        exception = e
+                    else:
+                        formatted = message
+                        if message is not None:
+                            arguments = signature.bind(*args, **kwargs)
+                            arguments.apply_defaults()
+                            formatted = message.format(**arguments.arguments)
+                        exception = translate_com_error(e, formatted)
+
+                    # errors already translated have been retried by the decorated function raising them.
+                    retry = exception is not e and isinstance(exception, policy.retry_on)
+                    if retry and attempt < policy.retries:
+                        delay = policy.get_delay(attempt)
+                        _counters['retries'] += 1
+                        create_logger().debug('%s rejected by CATIA, retrying in %ss.', function.__qualname__, delay)
+                        time.sleep(delay)
+                        attempt += 1
+                        continue
+
+                    if exception is e:
+                        raise
+                    _counters[type(exception).__name__] += 1
+                    raise exception from e
+
+        return wrapper
+
+    return decorator
+
+
+def get_com_error_counters() -> dict:
+    """
+
+    Returns the number of retries and of each exception raised by functions
+    decorated with translate_com_errors.
+
+    >>> get_com_error_counters()
+    >>> # {'retries': 12, 'CATIAMethodFailedException': 1}
+
+    :rtype: dict
+    """
+    return dict(_counters)
+
+
+def reset_com_error_counters() -> None:
+    """
+    Resets the counters returned by get_com_error_counters().
+    """
+    _counters.clear()
@@ -8,8 +8,9 @@
         and thus help debugging in pycatia.
 
 """
-from typing import Union
+from typing import TYPE_CHECKING, Optional, Union
 
+from pycatia.enumeration.int_enums import decode
 from pycatia.hybrid_shape_interfaces.hybrid_shape_3d_curve_offset import HybridShape3DCurveOffset
 from pycatia.hybrid_shape_interfaces.hybrid_shape_affinity import HybridShapeAffinity
 from pycatia.hybrid_shape_interfaces.hybrid_shape_assemble import HybridShapeAssemble
@@ -113,8 +114,14 @@ from pycatia.hybrid_shape_interfaces.hybrid_shape_wrap_curve import HybridShapeW
 from pycatia.hybrid_shape_interfaces.hybrid_shape_wrap_surface import HybridShapeWrapSurface
 from pycatia.in_interfaces.reference import Reference
 from pycatia.mec_mod_interfaces.factory import Factory
+from pycatia.scripts.feature_cache import FeatureCache
+from pycatia.scripts.recorder import Recorder
+from pycatia.scripts.update_tracker import unwrap
 from pycatia.scripts.vba import vba_nothing, VBANothing
 
+if TYPE_CHECKING:
+    from pycatia.mec_mod_interfaces.part import Part
+
 
 class HybridShapeFactory(Factory):
     """
@@ -150,9 +157,12 @@ class HybridShapeFactory(Factory):
 
     """
 
-    def __init__(self, com_object):
+    def __init__(self, com_object, part: Optional['Part'] = None):
         super().__init__(com_object)
         self.hybrid_shape_factory = com_object
+        # the feature types found by classify_many(), keyed by feature. The factories of
+        # Part.hybrid_shape_factory share the cache of their part.
+        self._feature_types = FeatureCache() if part is None else part._feature_types
 
     def add_new_3d_corner(
             self,
@@ -6058,6 +6068,79 @@ class HybridShapeFactory(Factory):
         # # system_service = self.application.system_service
         # # return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
 
+    def classify_many(self, objects: list, refresh: bool = False) -> list:
+        """
+        Returns the geometrical feature types (see
+        :meth:`get_geometrical_feature_type`) of the objects. The references of
+        the objects are created and their types read in a single call to CATIA.
+
+        The objects are features of the part of the factory, or references.
+        The types are remembered for each feature by the part the factory was
+        obtained from (:attr:`Part.hybrid_shape_factory`), features already
+        classified aren't sent to CATIA again unless refresh is True, whichever
+        pycatia object of the feature is given. The objects which can't be
+        classified are Unknown and aren't remembered.
+
+        >>> from pycatia.enumeration.int_enums import geometrical_feature_type
+        >>> shapes = list(hybrid_body.hybrid_shapes)
+        >>> types = hsf.classify_many(shapes)
+        >>> points = [shape for shape, t in zip(shapes, types) if t == geometrical_feature_type.Point]
+
+        :param list objects:
+        :param bool refresh: classify all the objects again.
+        :rtype: list(IntEnum)
+        """
+
+        objects = list(objects)
+        feature_types = self._feature_types
+        missing = [obj for obj in objects if refresh or obj not in feature_types]
+        # the same feature may be given more than once.
+        missing = list({feature_types.key(obj): obj for obj in missing}.values())
+
+        if missing:
+            vba_function_name = 'classify_many'
+            vba_code = f"""
+            Public Function {vba_function_name}(hybrid_shape_factory, objects, is_reference)
+                Dim types()
+                ReDim types(UBound(objects))
+                Set part = hybrid_shape_factory.Parent
+                On Error Resume Next
+                For i = 0 To UBound(objects)
+                    If is_reference(i) Then
+                        Set reference = objects(i)
+                    Else
+                        Set reference = part.CreateReferenceFromObject(objects(i))
+                    End If
+                    types(i) = hybrid_shape_factory.GetGeometricalFeatureType(reference)
+                    If Err.Number <> 0 Then
+                        types(i) = -1
+                        Err.Clear
+                    End If
+                Next
+                {vba_function_name} = types
+            End Function
+            """
+
+            system_service = self.application.system_service
+            types = system_service.evaluate(
+                vba_code, 0, vba_function_name,
+                unwrap([
+                    self.com_object,
+                    [obj.com_object for obj in missing],
+                    [isinstance(obj, Reference) for obj in missing],
+                ])
+            )
+
+            for obj, feature_type in zip(missing, types):
+                if feature_type < 0:
+                    feature_types.pop(obj, None)
+                    self.logger.warning('Could not classify %s.', obj)
+                else:
+                    feature_types[obj] = decode('geometrical_feature_type', feature_type)
+
+        unknown = decode('geometrical_feature_type', 0)
+        return [feature_types.get(obj, unknown) for obj in objects]
+
     def delete_object_for_datum(self, i_object: Reference) -> None:
         """
         .. note::
@@ -6153,13 +6236,31 @@ class HybridShapeFactory(Factory):
                 |             Level of availability = V5R14
 
 
-        See enumeration.enumeration_types.geometrical_feature_type() for enums.
+        See enumeration.enumeration_types.geometrical_feature_type() for enums. The
+        value is returned as a member of enumeration.int_enums.geometrical_feature_type.
 
         :param Reference i_elem:
         :return: 0 = Unknown, 1 = Point, 2 = Curve, 3 = Line, 4 = Circle, 5 = Surface, 6 = Plane, 7 = Solid, Volume
         :rtype: int
         """
-        return self.hybrid_shape_factory.GetGeometricalFeatureType(i_elem.com_object)
+        return decode(
+            'geometrical_feature_type', self.hybrid_shape_factory.GetGeometricalFeatureType(i_elem.com_object))
+
+    def recording(self, *objects) -> Recorder:
+        """
+        Returns a context manager recording the calls made on this factory and
+        on objects (Part, HybridBody, ...). The calls return symbolic handles
+        and are replayed in a single call to CATIA when the context exits.
+        See :mod:`pycatia.scripts.recorder`.
+
+        >>> with hsf.recording(part, hybrid_body) as tx:
+        >>>     point = hsf.add_new_point_coord(0, 0, 0)
+        >>>     hybrid_body.append_hybrid_shape(point)
+
+        :param objects: the other pycatia objects to record.
+        :rtype: Recorder
+        """
+        return Recorder(self.application.system_service, self, *objects)
 
     def __repr__(self):
         return f'HybridShapeFactory(name="{self.name}")'
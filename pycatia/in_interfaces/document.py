@@ -799,7 +799,7 @@ class Document(AnyObject):
 
         :rtype: None
         """
-        self.logger.info(f'Saving the current document.')
+        self.logger.info('Saving the current document.')
         self.document.Save()
 
     def save_as(self, file_name: Path, overwrite: bool = False) -> None:
@@ -6,7 +6,9 @@ import warnings
 
 from pywintypes import com_error
 
+from pycatia.cat_logger import com_call
 from pycatia.exception_handling import CATIAApplicationException
+from pycatia.exception_handling.com_errors import translate_com_errors
 from pycatia.in_interfaces.document import Document
 from pycatia.system_interfaces.collection import Collection
 from pycatia.types.document import document_types
@@ -234,6 +236,9 @@ class Documents(Collection):
         self.logger.warning('The Documents.num_open method is unreliable and will be deprecated in future versions.')
         return self.documents.Count
 
+    @translate_com_errors(
+        'Could not OPEN document "{file_name}". '
+        'Check file type and ensure the version of CATIA it was created with is compatible.')
     def open(self, file_name: Path) -> Document:
         """
         .. note::
@@ -273,15 +278,146 @@ class Documents(Collection):
         if not file_name.is_file():
             raise FileNotFoundError(f'Could not find file {file_name}.')
 
-        self.logger.info(f'Opening document "{file_name}".')
-        try:
-            open_doc_com = self.documents.Open(file_name)
-            return get_document_object(open_doc_com)
-        except com_error:
-            raise CATIAApplicationException(
-                f'Could not OPEN document "{file_name}". '
-                'Check file type and ensure the version of CATIA it was created with is compatible.')
+        self.logger.info('Opening document "%s".', file_name)
+        open_doc_com = self.documents.Open(file_name)
+        return get_document_object(open_doc_com)
+
+    def open_many(self, file_names: list, mode: str = 'read', concurrency: int = 25,
+                  measure_memory: bool = False) -> dict:
+        """
+        Loads many documents using as few calls to CATIA as possible.
+
+        The documents are loaded in batches of `concurrency` files, each batch
+        being a single call to CATIA. With `mode='read'` the documents are loaded
+        using :meth:`Documents.read` which is the fastest way to retrieve product
+        properties. With `mode='open'` the documents are opened with an editor
+        (:meth:`Documents.open`).
+
+        Whether the documents linked to the opened ones are loaded is decided by
+        the CATIA settings (Tools > Options > General > Document and the cache
+        system), which only apply after CATIA is restarted and can't be changed
+        for a call.
+
+        Returns a dictionary keyed by the file path::
+
+            {
+                Path('e:/parts/my_part.CATPart'): {
+                    'document': PartDocument(name="my_part.CATPart"),
+                    'load_time': 0.42,  # seconds
+                    'memory_delta': 1048576,  # bytes
+                    'error': None,
+                },
+            }
+
+        With `measure_memory` `memory_delta` is the change in the working set of
+        the CATIA process(es) (CNEXT.exe) whilst the document was loaded, else
+        None. Querying the working set through WMI is slow compared to a read,
+        it is only done when asked for. If a document could not be loaded
+        `document` is None and `error` contains the CATIA error description.
+
+        >>> documents = caa.documents
+        >>> results = documents.open_many(files, mode='read')
+        >>> for file_name, result in results.items():
+        >>>     print(file_name, result['document'].product.part_number, result['load_time'])
+
+        :param list file_names: list of Path or str.
+        :param str mode: 'read' or 'open'.
+        :param int concurrency: the number of documents loaded per call to CATIA.
+        :param bool measure_memory: measure the working set of CATIA before and after each document.
+        :rtype: dict
+        """
 
+        if mode not in ('read', 'open'):
+            raise CATIAApplicationException(f'Mode "{mode}" not supported. Allowed modes are "read" and "open".')
+
+        if concurrency < 1:
+            raise CATIAApplicationException('concurrency must be greater than zero.')
+
+        # legacy support for strings.
+        file_names = [Path(file_name) for file_name in file_names]
+
+        for file_name in file_names:
+            if not file_name.is_file():
+                raise FileNotFoundError(f'Could not find file {file_name}.')
+
+        vba_function_name = 'open_many'
+        vba_code = f"""
+        Function working_set()
+            On Error Resume Next
+            working_set = 0
+            Set processes = GetObject("winmgmts:").ExecQuery( _
+                "Select WorkingSetSize From Win32_Process Where Name = 'CNEXT.exe'")
+            For Each process In processes
+                working_set = working_set + CDbl(process.WorkingSetSize)
+            Next
+        End Function
+
+        Public Function {vba_function_name}(documents, file_names, use_read, measure_memory)
+            count = UBound(file_names)
+            Dim docs(), times(), memory(), errors()
+            ReDim docs(count)
+            ReDim times(count)
+            ReDim memory(count)
+            ReDim errors(count)
+            If measure_memory Then memory_start = working_set()
+            On Error Resume Next
+            For i = 0 To count
+                start = Timer
+                If use_read Then
+                    Set docs(i) = documents.Read(file_names(i))
+                Else
+                    Set docs(i) = documents.Open(file_names(i))
+                End If
+                times(i) = Timer - start
+                errors(i) = ""
+                If Err.Number <> 0 Then
+                    Set docs(i) = Nothing
+                    errors(i) = Err.Description
+                    Err.Clear
+                End If
+                memory(i) = Null
+                If measure_memory Then
+                    memory_end = working_set()
+                    memory(i) = memory_end - memory_start
+                    memory_start = memory_end
+                End If
+            Next
+            {vba_function_name} = Array(docs, times, memory, errors)
+        End Function
+        """
+
+        system_service = self.application.system_service
+
+        results = {}
+        for i in range(0, len(file_names), concurrency):
+            batch = file_names[i:i + concurrency]
+            with com_call(f'Documents.{mode.capitalize()}', batch_start=i, batch_size=len(batch)):
+                self.logger.info('Loading documents %s to %s of %s.', i + 1, i + len(batch), len(file_names))
+                docs, times, memory, errors = system_service.evaluate(
+                    vba_code,
+                    0,
+                    vba_function_name,
+                    [self.com_object, [str(file_name) for file_name in batch], mode == 'read', measure_memory]
+                )
+
+            for file_name, doc_com, load_time, memory_delta, error in zip(batch, docs, times, memory, errors):
+                document = None
+                if error:
+                    self.logger.warning('Could not %s document "%s". %s', mode.upper(), file_name, error)
+                else:
+                    document = get_document_object(doc_com)
+                results[file_name] = {
+                    'document': document,
+                    'load_time': load_time,
+                    'memory_delta': memory_delta,
+                    'error': error or None,
+                }
+
+        return results
+
+    @translate_com_errors(
+        'Could not READ document "{file_name}". '
+        'Check file type and ensure the version of CATIA it was created with is compatible.')
     def read(self, file_name: Path) -> Document:
         """
         .. note::
@@ -326,14 +462,9 @@ class Documents(Collection):
         if not file_name.is_file():
             raise FileNotFoundError(f'Could not find file {file_name}.')
 
-        self.logger.info(f'Reading document "{file_name}".')
-        try:
-            read_doc_com = self.documents.Read(file_name)
-            return get_document_object(read_doc_com)
-        except com_error:
-            raise CATIAApplicationException(
-                f'Could not READ document "{file_name}". '
-                'Check file type and ensure the version of CATIA it was created with is compatible.')
+        self.logger.info('Reading document "%s".', file_name)
+        read_doc_com = self.documents.Read(file_name)
+        return get_document_object(read_doc_com)
 
     def __getitem__(self, n: int) -> Document:
         if (n + 1) > self.count:
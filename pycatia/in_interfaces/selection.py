@@ -10,9 +10,7 @@
 """
 from typing import Iterator
 
-from pywintypes import com_error
-
-from pycatia.exception_handling import CATIAApplicationException
+from pycatia.exception_handling.com_errors import translate_com_errors
 from pycatia.in_interfaces.document import Document
 from pycatia.in_interfaces.selected_element import SelectedElement
 from pycatia.in_interfaces.vis_property_set import VisPropertySet
@@ -1211,6 +1209,8 @@ class Selection(AnyObject):
         """
         return self.selection.Remove2(i_index)
 
+    @translate_com_errors(
+        'The method Search failed with search string "{i_string_bstr}". Try changing your search string.')
     def search(self, i_string_bstr):
         """
         .. note::
@@ -1240,11 +1240,7 @@ class Selection(AnyObject):
         :param str i_string_bstr:
         :rtype: None
         """
-        try:
-            return self.selection.Search(i_string_bstr)
-        except com_error:
-            raise CATIAApplicationException(
-                f'The method Search failed with search string "{i_string_bstr}". Try changing your search string.')
+        return self.selection.Search(i_string_bstr)
 
     def select_element2(self,
                         i_filter_type: tuple,
@@ -9,6 +9,7 @@
         
 """
 
+from pycatia.exception_handling.exceptions import CATIAApplicationException
 from pycatia.system_interfaces.any_object import AnyObject
 
 
@@ -120,6 +121,85 @@ class VisPropertySet(AnyObject):
         super().__init__(com_object)
         self.vis_property_set = com_object
 
+    def apply_many(self, element_groups: dict, inheritance: int = 1) -> int:
+        """
+        Applies graphic properties to groups of elements in a single call to
+        CATIA. element_groups is keyed by the style of the group, (red, green,
+        blue, opacity, show), an item being None when the property isn't
+        changed::
+
+            {
+                (255, 0, 0, 255, None): [part_1, part_2],
+                (None, None, None, None, cat_vis_property_show.index('catVisPropertyNoShowAttr')): [part_3],
+            }
+
+        For each group the selection is set to the elements of the group and
+        the properties are applied once. The selection is cleared afterwards.
+
+        :param dict element_groups: {(red, green, blue, opacity, show): [AnyObject]}
+        :param int inheritance: the inheritance flag of the color and opacity.
+        :return: the number of elements which could not be added to the selection.
+        :rtype: int
+        """
+
+        objects = []
+        counts = []
+        styles = []
+        for style, elements in element_groups.items():
+            if len(style) != 5:
+                raise CATIAApplicationException(f'The style {style} is not (red, green, blue, opacity, show).')
+            color = style[:3]
+            if None in color and color != (None, None, None):
+                raise CATIAApplicationException(f'The color of the style {style} is incomplete.')
+
+            objects.extend(element.com_object if isinstance(element, AnyObject) else element for element in elements)
+            counts.append(len(elements))
+            styles.extend(-1 if value is None else int(value) for value in style)
+
+        if not objects:
+            return 0
+
+        vba_function_name = 'apply_many'
+        vba_code = f"""
+        Public Function {vba_function_name}(vis_properties, objects, counts, styles, inheritance)
+            Dim selection, i, j, k, s, failed
+            Set selection = vis_properties.Parent
+            failed = 0
+            k = 0
+            For i = 0 To UBound(counts)
+                selection.Clear
+                On Error Resume Next
+                For j = 1 To counts(i)
+                    selection.Add objects(k)
+                    If Err.Number <> 0 Then
+                        failed = failed + 1
+                        Err.Clear
+                    End If
+                    k = k + 1
+                Next
+                On Error GoTo 0
+                s = 5 * i
+                If selection.Count > 0 Then
+                    If styles(s) >= 0 Then
+                        vis_properties.SetRealColor styles(s), styles(s + 1), styles(s + 2), inheritance
+                    End If
+                    If styles(s + 3) >= 0 Then vis_properties.SetRealOpacity styles(s + 3), inheritance
+                    If styles(s + 4) >= 0 Then vis_properties.SetShow styles(s + 4)
+                End If
+            Next
+            selection.Clear
+            {vba_function_name} = failed
+        End Function
+        """
+
+        system_service = self.application.system_service
+        failed = system_service.evaluate(vba_code, 0, vba_function_name,
+                                         [self.com_object, objects, counts, styles, inheritance])
+        if failed:
+            self.logger.warning('%s of the %s elements could not be selected.', failed, len(objects))
+
+        return failed
+
     def get_layer(self) -> tuple:
         """
         .. note::
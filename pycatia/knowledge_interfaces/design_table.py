@@ -9,13 +9,29 @@
         
 """
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional
 
+from pycatia.exception_handling.exceptions import CATIAApplicationException
 from pycatia.knowledge_interfaces.relation import Relation
+from pycatia.system_interfaces.any_object import AnyObject
 
 if TYPE_CHECKING:
     from pycatia.knowledge_interfaces.parameter import Parameter
 
+
+def _sweep_worker(file_name: str, table_name: str, configurations: list, collect: list,
+                  session: Callable) -> list:
+    # runs in a worker process of DesignTable.sweep(), with its own CATIA session.
+    application = session()
+    document = application.documents.open(file_name)
+    try:
+        design_table = DesignTable(document.part.relations.item(table_name).com_object)
+        return design_table.sweep(configurations, collect)
+    finally:
+        document.close()
+
+
 class DesignTable(Relation):
     """
         .. note::
@@ -258,6 +274,128 @@ class DesignTable(Relation):
         """
         return self.design_table.RemoveAssociation(i_sheet_column)
 
+    def sweep(self, configurations: Optional[list] = None, collect: Optional[list] = None, workers: int = 1,
+              session: Optional[Callable] = None, chunk_size: int = 50) -> list:
+        """
+        Applies each configuration of the design table, updates the part and
+        collects the values of parameters or measurements. The configurations
+        are evaluated in calls to CATIA of chunk_size configurations.
+
+        collect contains parameter names (as used in relations), Parameter
+        objects and (object name, measurable property) tuples, the object being
+        found with Part.FindObjectByName() and measured with the SPAWorkbench::
+
+            >>> results = design_table.sweep(collect=['Part1\\Length', ('PartBody', 'Volume')])
+            >>> # [{'configuration': 1, 'Part1\\Length': 20.0, 'PartBody.Volume': 1.5e-05, 'error': None}, ...]
+
+        With workers > 1 the configurations are split between worker processes.
+        Each process opens the saved document in the CATIA session returned
+        by session(), a picklable function (defined at module level) which must
+        connect each worker to a different CATIA session.
+
+        The design table must belong to a part. The configuration active before
+        the sweep is restored afterwards.
+
+        :param list configurations: (optional) the configuration numbers, all by default.
+        :param list collect: the parameters and measurables to collect.
+        :param int workers: the number of worker processes.
+        :param Callable session: (optional) returns the CATIA Application of a worker.
+        :param int chunk_size: the number of configurations evaluated per call to CATIA.
+        :return: one dictionary per configuration, keyed by 'configuration', the
+            collected values and 'error'.
+        :rtype: list(dict)
+        """
+
+        if configurations is None:
+            configurations = list(range(1, self.configurations_nb + 1))
+        configurations = list(configurations)
+        collect = [item.name if isinstance(item, AnyObject) else item for item in collect or []]
+
+        part = self.parent.parent
+
+        if workers > 1:
+            if session is None:
+                raise CATIAApplicationException('A session function is required to sweep with several workers.')
+
+            file_name = part.parent.com_object.FullName
+            size = -(-len(configurations) // workers)
+            chunks = [configurations[i:i + size] for i in range(0, len(configurations), size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_sweep_worker, file_name, self.name, chunk, collect, session)
+                    for chunk in chunks
+                ]
+                return [row for future in futures for row in future.result()]
+
+        names = [item if isinstance(item, str) else item[0] for item in collect]
+        properties = ['' if isinstance(item, str) else item[1] for item in collect]
+        labels = [item if isinstance(item, str) else f'{item[0]}.{item[1]}' for item in collect]
+
+        vba_function_name = 'sweep'
+        vba_code = f"""
+        Public Function {vba_function_name}(design_table, part, configurations, names, properties)
+            Dim values(), errors(), measurable
+            count = UBound(configurations)
+            columns = UBound(names) + 1
+            ReDim values((count + 1) * columns)
+            ReDim errors(count)
+            Set spa = Nothing
+            For j = 0 To columns - 1
+                If properties(j) <> "" Then Set spa = part.Parent.GetWorkbench("SPAWorkbench")
+            Next
+            Set parameters = part.Parameters
+            On Error Resume Next
+            For i = 0 To count
+                errors(i) = ""
+                design_table.Configuration = configurations(i)
+                part.Update
+                If Err.Number <> 0 Then
+                    errors(i) = Err.Description
+                    Err.Clear
+                End If
+                For j = 0 To columns - 1
+                    If properties(j) = "" Then
+                        values(i * columns + j) = parameters.Item(names(j)).Value
+                    Else
+                        Set measurable = spa.GetMeasurable(part.CreateReferenceFromObject(part.FindObjectByName(names(j))))
+                        values(i * columns + j) = Eval("measurable." & properties(j))
+                    End If
+                    If Err.Number <> 0 Then
+                        values(i * columns + j) = Null
+                        errors(i) = errors(i) & names(j) & ": " & Err.Description & " "
+                        Err.Clear
+                    End If
+                Next
+            Next
+            {vba_function_name} = Array(values, errors)
+        End Function
+        """
+
+        system_service = self.application.system_service
+        active_configuration = self.configuration
+        results = []
+        try:
+            for start in range(0, len(configurations), chunk_size):
+                chunk = configurations[start:start + chunk_size]
+                self.logger.info('Evaluating the configurations %s to %s of %s.',
+                                 start + 1, start + len(chunk), len(configurations))
+                values, errors = system_service.evaluate(
+                    vba_code, 0, vba_function_name, [self.com_object, part.com_object, chunk, names, properties])
+
+                columns = len(collect)
+                for i, (configuration, error) in enumerate(zip(chunk, errors)):
+                    row = {'configuration': configuration}
+                    row.update(zip(labels, values[i * columns:(i + 1) * columns]))
+                    row['error'] = error.strip() or None
+                    results.append(row)
+        finally:
+            # the part is left in the configuration it was in.
+            if self.configuration != active_configuration:
+                self.configuration = active_configuration
+                part.com_object.Update()
+
+        return results
+
     def synchronize(self) -> None:
         """
         .. note::
@@ -274,5 +412,41 @@ class DesignTable(Relation):
         """
         return self.design_table.Synchronize()
 
+    def to_array(self) -> tuple:
+        """
+        Returns the content of the design table sheet, read in a single call to
+        CATIA. The first row contains the column names and the following rows
+        the configurations::
+
+            (
+                ('PartNumber', 'Length (mm)', 'Width (mm)'),
+                ('Part_1', '20', '10'),
+                ('Part_2', '25', '10'),
+            )
+
+        :rtype: tuple(tuple(str))
+        """
+
+        vba_function_name = 'to_array'
+        vba_code = f"""
+        Public Function {vba_function_name}(design_table)
+            Dim cells()
+            rows = design_table.ConfigurationsNb + 1
+            columns = design_table.ColumnsNb
+            ReDim cells(rows * columns)
+            For i = 1 To rows
+                For j = 1 To columns
+                    cells((i - 1) * columns + j - 1) = design_table.CellAsString(i, j)
+                Next
+            Next
+            {vba_function_name} = Array(cells, rows, columns)
+        End Function
+        """
+
+        system_service = self.application.system_service
+        cells, rows, columns = system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+
+        return tuple(tuple(cells[i * columns:(i + 1) * columns]) for i in range(rows))
+
     def __repr__(self):
         return f'DesignTable(name="{self.name}")'
@@ -15,6 +15,10 @@ from typing import Optional
 from pywintypes import com_error
 
 from pycatia.exception_handling import CATIAApplicationException
+from pycatia.exception_handling.com_errors import CATIABusyException
+from pycatia.exception_handling.com_errors import CATIAComException
+from pycatia.exception_handling.com_errors import CATIADisconnectedException
+from pycatia.exception_handling.com_errors import translate_com_errors
 from pycatia.knowledge_interfaces.angle import Angle
 from pycatia.knowledge_interfaces.bool_param import BoolParam
 from pycatia.knowledge_interfaces.dimension import Dimension
@@ -429,9 +433,11 @@ class Parameters(Collection):
         :rtype: bool
         """
         try:
-            if self.parameters.Item(index):
+            if self._item(index):
                 return True
-        except com_error:
+        except (CATIABusyException, CATIADisconnectedException):
+            raise
+        except CATIAComException:
             return False
 
     def is_list_parameter(self, index: cat_variant):
@@ -481,10 +487,18 @@ class Parameters(Collection):
         :rtype: any_parameter
         """
 
-        if not self.is_parameter(index):
-            raise CATIAApplicationException(f'Could not find parameter name "{index}".')
+        try:
+            com_object = self._item(index)
+        except (CATIABusyException, CATIADisconnectedException):
+            raise
+        except CATIAComException as e:
+            raise CATIAApplicationException(f'Could not find parameter name "{index}".') from e
+
+        return parse_to_parameter_subtype(com_object)
 
-        return parse_to_parameter_subtype(self.parameters.Item(index))
+    @translate_com_errors('Could not find parameter "{index}".')
+    def _item(self, index: cat_variant):
+        return self.parameters.Item(index)
 
     def remove(self, i_index: cat_variant) -> None:
         """
@@ -20,6 +20,7 @@ from pycatia.knowledge_interfaces.optimizations import Optimizations
 from pycatia.knowledge_interfaces.relation import Relation
 from pycatia.knowledge_interfaces.rule import Rule
 from pycatia.knowledge_interfaces.set_of_equation import SetOfEquation
+from pycatia.scripts.relation_graph import RelationGraph
 from pycatia.system_interfaces.any_object import AnyObject
 from pycatia.system_interfaces.collection import Collection
 from pycatia.types.general import cat_variant
@@ -359,6 +360,109 @@ class Relations(Collection):
         """
         return Law(self.relations.CreateLaw(i_name, i_comment, i_law_body))
 
+    def create_many(self, specs: list, update: bool = True) -> list:
+        """
+        Creates many relations in a single call to CATIA. Each relation is
+        defined by a dictionary::
+
+            {
+                'type': 'formula',  # 'check', 'formula', 'law', 'program' or 'set_of_equations'
+                'name': 'compute_mass',
+                'comment': 'Computes the mass',  # optional
+                'body': '(height*width*depth)*density',
+                'output': mass,  # the output Parameter, formulas only
+            }
+
+        The update of the part (or product) is done once all the relations
+        are created, if update is True, instead of after each relation.
+
+        The relations which could not be created are logged and returned as None.
+
+        :param list specs: list of dictionaries.
+        :param bool update: update the parent of the relations once created.
+        :rtype: list(Relation)
+        """
+
+        relation_types = {
+            'check': Check,
+            'formula': Formula,
+            'law': Law,
+            'program': Rule,
+            'set_of_equations': SetOfEquation,
+        }
+
+        for spec in specs:
+            if spec['type'] not in relation_types:
+                raise CATIAApplicationException(
+                    f'Unknown relation type "{spec["type"]}", use one of {sorted(relation_types)}.')
+            if spec['type'] == 'formula' and spec.get('output') is None:
+                raise CATIAApplicationException(f'The formula "{spec["name"]}" has no output parameter.')
+
+        if not specs:
+            return []
+
+        vba_function_name = 'create_many'
+        vba_code = f"""
+        Public Function {vba_function_name}(relations, types, names, comments, bodies, outputs, update)
+            count = UBound(types)
+            Dim created(), errors()
+            ReDim created(count)
+            ReDim errors(count)
+            On Error Resume Next
+            For i = 0 To count
+                Select Case types(i)
+                    Case "check"
+                        Set created(i) = relations.CreateCheck(names(i), comments(i), bodies(i))
+                    Case "formula"
+                        Set created(i) = relations.CreateFormula(names(i), comments(i), outputs(i), bodies(i))
+                    Case "law"
+                        Set created(i) = relations.CreateLaw(names(i), comments(i), bodies(i))
+                    Case "program"
+                        Set created(i) = relations.CreateProgram(names(i), comments(i), bodies(i))
+                    Case "set_of_equations"
+                        Set created(i) = relations.CreateSetOfEquations(names(i), comments(i), bodies(i))
+                End Select
+                errors(i) = ""
+                If Err.Number <> 0 Then
+                    Set created(i) = Nothing
+                    errors(i) = Err.Description
+                    Err.Clear
+                End If
+            Next
+            On Error GoTo 0
+            If update Then
+                relations.Parent.Update
+            End If
+            {vba_function_name} = Array(created, errors)
+        End Function
+        """
+
+        system_service = self.application.system_service
+        created, errors = system_service.evaluate(
+            vba_code,
+            0,
+            vba_function_name,
+            [
+                self.com_object,
+                [spec['type'] for spec in specs],
+                [spec['name'] for spec in specs],
+                [spec.get('comment', '') for spec in specs],
+                [spec['body'] for spec in specs],
+                [spec['output'].com_object if spec.get('output') is not None else None for spec in specs],
+                update,
+            ]
+        )
+
+        relations = []
+        for spec, relation_com, error in zip(specs, created, errors):
+            if error:
+                self.logger.warning('Could not create the %s "%s". %s', spec['type'], spec['name'], error)
+                relations.append(None)
+            else:
+                relations.append(relation_types[spec['type']](relation_com))
+
+        return relations
+
     def create_program(self, i_name: str, i_comment: str, i_program_body: str) -> Rule:
         """
         .. note::
@@ -486,6 +590,63 @@ class Relations(Collection):
         """
         return self.relations.CreateSetOfRelations(i_parent.com_object)
 
+    def dependency_graph(self) -> RelationGraph:
+        """
+        Returns the graph of the relations and of the parameters they read and
+        write, read in a single call to CATIA. See
+        :class:`pycatia.scripts.relation_graph.RelationGraph`.
+
+        :rtype: RelationGraph
+        """
+
+        vba_function_name = 'dependency_graph'
+        vba_code = f"""
+        Public Function {vba_function_name}(relations)
+            count = relations.Count
+            Dim names(), activated(), in_counts(), out_counts(), parameters()
+            ReDim names(count)
+            ReDim activated(count)
+            ReDim in_counts(count)
+            ReDim out_counts(count)
+            ReDim parameters(63)
+            n = 0
+            For i = 1 To count
+                Set relation = relations.Item(i)
+                names(i - 1) = relation.Name
+                activated(i - 1) = relation.Activated
+                in_counts(i - 1) = relation.NbInParameters
+                out_counts(i - 1) = relation.NbOutParameters
+                For j = 1 To in_counts(i - 1) + out_counts(i - 1)
+                    If n > UBound(parameters) Then
+                        ReDim Preserve parameters(2 * UBound(parameters) + 1)
+                    End If
+                    If j <= in_counts(i - 1) Then
+                        parameters(n) = relation.GetInParameter(j).Name
+                    Else
+                        parameters(n) = relation.GetOutParameter(j - in_counts(i - 1)).Name
+                    End If
+                    n = n + 1
+                Next
+            Next
+            {vba_function_name} = Array(names, activated, in_counts, out_counts, parameters, count)
+        End Function
+        """
+
+        system_service = self.application.system_service
+        names, activated, in_counts, out_counts, parameters, count = system_service.evaluate(
+            vba_code, 0, vba_function_name, [self.com_object])
+
+        graph = RelationGraph()
+        n = 0
+        for i in range(count):
+            inputs = parameters[n:n + in_counts[i]]
+            n += in_counts[i]
+            outputs = parameters[n:n + out_counts[i]]
+            n += out_counts[i]
+            graph.add_relation(names[i], inputs, outputs, bool(activated[i]))
+
+        return graph
+
     def generate_xml_report_for_checks(self, i_name: str) -> None:
         """
         .. note::
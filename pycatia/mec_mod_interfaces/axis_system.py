@@ -11,6 +11,7 @@
 
 from pycatia.in_interfaces.reference import Reference
 from pycatia.knowledge_interfaces.angle import Angle
+from pycatia.scripts.geometry import axis_system_matrix
 from pycatia.system_interfaces.any_object import AnyObject
 
 
@@ -539,6 +540,32 @@ class AxisSystem(AnyObject):
         system_service = self.application.system_service
         return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
 
+    def get_matrix(self) -> tuple:
+        """
+        Returns the origin and axes of the axis system as a 4x4 matrix (see
+        :func:`pycatia.scripts.geometry.axis_system_matrix`), read in a single
+        call to CATIA.
+
+        :rtype: tuple
+        """
+
+        vba_function_name = 'get_matrix'
+        vba_code = f"""
+        Public Function {vba_function_name}(axis_system)
+            Dim origin(2), x_axis(2), y_axis(2), z_axis(2)
+            axis_system.GetOrigin origin
+            axis_system.GetXAxis x_axis
+            axis_system.GetYAxis y_axis
+            axis_system.GetZAxis z_axis
+            {vba_function_name} = Array(origin, x_axis, y_axis, z_axis)
+        End Function
+        """
+
+        system_service = self.application.system_service
+        origin, x_axis, y_axis, z_axis = system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+
+        return axis_system_matrix(origin, x_axis, y_axis, z_axis)
+
     def get_origin(self) -> tuple:
         """
         .. note::
@@ -9,12 +9,17 @@
         
 """
 
+from collections import Counter
 from typing import TYPE_CHECKING
 
+from pycatia.exception_handling.exceptions import CATIAApplicationException
 from pycatia.mec_mod_interfaces.geometric_elements import GeometricElements
 from pycatia.mec_mod_interfaces.hybrid_shape import HybridShape
 from pycatia.mec_mod_interfaces.hybrid_shapes import HybridShapes
 from pycatia.mec_mod_interfaces.sketches import Sketches
+from pycatia.scripts.recorder import RecordedObject
+from pycatia.scripts.update_tracker import TrackedObject
+from pycatia.scripts.update_tracker import unwrap
 from pycatia.system_interfaces.any_object import AnyObject
 
 if TYPE_CHECKING:
@@ -220,11 +225,140 @@ class HybridBody(AnyObject):
 
     def append_hybrid_shapes(self, shapes: list) -> None:
         """
+        Appends the shapes to the hybrid body in a single call to CATIA. While
+        tracking (see :meth:`Part.update_tracker`) the shapes are marked as
+        modified, like with :meth:`append_hybrid_shape`.
+
         :param list(HybridShape) shapes:
         :return:
         """
+        shapes = list(shapes)
+        if not shapes:
+            return
+
+        # the calls made while recording (see HybridShapeFactory.recording()) are replayed together anyway.
+        if isinstance(self.hybrid_body, RecordedObject):
+            for shape in shapes:
+                self.append_hybrid_shape(shape)
+            return
+
+        vba_function_name = 'append_hybrid_shapes'
+        vba_code = f"""
+        Public Function {vba_function_name}(hybrid_body, shapes)
+            For i = 0 To UBound(shapes)
+                hybrid_body.AppendHybridShape shapes(i)
+            Next
+            {vba_function_name} = UBound(shapes) + 1
+        End Function
+        """
+
+        system_service = self.application.system_service
+        system_service.evaluate(vba_code, 0, vba_function_name,
+                                unwrap([self.com_object, [shape.com_object for shape in shapes]]))
+
         for shape in shapes:
-            self.append_hybrid_shape(shape)
+            com_object = shape.com_object
+            if isinstance(com_object, TrackedObject) and com_object._tracker.tracking:
+                com_object._tracker.add_dirty(com_object._owner or com_object)
+
+    def rename_many(self, mapping: dict) -> dict:
+        """
+        Renames the hybrid shapes of the hybrid body. mapping is keyed by the
+        hybrid shapes, or their names, and gives their new names::
+
+            hybrid_body.rename_many({'Point.1': 'Origin', line: 'Axis'})
+
+        The current names are read in a single call to CATIA and the new names
+        are checked before anything is renamed: a CATIAApplicationException is
+        raised if a new name is given twice or is already used by another
+        hybrid shape of the hybrid body. Names can be swapped. The hybrid
+        shapes are then renamed in a single call.
+
+        :param dict mapping:
+        :rtype: dict
+        :return: {old name: new name} of the renamed hybrid shapes.
+        """
+
+        if not mapping:
+            return {}
+
+        keys = [key if isinstance(key, str) else key.com_object for key in mapping]
+        new_names = list(mapping.values())
+
+        vba_function_name = 'read_names'
+        vba_code = f"""
+        Public Function {vba_function_name}(hybrid_body, keys)
+            Dim existing(), objects(), names()
+            Set hybrid_shapes = hybrid_body.HybridShapes
+            ReDim existing(hybrid_shapes.Count)
+            For i = 1 To hybrid_shapes.Count
+                existing(i - 1) = hybrid_shapes.Item(i).Name
+            Next
+            ReDim objects(UBound(keys))
+            ReDim names(UBound(keys))
+            On Error Resume Next
+            For i = 0 To UBound(keys)
+                If IsObject(keys(i)) Then
+                    Set objects(i) = keys(i)
+                Else
+                    Set objects(i) = hybrid_shapes.Item(keys(i))
+                End If
+                If Err.Number = 0 Then
+                    names(i) = objects(i).Name
+                Else
+                    Set objects(i) = Nothing
+                    names(i) = ""
+                    Err.Clear
+                End If
+            Next
+            {vba_function_name} = Array(existing, objects, names, hybrid_shapes.Count)
+        End Function
+        """
+
+        system_service = self.application.system_service
+        existing, objects, old_names, count = system_service.evaluate(
+            vba_code, 0, vba_function_name, unwrap([self.com_object, keys]))
+        existing = set(existing[:count])
+
+        missing = [key for key, name in zip(mapping, old_names) if not name]
+        if missing:
+            raise CATIAApplicationException(f'Could not find {missing} in "{self.name}".')
+
+        changes = [(obj, old, new) for obj, old, new in zip(objects, old_names, new_names) if old != new]
+        renamed = {old: new for _, old, new in changes}
+        if len(renamed) != len(changes):
+            raise CATIAApplicationException('A hybrid shape is given more than once.')
+
+        counts = Counter(renamed.values())
+        duplicates = sorted(name for name, n in counts.items() if n > 1)
+        taken = sorted(name for name in counts if name in existing and name not in renamed)
+        if duplicates or taken:
+            raise CATIAApplicationException(
+                f'Could not rename, new names given more than once {duplicates}, names already used {taken}.')
+
+        objects = [obj for obj, _, _ in changes]
+        names = [new for _, _, new in changes]
+        # names swapped between hybrid shapes go through temporary names first.
+        swapped = any(name in renamed for name in names)
+        temporary_names = [f'{name}.rename_many.{i}' for i, name in enumerate(names)] if swapped else []
+
+        vba_function_name = 'rename_many'
+        vba_code = f"""
+        Public Function {vba_function_name}(objects, names, temporary_names)
+            For i = 0 To UBound(temporary_names)
+                objects(i).Name = temporary_names(i)
+            Next
+            For i = 0 To UBound(objects)
+                objects(i).Name = names(i)
+            Next
+            {vba_function_name} = UBound(objects) + 1
+        End Function
+        """
+
+        if objects:
+            system_service.evaluate(vba_code, 0, vba_function_name, [objects, names, temporary_names])
+
+        return renamed
 
     def __repr__(self):
         return f'HybridBody(name="{self.name}")'
@@ -10,6 +10,7 @@
 """
 
 from pathlib import Path
+from typing import Iterable, Optional
 
 from pycatia.exception_handling.exceptions import CATIAApplicationException
 from pycatia.hybrid_shape_interfaces.hybrid_shape_factory import HybridShapeFactory
@@ -26,6 +27,12 @@ from pycatia.mec_mod_interfaces.hybrid_bodies import HybridBodies
 from pycatia.mec_mod_interfaces.ordered_geometrical_sets import OrderedGeometricalSets
 from pycatia.mec_mod_interfaces.origin_elements import OriginElements
 from pycatia.part_interfaces.shape_factory import ShapeFactory
+from pycatia.scripts.feature_cache import FeatureCache
+from pycatia.scripts.mesh import Mesh
+from pycatia.scripts.recorder import RecordedObject
+from pycatia.scripts.tessellation import MeshCache, tessellate_part
+from pycatia.scripts.update_tracker import UpdateTracker
+from pycatia.scripts.update_tracker import unwrap
 from pycatia.system_interfaces.any_object import AnyObject
 from pycatia.product_structure_interfaces.analyze import Analyze
 from pycatia.system_interfaces.collection import Collection
@@ -62,6 +69,10 @@ class Part(AnyObject):
         super().__init__(com_part_object)
         self.part = com_part_object
         self.com_object = com_part_object
+        # the references created by create_reference_from_object(), keyed by feature.
+        self._references = FeatureCache()
+        # the feature types found by HybridShapeFactory.classify_many(), keyed by feature.
+        self._feature_types = FeatureCache()
 
     @property
     def analyze(self) -> Analyze:
@@ -315,7 +326,7 @@ class Part(AnyObject):
         :rtype: HybridShapeFactory
         """
 
-        return HybridShapeFactory(self.part.HybridShapeFactory)
+        return HybridShapeFactory(self.part.HybridShapeFactory, part=self)
 
     @property
     def in_work_object(self) -> AnyObject:
@@ -685,7 +696,7 @@ class Part(AnyObject):
         """
         return Reference(self.part.CreateReferenceFromName(i_label))
 
-    def create_reference_from_object(self, i_object: AnyObject):
+    def create_reference_from_object(self, i_object: AnyObject, cache: bool = True) -> Reference:
         """
         .. note::
             :class: toggle
@@ -707,10 +718,85 @@ class Part(AnyObject):
                 |         The reference to the object. This way, a direction can be either an
                 |         edge of a pad or a 3D line.
 
+        The references are cached for each feature until the part is updated
+        with :meth:`update` or :meth:`update_object`. The pycatia objects of the
+        same feature share its reference, ``part.origin_elements.plane_xy``
+        returning a new pycatia object on each access is referenced once:
+
+        >>> references = [part.create_reference_from_object(part.origin_elements.plane_xy) for _ in range(10)]
+
         :param AnyObject i_object:
+        :param bool cache: reuse the reference created for i_object.
         :rtype: Reference
         """
-        return Reference(self.part.CreateReferenceFromObject(i_object.com_object))
+
+        if not cache or isinstance(self.part, RecordedObject) or isinstance(i_object.com_object, RecordedObject):
+            return Reference(self.part.CreateReferenceFromObject(i_object.com_object))
+
+        reference = self._references.get(i_object)
+        if reference is None:
+            # creating a reference doesn't modify the feature, the cached references don't hold tracking proxies.
+            com_reference = unwrap(self.part).CreateReferenceFromObject(unwrap(i_object.com_object))
+            reference = self._references[i_object] = Reference(com_reference)
+        return reference
+
+    def create_references(self, objects: Iterable[AnyObject]) -> list:
+        """
+        Returns the references of objects, see :meth:`create_reference_from_object`.
+        The references not cached are created in a single call to CATIA.
+
+        >>> plane_xy = part.origin_elements.plane_xy
+        >>> references = part.create_references([plane_xy, point_1, point_2])
+
+        :param list objects:
+        :rtype: list(Reference)
+        """
+
+        objects = list(objects)
+        if isinstance(self.part, RecordedObject):
+            return [self.create_reference_from_object(obj) for obj in objects]
+
+        # the same feature may be given more than once.
+        missing = list({self._references.key(obj): obj for obj in objects if obj not in self._references}.values())
+
+        if missing:
+            vba_function_name = 'create_references'
+            vba_code = f"""
+            Public Function {vba_function_name}(part, objects)
+                Dim references()
+                ReDim references(UBound(objects))
+                On Error Resume Next
+                For i = 0 To UBound(objects)
+                    Set references(i) = part.CreateReferenceFromObject(objects(i))
+                    If Err.Number <> 0 Then
+                        Set references(i) = Nothing
+                        Err.Clear
+                    End If
+                Next
+                {vba_function_name} = references
+            End Function
+            """
+
+            system_service = self.application.system_service
+            references = system_service.evaluate(
+                vba_code, 0, vba_function_name, unwrap([self.com_object, [obj.com_object for obj in missing]]))
+
+            failed = []
+            for obj, reference in zip(missing, references):
+                if reference is None:
+                    failed.append(obj)
+                else:
+                    self._references[obj] = Reference(reference)
+            if failed:
+                raise CATIAApplicationException(f'Could not create the references of {failed}.')
+
+        return [self._references[obj] for obj in objects]
+
+    def clear_reference_cache(self) -> None:
+        """
+        Forgets the references cached by :meth:`create_reference_from_object`.
+        """
+        self._references.clear()
 
     def deactivate(self, i_object: AnyObject) -> None:
         """
@@ -883,6 +969,23 @@ class Part(AnyObject):
         """
         return Path(self.full_name)
 
+    def tessellate(self, bodies: Optional[list] = None, cache: Optional[MeshCache] = None) -> Mesh:
+        """
+        Returns the triangle mesh of the part, exported to STL by CATIA. The
+        mesh is cached by document and modification time, see
+        :mod:`pycatia.scripts.tessellation`.
+
+        >>> mesh = part.tessellate()
+        >>> mesh.vertex_count, mesh.triangle_count
+
+        :param list bodies: (optional) the bodies and geometrical sets to
+            tessellate, the other ones are hidden during the export. All the
+            shown geometry by default.
+        :param MeshCache cache: (optional)
+        :rtype: Mesh
+        """
+        return tessellate_part(self, bodies, cache)
+
     def update(self) -> None:
         """
         .. note::
@@ -903,6 +1006,7 @@ class Part(AnyObject):
 
         :rtype: None
         """
+        self.clear_reference_cache()
         return self.part.Update()
 
     def update_object(self, i_object: AnyObject) -> None:
@@ -932,7 +1036,27 @@ class Part(AnyObject):
         :param AnyObject i_object:
         :rtype: None
         """
+        self.clear_reference_cache()
         return self.part.UpdateObject(i_object.com_object)
 
+    def update_tracker(self, *objects, max_objects: int = 20) -> UpdateTracker:
+        """
+        Returns a context manager tracking the features created or modified
+        through this part and objects. UpdateTracker.update() updates only
+        the features which need it, checked in a single call to CATIA. See
+        :mod:`pycatia.scripts.update_tracker`.
+
+        >>> with part.update_tracker(hybrid_body) as tracker:
+        >>>     point = part.hybrid_shape_factory.add_new_point_coord(0, 0, 0)
+        >>>     hybrid_body.append_hybrid_shape(point)
+        >>>     tracker.update()
+
+        :param objects: the other pycatia objects to track (HybridBody, ...).
+        :param int max_objects: the number of features above which the part is
+            updated with Update(), until the cost of the updates is measured.
+        :rtype: UpdateTracker
+        """
+        return UpdateTracker(self, *objects, max_objects=max_objects)
+
     def __repr__(self):
         return f'Part(name="{self.name}")'
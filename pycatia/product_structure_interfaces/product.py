@@ -10,7 +10,7 @@
 """
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 import warnings
 
 from pywintypes import com_error
@@ -24,6 +24,8 @@ from pycatia.knowledge_interfaces.relations import Relations
 from pycatia.mec_mod_interfaces.constraints import Constraints
 from pycatia.product_structure_interfaces.analyze import Analyze
 from pycatia.product_structure_interfaces.publications import Publications
+from pycatia.scripts.mesh import Mesh
+from pycatia.scripts.tessellation import MeshCache, tessellate_product
 from pycatia.system_interfaces.any_object import AnyObject
 
 if TYPE_CHECKING:
@@ -626,7 +628,7 @@ class Product(AnyObject):
                 try:
                     current_product.activate_default_shape()
                 except CATIAApplicationException:
-                    current_product.logger.info(f'Could not activate default shape for {current_product.name}.')
+                    current_product.logger.info('Could not activate default shape for %s.', current_product.name)
 
                 product_looper(current_product.products)
 
@@ -1440,6 +1442,19 @@ class Product(AnyObject):
         # # system_service = self.application.system_service
         # # return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
 
+    def tessellate(self, cache: Optional[MeshCache] = None) -> Mesh:
+        """
+        Returns the triangle mesh of the product, in its axis system. Each part
+        document is exported to STL once, in a single call to CATIA, and the
+        part meshes are cached by document and modification time, see
+        :mod:`pycatia.scripts.tessellation`. The products must be in design
+        mode.
+
+        :param MeshCache cache: (optional)
+        :rtype: Mesh
+        """
+        return tessellate_product(self, cache)
+
     def update(self) -> None:
         """
         .. note::
@@ -8,13 +8,26 @@
         and thus help debugging in pycatia.
 
 """
-from typing import Iterator
+import time
+from typing import Iterable, Iterator
 from typing import TYPE_CHECKING
 
+from pycatia.exception_handling.exceptions import CATIAApplicationException
 from pycatia.product_structure_interfaces.product import Product
+from pycatia.scripts.transforms import compose_absolute, from_components, identity, to_components
 from pycatia.system_interfaces.collection import Collection
 from pycatia.types.general import cat_variant
 
+# the product properties that can be set by Products.build_from_manifest().
+_manifest_properties = {
+    'part_number': 'PartNumber',
+    'revision': 'Revision',
+    'nomenclature': 'Nomenclature',
+    'definition': 'Definition',
+    'description_reference': 'DescriptionRef',
+    'description_instance': 'DescriptionInst',
+}
+
 if TYPE_CHECKING:
     from pycatia.in_interfaces.document import Document
 
@@ -223,6 +236,268 @@ class Products(Collection):
         """
         return Product(self.products.AddNewProduct(i_part_number))
 
+    def apply_moves(self, matrices: list) -> None:
+        """
+        Applies a move transformation to each of the products in the
+        collection, in a single call to CATIA. See :meth:`Move.apply`.
+
+        :param list matrices: one 4x4 matrix (see :mod:`pycatia.scripts.transforms`) per product.
+        :rtype: None
+        """
+
+        vba_function_name = 'apply_moves'
+        vba_code = f"""
+        Public Function {vba_function_name}(products, values)
+            Dim components(11)
+            For i = 1 To products.Count
+                For j = 0 To 11
+                    components(j) = values(12 * (i - 1) + j)
+                Next
+                products.Item(i).Move.Apply components
+            Next
+            {vba_function_name} = products.Count
+        End Function
+        """
+
+        self._evaluate_with_matrices(vba_code, vba_function_name, matrices)
+
+    def build_from_manifest(self, rows: Iterable, chunk_size: int = 500) -> dict:
+        """
+        Builds an assembly from a manifest. Each row is a tuple
+        (file, instance name, 4x4 matrix, properties)::
+
+            rows = [
+                ('C:/parts/bolt.CATPart', 'Bolt.1', matrix_1, {'nomenclature': 'M8x40'}),
+                ('C:/parts/bolt.CATPart', 'Bolt.2', matrix_2, {}),
+            ]
+
+        The components are inserted, placed, named and given their properties
+        in a single call to CATIA per chunk of chunk_size rows. Each file is
+        loaded once, the following instances of a file reuse its reference
+        product.
+
+        The instance name may be empty to keep the name given by CATIA. The
+        matrix (see :mod:`pycatia.scripts.transforms`) may be None to keep the
+        identity. The properties are optional, the keys are part_number,
+        revision, nomenclature, definition, description_reference and
+        description_instance. The properties of the reference are shared by
+        all the instances of a file.
+
+        The rows which fail are logged and skipped. Returns::
+
+            {
+                'products': [Product or None, ...],  # one per row
+                'errors': [(row index, file, message), ...],
+                'chunks': [{'rows': 500, 'new_files': 12, 'seconds': 3.2}, ...],
+            }
+
+        :param list rows:
+        :param int chunk_size:
+        :rtype: dict
+        """
+
+        vba_function_name = 'build_from_manifest'
+        vba_code = f"""
+        Public Function {vba_function_name}(products, files, names, values, keys, texts, starts, loaded, loaded_refs)
+            Dim created(), errors(), new_files(), new_references(), components(11)
+            Set references = CreateObject("Scripting.Dictionary")
+            references.CompareMode = 1
+            For i = 0 To UBound(loaded)
+                references.Add loaded(i), loaded_refs(i)
+            Next
+            ReDim created(UBound(files))
+            ReDim errors(UBound(files))
+            ReDim new_files(UBound(files))
+            ReDim new_references(UBound(files))
+            n = 0
+            On Error Resume Next
+            For i = 0 To UBound(files)
+                Set product = Nothing
+                If references.Exists(files(i)) Then
+                    Set product = products.AddComponent(references.Item(files(i)))
+                Else
+                    products.AddComponentsFromFiles Array(files(i)), "All"
+                    If Err.Number = 0 Then
+                        Set product = products.Item(products.Count)
+                        references.Add files(i), product.ReferenceProduct
+                        new_files(n) = files(i)
+                        Set new_references(n) = product.ReferenceProduct
+                        n = n + 1
+                    End If
+                End If
+                If Err.Number = 0 And names(i) <> "" Then
+                    product.Name = names(i)
+                End If
+                If Err.Number = 0 Then
+                    For j = 0 To 11
+                        components(j) = values(12 * i + j)
+                    Next
+                    product.Position.SetComponents components
+                End If
+                For k = starts(i) To starts(i + 1) - 1
+                    If Err.Number <> 0 Then Exit For
+                    Select Case keys(k)
+                        Case "part_number": product.PartNumber = texts(k)
+                        Case "revision": product.Revision = texts(k)
+                        Case "nomenclature": product.Nomenclature = texts(k)
+                        Case "definition": product.Definition = texts(k)
+                        Case "description_reference": product.DescriptionRef = texts(k)
+                        Case "description_instance": product.DescriptionInst = texts(k)
+                    End Select
+                Next
+                If Err.Number <> 0 Then
+                    errors(i) = Err.Description
+                    Err.Clear
+                    Set created(i) = Nothing
+                Else
+                    errors(i) = ""
+                    Set created(i) = product
+                End If
+            Next
+            {vba_function_name} = Array(created, errors, new_files, new_references, n)
+        End Function
+        """
+
+        rows = list(rows)
+        result = {'products': [], 'errors': [], 'chunks': []}
+        references = {}
+
+        system_service = self.application.system_service
+        for first in range(0, len(rows), chunk_size):
+            chunk = rows[first:first + chunk_size]
+            files, names, values, keys, texts, starts = [], [], [], [], [], [0]
+            for row in chunk:
+                file, name, matrix = row[:3]
+                properties = row[3] if len(row) > 3 and row[3] else {}
+                unknown = set(properties) - set(_manifest_properties)
+                if unknown:
+                    raise CATIAApplicationException(
+                        f'Unknown properties {sorted(unknown)}, expected {list(_manifest_properties)}.')
+
+                files.append(str(file))
+                names.append(name or '')
+                values.extend(to_components(identity if matrix is None else matrix))
+                keys.extend(properties)
+                texts.extend(str(value) for value in properties.values())
+                starts.append(len(keys))
+
+            start = time.perf_counter()
+            created, errors, new_files, new_references, count = system_service.evaluate(
+                vba_code, 0, vba_function_name,
+                [self.com_object, files, names, values, keys, texts, starts,
+                 list(references), list(references.values())])
+            seconds = time.perf_counter() - start
+
+            references.update(zip(new_files[:count], new_references[:count]))
+
+            for i, (com_object, error) in enumerate(zip(created, errors)):
+                if error:
+                    result['errors'].append((first + i, files[i], error))
+                    self.logger.warning('Could not add row %s "%s": %s', first + i, files[i], error)
+                result['products'].append(None if error else Product(com_object))
+
+            result['chunks'].append({'rows': len(chunk), 'new_files': count, 'seconds': seconds})
+            self.logger.info('Added rows %s to %s (%s new files) in %.2fs.',
+                             first, first + len(chunk) - 1, count, seconds)
+
+        return result
+
+    def get_absolute_positions(self) -> dict:
+        """
+        Returns the absolute position, as 4x4 matrices, of all the products
+        below this collection. The whole tree is read in a single call to CATIA.
+
+        The dictionary is keyed by the instance path, the instance names from this
+        collection down separated by '/', in depth first order::
+
+            {
+                'Sub.1': ((1.0, 0.0, 0.0, 100.0), ...),
+                'Sub.1/Part.1': ((1.0, 0.0, 0.0, 150.0), ...),
+            }
+
+        The positions are relative to the parent product of this collection.
+
+        :rtype: dict
+        """
+
+        vba_function_name = 'get_absolute_positions'
+        vba_code = f"""
+        Dim names(), values(), n
+
+        Sub append(name, components)
+            If n > UBound(names) Then
+                ReDim Preserve names(2 * UBound(names) + 1)
+                ReDim Preserve values(12 * (UBound(names) + 1) - 1)
+            End If
+            names(n) = name
+            For j = 0 To 11
+                values(12 * n + j) = components(j)
+            Next
+            n = n + 1
+        End Sub
+
+        Sub walk(products, path)
+            Dim components(11)
+            Dim i, product
+            For i = 1 To products.Count
+                Set product = products.Item(i)
+                product.Position.GetComponents components
+                append path & product.Name, components
+                walk product.Products, path & product.Name & "/"
+            Next
+        End Sub
+
+        Public Function {vba_function_name}(products)
+            n = 0
+            ReDim names(63)
+            ReDim values(767)
+            walk products, ""
+            {vba_function_name} = Array(names, values, n)
+        End Function
+        """
+
+        system_service = self.application.system_service
+        names, values, count = system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+
+        local_positions = {
+            names[i]: from_components(values[12 * i:12 * i + 12]) for i in range(count)
+        }
+
+        return compose_absolute(local_positions)
+
+    def get_positions(self) -> list:
+        """
+        Returns the positions of the products in the collection as 4x4 matrices
+        (see :mod:`pycatia.scripts.transforms`), in a single call to CATIA.
+
+        :rtype: list
+        """
+
+        vba_function_name = 'get_positions'
+        vba_code = f"""
+        Public Function {vba_function_name}(products)
+            Dim components(11)
+            Dim values()
+            If products.Count = 0 Then
+                {vba_function_name} = Array()
+                Exit Function
+            End If
+            ReDim values(12 * products.Count - 1)
+            For i = 1 To products.Count
+                products.Item(i).Position.GetComponents components
+                For j = 0 To 11
+                    values(12 * (i - 1) + j) = components(j)
+                Next
+            Next
+            {vba_function_name} = values
+        End Function
+        """
+
+        system_service = self.application.system_service
+        values = system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object])
+
+        return [from_components(values[i:i + 12]) for i in range(0, len(values), 12)]
+
     def item(self, i_index: cat_variant) -> Product:
         """
         .. note::
@@ -388,6 +663,41 @@ class Products(Collection):
             )
         )
 
+    def set_positions(self, matrices: list) -> None:
+        """
+        Sets the positions of the products in the collection, in a single call
+        to CATIA.
+
+        :param list matrices: one 4x4 matrix (see :mod:`pycatia.scripts.transforms`) per product.
+        :rtype: None
+        """
+
+        vba_function_name = 'set_positions'
+        vba_code = f"""
+        Public Function {vba_function_name}(products, values)
+            Dim components(11)
+            For i = 1 To products.Count
+                For j = 0 To 11
+                    components(j) = values(12 * (i - 1) + j)
+                Next
+                products.Item(i).Position.SetComponents components
+            Next
+            {vba_function_name} = products.Count
+        End Function
+        """
+
+        self._evaluate_with_matrices(vba_code, vba_function_name, matrices)
+
+    def _evaluate_with_matrices(self, vba_code: str, vba_function_name: str, matrices: list):
+        if len(matrices) != self.count:
+            raise CATIAApplicationException(
+                f'{len(matrices)} matrices given for the {self.count} products of "{self.name}".')
+
+        values = [component for matrix in matrices for component in to_components(matrix)]
+
+        system_service = self.application.system_service
+        return system_service.evaluate(vba_code, 0, vba_function_name, [self.com_object, values])
+
     def __len__(self):
         return self.count
 
@@ -0,0 +1,333 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Builds the dependency graph of CATIA documents, i.e. which CATProducts use
+    which CATParts and CATProducts.
+
+    The graph can be built from an open product (walking the product tree in
+    CATIA) or offline from the document files (see
+    :mod:`pycatia.types.document_header`). It can be cached on disk and gives
+    the order in which documents can be processed, leaves first, and the
+    "waves" of documents that can be processed at the same time.
+
+    >>> from pathlib import Path
+    >>> from pycatia.scripts.dependency_graph import DependencyGraph
+    >>> files = list(Path('//vault/project').rglob('*.CAT*'))
+    >>> graph = DependencyGraph.from_files(files, cache_file='project_links.json')
+    >>> for wave in graph.waves():
+    >>>     # all the documents in a wave can be updated in parallel.
+    >>>     print(wave)
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Union
+
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.types.document_header import read_document_headers
+
+if TYPE_CHECKING:
+    from pycatia.product_structure_interfaces.product import Product
+
+_cache_version = 1
+
+# the CATIA session of a worker process of DependencyGraph.execute().
+_worker_application = None
+
+
+def _start_session(session: Callable) -> None:
+    global _worker_application
+    _worker_application = session()
+
+
+def _execute_worker(function: Callable, document: str):
+    return function(_worker_application, document)
+
+
+class DependencyGraph:
+    """
+
+    A directed acyclic graph of documents. An edge goes from a document to each
+    of the documents it links to.
+
+    Documents are identified by their full file name (str).
+
+    """
+
+    def __init__(self):
+        self.links = {}
+
+    def add_document(self, document: str, links: Union[list, tuple] = ()) -> None:
+        """
+        Adds document and the documents it links to.
+
+        :param str document:
+        :param list links:
+        """
+
+        self.links.setdefault(document, set())
+        for link in links:
+            if link != document:
+                self.links[document].add(link)
+                self.links.setdefault(link, set())
+
+    @property
+    def documents(self) -> list:
+        """
+        :rtype: list(str)
+        """
+        return list(self.links)
+
+    def dependencies(self, document: str) -> set:
+        """
+        Returns the documents document links to directly.
+
+        :param str document:
+        :rtype: set
+        """
+        return set(self.links[document])
+
+    def dependents(self, document: str) -> set:
+        """
+        Returns the documents that link directly to document.
+
+        :param str document:
+        :rtype: set
+        """
+        return {parent for parent, links in self.links.items() if document in links}
+
+    def all_dependencies(self, document: str) -> set:
+        """
+        Returns all the documents required by document.
+
+        :param str document:
+        :rtype: set
+        """
+
+        found = set()
+        stack = [document]
+        while stack:
+            for link in self.links[stack.pop()]:
+                if link not in found:
+                    found.add(link)
+                    stack.append(link)
+
+        return found
+
+    def waves(self) -> list:
+        """
+
+        Returns the documents grouped in waves. The documents of a wave only
+        depend on documents of the previous waves so all the documents of a wave
+        can be processed at the same time. The first wave contains the leaves
+        (documents without links).
+
+        :rtype: list(list(str))
+        """
+
+        remaining = {document: len(links) for document, links in self.links.items()}
+        dependents = {document: [] for document in self.links}
+        for document, links in self.links.items():
+            for link in links:
+                dependents[link].append(document)
+
+        waves = []
+        wave = sorted(document for document, count in remaining.items() if count == 0)
+        while wave:
+            waves.append(wave)
+            next_wave = []
+            for document in wave:
+                del remaining[document]
+                for parent in dependents[document]:
+                    remaining[parent] -= 1
+                    if remaining[parent] == 0:
+                        next_wave.append(parent)
+            wave = sorted(next_wave)
+
+        if remaining:
+            raise CATIAApplicationException(f'Circular links found between documents {sorted(remaining)}.')
+
+        return waves
+
+    def topological_order(self) -> list:
+        """
+        Returns the documents ordered so that every document comes after the
+        documents it links to.
+
+        :rtype: list(str)
+        """
+        return [document for wave in self.waves() for document in wave]
+
+    def execute(self, function: Callable, session: Callable, workers: Optional[int] = None) -> dict:
+        """
+
+        Calls function(application, document) for every document, wave by wave,
+        with the documents of a wave processed in parallel processes.
+
+        Each worker process calls session() once when it starts and passes the
+        returned Application to function. session must be a picklable function
+        (defined at module level) connecting each worker to a CATIA process of
+        its own: :func:`pycatia.catia` attaches all the processes to the same
+        registered CATIA session, where the calls would be serialised and the
+        workers would share the active document.
+
+        Returns a dictionary of the values returned by function keyed by document.
+
+        :param Callable function: a picklable function (defined at module level).
+        :param Callable session: returns the CATIA Application of a worker.
+        :param int workers: the number of processes. None uses the number of CPUs.
+        :rtype: dict
+        """
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_start_session, initargs=(session,)) as executor:
+            for wave in self.waves():
+                results.update(zip(wave, executor.map(_execute_worker, [function] * len(wave), wave)))
+
+        return results
+
+    def save(self, file_name: Union[str, Path], mtimes: Optional[dict] = None) -> None:
+        """
+        Saves the graph to the json file file_name.
+
+        :param Path file_name:
+        :param dict mtimes: (optional) the modification times of the documents.
+        """
+
+        mtimes = mtimes or {}
+        data = {
+            'version': _cache_version,
+            'documents': {
+                document: {
+                    'mtime': mtimes.get(document),
+                    'links': sorted(links),
+                } for document, links in self.links.items()
+            }
+        }
+        with open(file_name, 'w') as file:
+            json.dump(data, file, indent=1)
+
+    @classmethod
+    def load(cls, file_name: Union[str, Path]) -> 'DependencyGraph':
+        """
+        Loads a graph saved with :meth:`DependencyGraph.save`.
+
+        :param Path file_name:
+        :rtype: DependencyGraph
+        """
+
+        graph = cls()
+        for document, entry in _read_cache(file_name).items():
+            graph.add_document(document, entry['links'])
+
+        return graph
+
+    @classmethod
+    def from_files(cls, file_names: list, cache_file: Optional[Union[str, Path]] = None,
+                   workers: Optional[int] = None) -> 'DependencyGraph':
+        """
+
+        Builds the graph from the document files without CATIA. The links are
+        resolved by file name against file_names, links that can't be resolved
+        are kept as they are stored in the documents.
+
+        If cache_file is given the links of the documents that haven't been
+        modified since the cache was written are taken from it and the cache is
+        updated.
+
+        :param list file_names: list of Path or str.
+        :param Path cache_file: (optional) json file to cache the links in.
+        :param int workers: the number of processes used to read the files.
+        :rtype: DependencyGraph
+        """
+
+        file_names = [str(Path(file_name)) for file_name in file_names]
+        by_name = {Path(file_name).name.lower(): file_name for file_name in file_names}
+
+        cache = {}
+        if cache_file is not None and Path(cache_file).is_file():
+            cache = _read_cache(cache_file)
+
+        mtimes = {file_name: os.path.getmtime(file_name) for file_name in file_names}
+        links = {}
+        to_read = []
+        for file_name in file_names:
+            entry = cache.get(file_name)
+            if entry is not None and entry['mtime'] == mtimes[file_name]:
+                links[file_name] = entry['links']
+            else:
+                to_read.append(file_name)
+
+        for file_name, header in read_document_headers(to_read, workers=workers):
+            links[str(file_name)] = [] if header is None else header.links
+
+        graph = cls()
+        for file_name in file_names:
+            resolved = [by_name.get(_link_name(link), link) for link in links[file_name]]
+            graph.add_document(file_name, resolved)
+
+        if cache_file is not None:
+            graph.save(cache_file, mtimes)
+
+        return graph
+
+    @classmethod
+    def from_product(cls, product: 'Product') -> 'DependencyGraph':
+        """
+
+        Builds the graph by walking the product tree in CATIA. Each reference
+        document is walked once however many times it is instantiated.
+
+        :param Product product:
+        :rtype: DependencyGraph
+        """
+
+        graph = cls()
+        walked = set()
+
+        def walk(_product: 'Product', document: str):
+            for child in _product.get_children():
+                child_document = child.full_name
+                if child_document == document:
+                    # a component, its children belong to the same document.
+                    walk(child, document)
+                    continue
+
+                graph.add_document(document, [child_document])
+                if child_document not in walked:
+                    walked.add(child_document)
+                    walk(child, child_document)
+
+        root_document = product.full_name
+        graph.add_document(root_document)
+        walk(product, root_document)
+
+        return graph
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.topological_order())
+
+    def __len__(self):
+        return len(self.links)
+
+    def __repr__(self):
+        return f'DependencyGraph(documents={len(self.links)})'
+
+
+def _link_name(link: str) -> str:
+    # links are stored with the path of the OS they were saved on.
+    return link.replace('\\', '/').rsplit('/', 1)[-1].lower()
+
+
+def _read_cache(file_name: Union[str, Path]) -> dict:
+    with open(file_name) as file:
+        data = json.load(file)
+
+    if data.get('version') != _cache_version:
+        return {}
+
+    return data['documents']
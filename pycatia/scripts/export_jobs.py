@@ -0,0 +1,390 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Exports batches of documents to several formats with Document.ExportData.
+
+    Each document is opened once and exported to all its formats. The outputs
+    are recorded in a cache file with the hash of the document they were
+    exported from, so the outputs of unchanged documents are skipped on the
+    next run. The completed outputs are handed to a sink (compression,
+    upload, ...) run in a background thread while CATIA exports the next
+    documents.
+
+    >>> from pycatia import catia
+    >>> from pycatia.scripts.export_jobs import ExportEngine, ZipSink
+    >>> files = Path('//vault/release').rglob('*.CATPart')
+    >>> with ZipSink('c:/temp/release.zip') as sink:
+    >>>     engine = ExportEngine('c:/temp/release', application=catia(), sink=sink)
+    >>>     outputs = engine.run((file, ('stp', 'igs', 'stl', 'cgr')) for file in files)
+    >>> engine.statistics['stp']
+
+    With workers > 1 the documents are exported by worker processes, each in
+    the CATIA session returned by session(), a picklable function (defined at
+    module level) which must connect each worker to a different CATIA
+    session, see :meth:`pycatia.knowledge_interfaces.design_table.DesignTable.sweep`.
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union
+import zipfile
+
+from pycatia.cat_logger import create_logger
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.scripts.file_hashes import file_hash
+from pycatia.scripts.file_hashes import output_stem
+
+if TYPE_CHECKING:
+    from pycatia.in_interfaces.application import Application
+
+_cache_version = 1
+
+
+def _export_documents(application: 'Application', tasks: list) -> list:
+    """
+    Exports the documents of tasks, [(file name, [(format, output file), ...]), ...],
+    and returns [(file name, format, output file, seconds, error), ...].
+    """
+
+    results = []
+    for file_name, outputs in tasks:
+        try:
+            document = application.documents.open(file_name)
+        except Exception as e:
+            results.extend((file_name, file_format, output, 0.0, f'Could not open: {e}')
+                           for file_format, output in outputs)
+            continue
+
+        try:
+            for file_format, output in outputs:
+                start = time.perf_counter()
+                try:
+                    # a file left by a previous export must not pass for this one.
+                    if os.path.isfile(output):
+                        os.remove(output)
+                    document.export_data(Path(output), file_format, overwrite=True)
+                    error = None if os.path.isfile(output) else 'No file was written.'
+                except Exception as e:
+                    error = str(e)
+                results.append((file_name, file_format, output, time.perf_counter() - start, error))
+        finally:
+            # the outputs are written, a failed close mustn't lose the results of the chunk.
+            try:
+                document.close()
+            except Exception as e:
+                create_logger().warning('Could not close "%s": %s', file_name, e)
+
+    return results
+
+
+def _export_worker(session: Callable, tasks: list) -> list:
+    # runs in a worker process of ExportEngine.run(), with its own CATIA session.
+    return _export_documents(session(), tasks)
+
+
+class ExportCache:
+    """
+
+    Records the hash of the document each output was exported from. The hash
+    of a document is only computed again when its size or modification time
+    change.
+
+    :param str cache_file: (optional) the cache is not saved if None.
+    """
+
+    def __init__(self, cache_file: Optional[Union[str, Path]] = None):
+        self.cache_file = cache_file
+        self.files = {}
+        self.outputs = {}
+        if cache_file is not None and Path(cache_file).is_file():
+            with open(cache_file, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('version') == _cache_version:
+                self.files = data['files']
+                self.outputs = data['outputs']
+
+    def get_hash(self, file_name: Union[str, Path]) -> str:
+        """
+        :param str file_name:
+        :rtype: str
+        """
+
+        stat = os.stat(file_name)
+        key = str(file_name)
+        entry = self.files.get(key)
+        if entry is None or entry['mtime'] != stat.st_mtime or entry['size'] != stat.st_size:
+            entry = {'mtime': stat.st_mtime, 'size': stat.st_size, 'hash': file_hash(file_name)}
+            self.files[key] = entry
+
+        return entry['hash']
+
+    def is_current(self, output: Union[str, Path], content_hash: str) -> bool:
+        """
+        Returns True if output exists, is unchanged since it was recorded and
+        was exported from the content hash.
+
+        :param str output:
+        :param str content_hash:
+        :rtype: bool
+        """
+
+        entry = self.outputs.get(str(output))
+        if entry is None or entry['hash'] != content_hash or not os.path.isfile(output):
+            return False
+
+        stat = os.stat(output)
+        return entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size
+
+    def add_output(self, output: Union[str, Path], content_hash: str) -> None:
+        """
+        :param str output:
+        :param str content_hash:
+        """
+
+        stat = os.stat(output)
+        self.outputs[str(output)] = {'hash': content_hash, 'mtime': stat.st_mtime, 'size': stat.st_size}
+
+    def save(self) -> None:
+        if self.cache_file is None:
+            return
+
+        data = {'version': _cache_version, 'files': self.files, 'outputs': self.outputs}
+        temporary_file = f'{self.cache_file}.tmp'
+        with open(temporary_file, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(temporary_file, self.cache_file)
+
+
+class ZipSink:
+    """
+
+    A sink of :class:`ExportEngine` adding the outputs to a zip archive. Use it
+    as a context manager or call close() once the exports are done. The
+    outputs already in the archive are replaced when it is closed.
+
+    :param str archive: the zip file, created or appended to.
+    :param int compression: a zipfile compression method.
+    """
+
+    def __init__(self, archive: Union[str, Path], compression: int = zipfile.ZIP_DEFLATED):
+        self.file_name = archive
+        self.compression = compression
+        self.archive = zipfile.ZipFile(archive, 'a', compression=compression)
+        self._lock = threading.Lock()
+        # {name: output} of the entries to replace on close().
+        self._replaced = {}
+
+    def __call__(self, file_name: str, file_format: str, output: str) -> None:
+        name = Path(output).name
+        with self._lock:
+            if name in self.archive.NameToInfo:
+                self._replaced[name] = output
+            else:
+                self.archive.write(output, name)
+
+    def __enter__(self) -> 'ZipSink':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self.archive.close()
+        if self._replaced:
+            self._rewrite()
+            self._replaced = {}
+
+    def _rewrite(self) -> None:
+        # zipfile can't remove entries, the archive is copied without the replaced entries.
+        temporary_file = f'{self.file_name}.tmp'
+        with zipfile.ZipFile(self.file_name, 'r') as source:
+            with zipfile.ZipFile(temporary_file, 'w', compression=self.compression) as target:
+                for info in source.infolist():
+                    if info.filename not in self._replaced:
+                        target.writestr(info, source.read(info))
+                for name, output in self._replaced.items():
+                    target.write(output, name)
+        os.replace(temporary_file, self.file_name)
+
+
+class ExportEngine:
+    """
+
+    Exports documents to several formats, see :mod:`pycatia.scripts.export_jobs`.
+
+    The outputs are named '<file stem> <path hash>.<format>' in output_folder
+    so documents with the same name in different folders don't overwrite each
+    other's outputs.
+
+    :param str output_folder:
+    :param Application application: (optional) the CATIA session exporting with workers=1.
+    :param int workers: the number of worker processes, each with a CATIA session.
+    :param Callable session: (optional) returns the CATIA Application of a worker.
+    :param Callable sink: (optional) called with (file name, format, output file)
+        for each exported output, in a background thread.
+    :param str cache_file: (optional) defaults to exports.json in output_folder.
+    :param int chunk_size: the number of documents sent to a worker at once.
+    """
+
+    def __init__(self, output_folder: Union[str, Path], application: Optional['Application'] = None,
+                 workers: int = 1, session: Optional[Callable] = None, sink: Optional[Callable] = None,
+                 cache_file: Optional[Union[str, Path]] = None, chunk_size: int = 10):
+        if workers > 1 and session is None:
+            raise CATIAApplicationException('A session function is required to export with several workers.')
+        if workers <= 1 and application is None:
+            raise CATIAApplicationException('An application is required to export without workers.')
+
+        self.output_folder = Path(output_folder)
+        self.application = application
+        self.workers = workers
+        self.session = session
+        self.sink = sink
+        self.cache = ExportCache(cache_file or Path(self.output_folder, 'exports.json'))
+        self.chunk_size = chunk_size
+        self.logger = create_logger()
+        #: {format: {'exported', 'skipped', 'failed', 'seconds', 'bytes'}}
+        self.statistics = {}
+
+    def output_name(self, file_name: Union[str, Path], file_format: str) -> str:
+        """
+        Returns the output file of the document in file_format.
+
+        :param str file_name:
+        :param str file_format:
+        :rtype: str
+        """
+
+        return str(Path(self.output_folder, f'{output_stem(file_name)}.{file_format}'))
+
+    def throughput(self) -> dict:
+        """
+        Returns the number of files and megabytes exported per second of
+        export, for each format.
+
+        :rtype: dict
+        :return: {format: (files per second, megabytes per second)}
+        """
+
+        return {
+            file_format: (
+                statistics['exported'] / statistics['seconds'] if statistics['seconds'] else 0.0,
+                statistics['bytes'] / 1e6 / statistics['seconds'] if statistics['seconds'] else 0.0,
+            )
+            for file_format, statistics in self.statistics.items()
+        }
+
+    def run(self, jobs: Iterable[tuple]) -> dict:
+        """
+
+        Exports the documents to their formats and waits for the sink. The
+        outputs already exported from the current content of a document are
+        skipped and not sent to the sink. Failures are logged and counted, the
+        formats of a chunk whose worker failed (session(), ...) are all
+        failed. The cache is saved even if the run is interrupted.
+
+        :param list jobs: (file name, formats) tuples, the formats being export
+            types supported by CATIA ('stp', 'igs', 'stl', 'cgr', ...).
+        :rtype: dict
+        :return: {file name: {format: output file}} of the exported and skipped outputs.
+        """
+
+        self.output_folder.mkdir(parents=True, exist_ok=True)
+
+        outputs = {}
+        tasks = []
+        hashes = {}
+        for file_name, formats in jobs:
+            file_name = str(file_name)
+            outputs.setdefault(file_name, {})
+            try:
+                hashes[file_name] = self.cache.get_hash(file_name)
+            except OSError as e:
+                for file_format in formats:
+                    self._statistics(file_format)['failed'] += 1
+                self.logger.warning('Could not read "%s": %s', file_name, e)
+                continue
+
+            missing = []
+            for file_format in formats:
+                statistics = self._statistics(file_format)
+                output = self.output_name(file_name, file_format)
+                if self.cache.is_current(output, hashes[file_name]):
+                    statistics['skipped'] += 1
+                    outputs[file_name][file_format] = output
+                else:
+                    missing.append((file_format, output))
+            if missing:
+                tasks.append((file_name, missing))
+
+        chunks = [tasks[i:i + self.chunk_size] for i in range(0, len(tasks), self.chunk_size)]
+        self.logger.info('Exporting %s documents in %s chunks.', len(tasks), len(chunks))
+
+        try:
+            with ThreadPoolExecutor(max_workers=1) as sink_executor:
+                sink_futures = []
+
+                def add_results(chunk, get_results):
+                    try:
+                        results = get_results()
+                    except Exception as e:
+                        self.logger.warning('Could not export a chunk of %s documents: %s', len(chunk), e)
+                        results = [(file_name, file_format, output, 0.0, str(e))
+                                   for file_name, chunk_outputs in chunk for file_format, output in chunk_outputs]
+                    for file_name, file_format, output, seconds, error in results:
+                        sink_futures.extend(self._add_result(
+                            file_name, file_format, output, seconds, error, hashes[file_name], outputs, sink_executor))
+
+                if self.workers > 1:
+                    with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                        futures = {executor.submit(_export_worker, self.session, chunk): chunk for chunk in chunks}
+                        for future in as_completed(futures):
+                            add_results(futures[future], future.result)
+                else:
+                    for chunk in chunks:
+                        add_results(chunk, partial(_export_documents, self.application, chunk))
+
+                for future in sink_futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.warning('The sink failed: %s', e)
+        finally:
+            # the outputs already exported aren't exported again by the next run.
+            self.cache.save()
+        for file_format, (files_per_second, megabytes_per_second) in self.throughput().items():
+            statistics = self.statistics[file_format]
+            self.logger.info(
+                '%s: %s exported, %s skipped, %s failed, %.2f files/s, %.2f MB/s.', file_format,
+                statistics['exported'], statistics['skipped'], statistics['failed'], files_per_second,
+                megabytes_per_second)
+
+        return outputs
+
+    def _statistics(self, file_format: str) -> dict:
+        return self.statistics.setdefault(
+            file_format, {'exported': 0, 'skipped': 0, 'failed': 0, 'seconds': 0.0, 'bytes': 0})
+
+    def _add_result(self, file_name: str, file_format: str, output: str, seconds: float, error: Optional[str],
+                    content_hash: str, outputs: dict, sink_executor: ThreadPoolExecutor) -> list:
+        statistics = self._statistics(file_format)
+        statistics['seconds'] += seconds
+        if error is not None:
+            statistics['failed'] += 1
+            self.logger.warning('Could not export "%s" to %s: %s', file_name, file_format, error)
+            return []
+
+        statistics['exported'] += 1
+        statistics['bytes'] += os.path.getsize(output)
+        self.cache.add_output(output, content_hash)
+        outputs[file_name][file_format] = output
+
+        if self.sink is None:
+            return []
+        return [sink_executor.submit(self.sink, file_name, file_format, output)]
@@ -0,0 +1,85 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Values cached by feature, shared by the pycatia objects of the feature.
+
+    The pycatia objects are created again on each access to a property
+    (part.origin_elements.plane_xy returns a new object each time), so caches
+    keyed by the pycatia objects miss. FeatureCache keys the values by the
+    COM identity of the feature, the _oleobj_ of the com object which pywin32
+    compares by the IUnknown pointer.
+
+    >>> cache = FeatureCache()
+    >>> cache[part.origin_elements.plane_xy] = reference
+    >>> part.origin_elements.plane_xy in cache
+    >>> # True
+
+"""
+
+import weakref
+
+from pycatia.scripts.update_tracker import unwrap
+
+
+def com_identity(com_object):
+    """
+    Returns the key identifying the CATIA object of com_object, the same for
+    all the com objects of the object.
+
+    :param com_object:
+    """
+
+    com_object = unwrap(com_object)
+    return getattr(com_object, '_oleobj_', com_object)
+
+
+class FeatureCache:
+    """
+
+    A mapping of pycatia objects to values keyed by the COM identity of their
+    feature, see :mod:`pycatia.scripts.feature_cache`. The keys of the
+    pycatia objects already seen are remembered weakly, the values are kept
+    until they are removed or the cache is cleared.
+
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._keys = weakref.WeakKeyDictionary()
+
+    def key(self, pycatia_object):
+        """
+        Returns the COM identity of the feature of pycatia_object.
+
+        :param pycatia_object:
+        """
+
+        key = self._keys.get(pycatia_object)
+        if key is None:
+            key = self._keys[pycatia_object] = com_identity(pycatia_object.com_object)
+        return key
+
+    def get(self, pycatia_object, default=None):
+        return self._values.get(self.key(pycatia_object), default)
+
+    def pop(self, pycatia_object, default=None):
+        return self._values.pop(self.key(pycatia_object), default)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __contains__(self, pycatia_object) -> bool:
+        return self.key(pycatia_object) in self._values
+
+    def __getitem__(self, pycatia_object):
+        return self._values[self.key(pycatia_object)]
+
+    def __setitem__(self, pycatia_object, value):
+        self._values[self.key(pycatia_object)] = value
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self):
+        return f'FeatureCache(entries={len(self._values)})'
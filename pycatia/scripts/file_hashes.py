@@ -0,0 +1,45 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Hashes of files and of their paths shared by the batch scripts
+    (:mod:`pycatia.scripts.thumbnails`, :mod:`pycatia.scripts.export_jobs`).
+    Doesn't require CATIA.
+
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Union
+
+
+def file_hash(file_name: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """
+    Returns the sha1 of the content of the file.
+
+    :param str file_name:
+    :param int chunk_size:
+    :rtype: str
+    """
+
+    sha1 = hashlib.sha1()
+    with open(file_name, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            sha1.update(chunk)
+
+    return sha1.hexdigest()
+
+
+def output_stem(file_name: Union[str, Path]) -> str:
+    """
+    Returns '<stem> <path hash>', the stem of the files created from the
+    document. Documents with the same name in different folders get
+    different stems.
+
+    :param str file_name:
+    :rtype: str
+    """
+
+    path = os.path.normcase(str(Path(file_name).resolve()))
+    return f'{Path(file_name).stem} {hashlib.sha1(path.encode("utf-8")).hexdigest()[:8]}'
@@ -0,0 +1,559 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Geometry computed in python from coordinates read from CATIA once:
+    axis aligned and oriented bounding boxes, coordinates in an axis system
+    and nearest distances between point sets.
+
+    Building extracts, extremums and planes in CATIA to find a bounding box or
+    measuring each point against an axis system is a call to CATIA per
+    feature. Read the coordinates in a single call (the points of a
+    tessellation, :meth:`pycatia.mec_mod_interfaces.axis_system.AxisSystem.get_matrix`,
+    ...) and compute the rest here.
+
+    >>> from pycatia.scripts.geometry import obb, to_local
+    >>> center, axes, half_sizes = obb(points)
+    >>> local_points = to_local(axis_system.get_matrix(), points)
+
+    The points are sequences of (x, y, z). Matrices are the 4x4 matrices of
+    :mod:`pycatia.scripts.transforms`.
+
+    The computations are vectorized with NumPy when it is installed
+    (``pip install numpy``), the points can then also be given as a (n, 3)
+    array. to_local() and to_global() return an array for an array.
+
+"""
+
+import math
+from typing import Iterable, Optional
+
+from pycatia.scripts.transforms import invert, transform_points
+
+
+#: the number of queries of nearest_distances() searched at once with NumPy.
+_query_chunk_size = 1 << 14
+
+
+def _numpy():
+    try:
+        import numpy
+    except ModuleNotFoundError:
+        return None
+    return numpy
+
+
+def _as_array(numpy, points):
+    # a (n, 3) array of the points, which can be any iterable.
+    if not isinstance(points, numpy.ndarray):
+        points = list(points)
+    return numpy.asarray(points, dtype=float).reshape(-1, 3)
+
+
+def _sub(a, b) -> tuple:
+    return a[0] - b[0], a[1] - b[1], a[2] - b[2]
+
+
+def _dot(a, b) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a, b) -> tuple:
+    return a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]
+
+
+def normalize(vector: Iterable) -> tuple:
+    """
+    :param tuple vector:
+    :rtype: tuple
+    """
+
+    x, y, z = vector
+    length = math.sqrt(x * x + y * y + z * z)
+    if length == 0:
+        raise ValueError('Can not normalize a null vector.')
+
+    return x / length, y / length, z / length
+
+
+def aabb(points: Iterable) -> tuple:
+    """
+    Returns the axis aligned bounding box of the points.
+
+    :param list points:
+    :rtype: tuple
+    :return: ((min x, min y, min z), (max x, max y, max z))
+    """
+
+    numpy = _numpy()
+    if numpy is not None:
+        points = _as_array(numpy, points)
+        if not len(points):
+            raise ValueError('The bounding box of no points is undefined.')
+        return tuple(points.min(axis=0).tolist()), tuple(points.max(axis=0).tolist())
+
+    points = list(points)
+    if not points:
+        raise ValueError('The bounding box of no points is undefined.')
+
+    xs, ys, zs = zip(*points)
+    return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+
+
+def _symmetric_eigenvectors(matrix: list, sweeps: int = 50) -> tuple:
+    """
+    Eigen decomposition of a symmetric 3x3 matrix, Jacobi method. Returns the
+    eigenvalues and the eigenvectors (as rows).
+    """
+
+    a = [list(row) for row in matrix]
+    v = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
+    for _ in range(sweeps):
+        off_diagonal = a[0][1] ** 2 + a[0][2] ** 2 + a[1][2] ** 2
+        if off_diagonal < 1e-30:
+            break
+
+        for p, q in ((0, 1), (0, 2), (1, 2)):
+            if abs(a[p][q]) < 1e-300:
+                continue
+            theta = (a[q][q] - a[p][p]) / (2 * a[p][q])
+            t = math.copysign(1.0, theta) / (abs(theta) + math.sqrt(theta * theta + 1))
+            c = 1 / math.sqrt(t * t + 1)
+            s = t * c
+            for k in range(3):
+                a_kp, a_kq = a[k][p], a[k][q]
+                a[k][p] = c * a_kp - s * a_kq
+                a[k][q] = s * a_kp + c * a_kq
+            for k in range(3):
+                a_pk, a_qk = a[p][k], a[q][k]
+                a[p][k] = c * a_pk - s * a_qk
+                a[q][k] = s * a_pk + c * a_qk
+            for k in range(3):
+                v_kp, v_kq = v[k][p], v[k][q]
+                v[k][p] = c * v_kp - s * v_kq
+                v[k][q] = s * v_kp + c * v_kq
+
+    values = (a[0][0], a[1][1], a[2][2])
+    vectors = tuple(tuple(v[k][i] for k in range(3)) for i in range(3))
+    return values, vectors
+
+
+def obb(points: Iterable) -> tuple:
+    """
+    Returns an oriented bounding box of the points. The axes are the principal
+    axes of the points (the eigenvectors of their covariance matrix), largest
+    spread first. This is a close fit for most shapes but not always the
+    smallest box.
+
+    :param list points:
+    :rtype: tuple
+    :return: (center, (x axis, y axis, z axis), (half size x, half size y, half size z))
+    """
+
+    numpy = _numpy()
+    if numpy is not None:
+        return _obb_numpy(numpy, points)
+
+    points = list(points)
+    if not points:
+        raise ValueError('The bounding box of no points is undefined.')
+
+    n = len(points)
+    mean = tuple(sum(point[k] for point in points) / n for k in range(3))
+    covariance = [[0.0] * 3 for _ in range(3)]
+    for point in points:
+        d = _sub(point, mean)
+        for row in range(3):
+            for column in range(row, 3):
+                covariance[row][column] += d[row] * d[column]
+    for row in range(3):
+        for column in range(row):
+            covariance[row][column] = covariance[column][row]
+
+    values, vectors = _symmetric_eigenvectors(covariance)
+    order = sorted(range(3), key=lambda i: -values[i])
+    x_axis = normalize(vectors[order[0]])
+    y_axis = normalize(vectors[order[1]])
+    # right handed.
+    z_axis = _cross(x_axis, y_axis)
+    axes = (x_axis, y_axis, z_axis)
+
+    low, high = [], []
+    for axis in axes:
+        projections = [_dot(point, axis) for point in points]
+        low.append(min(projections))
+        high.append(max(projections))
+
+    center = tuple(
+        sum(axes[i][k] * (low[i] + high[i]) / 2 for i in range(3)) for k in range(3)
+    )
+    half_sizes = tuple((high[i] - low[i]) / 2 for i in range(3))
+
+    return center, axes, half_sizes
+
+
+def _obb_numpy(numpy, points) -> tuple:
+    points = _as_array(numpy, points)
+    if not len(points):
+        raise ValueError('The bounding box of no points is undefined.')
+
+    d = points - points.mean(axis=0)
+    values, vectors = numpy.linalg.eigh(d.T @ d)
+    # eigh gives the eigenvalues in ascending order and the eigenvectors as columns.
+    x_axis = vectors[:, 2]
+    y_axis = vectors[:, 1]
+    axes = numpy.array([x_axis, y_axis, numpy.cross(x_axis, y_axis)])
+
+    projections = points @ axes.T
+    low = projections.min(axis=0)
+    high = projections.max(axis=0)
+    center = axes.T @ ((low + high) / 2)
+
+    return tuple(center.tolist()), tuple(tuple(axis) for axis in axes.tolist()), tuple(((high - low) / 2).tolist())
+
+
+def box_corners(center: tuple, axes: tuple, half_sizes: tuple) -> list:
+    """
+    Returns the 8 corners of an oriented box, see :func:`obb`.
+
+    :param tuple center:
+    :param tuple axes:
+    :param tuple half_sizes:
+    :rtype: list
+    """
+
+    corners = []
+    for sx in (-1, 1):
+        for sy in (-1, 1):
+            for sz in (-1, 1):
+                corners.append(tuple(
+                    center[k]
+                    + sx * half_sizes[0] * axes[0][k]
+                    + sy * half_sizes[1] * axes[1][k]
+                    + sz * half_sizes[2] * axes[2][k]
+                    for k in range(3)
+                ))
+
+    return corners
+
+
+def axis_system_matrix(origin: Iterable, x_axis: Iterable, y_axis: Iterable,
+                       z_axis: Optional[Iterable] = None) -> tuple:
+    """
+    Returns the 4x4 matrix of an axis system given in the format of CATIA
+    (AxisSystem.get_origin(), get_x_axis(), get_y_axis()). The axes are
+    normalized and the y axis made normal to the x axis. The z axis is only
+    used to tell the left handed axis systems.
+
+    :param tuple origin:
+    :param tuple x_axis:
+    :param tuple y_axis:
+    :param tuple z_axis: (optional)
+    :rtype: tuple
+    """
+
+    x = normalize(x_axis)
+    z = normalize(_cross(x, y_axis))
+    y = _cross(z, x)
+    if z_axis is not None and _dot(z, z_axis) < 0:
+        z = (-z[0], -z[1], -z[2])
+    o = tuple(origin)
+
+    return (
+        (x[0], y[0], z[0], o[0]),
+        (x[1], y[1], z[1], o[1]),
+        (x[2], y[2], z[2], o[2]),
+        (0.0, 0.0, 0.0, 1.0),
+    )
+
+
+def to_local(matrix: tuple, points: Iterable) -> list:
+    """
+    Returns the coordinates of the points in the axis system of matrix (see
+    :func:`axis_system_matrix`).
+
+    :param tuple matrix:
+    :param list points:
+    :rtype: list
+    """
+
+    return _transform(invert(matrix), points)
+
+
+def to_global(matrix: tuple, points: Iterable) -> list:
+    """
+    Returns the coordinates, in the axis system of the part, of points given
+    in the axis system of matrix.
+
+    :param tuple matrix:
+    :param list points:
+    :rtype: list
+    """
+
+    return _transform(matrix, points)
+
+
+def _transform(matrix: tuple, points: Iterable):
+    numpy = _numpy()
+    if numpy is None:
+        return transform_points(matrix, points)
+
+    matrix = numpy.asarray(matrix, dtype=float)
+    transformed = _as_array(numpy, points) @ matrix[:3, :3].T + matrix[:3, 3]
+    if isinstance(points, numpy.ndarray):
+        return transformed
+
+    return [tuple(point) for point in transformed.tolist()]
+
+
+class KDTree:
+    """
+
+    A k-d tree of 3D points for nearest neighbour queries.
+
+    :param list points:
+    """
+
+    def __init__(self, points: Iterable):
+        self.points = [tuple(point) for point in points]
+        # nodes are (point index, axis, left node, right node).
+        self.root = self._build(list(range(len(self.points))), 0)
+
+    def _build(self, indexes: list, depth: int) -> Optional[tuple]:
+        if not indexes:
+            return None
+
+        axis = depth % 3
+        indexes.sort(key=lambda i: self.points[i][axis])
+        median = len(indexes) // 2
+
+        return (
+            indexes[median],
+            axis,
+            self._build(indexes[:median], depth + 1),
+            self._build(indexes[median + 1:], depth + 1),
+        )
+
+    def nearest(self, point: Iterable) -> tuple:
+        """
+        Returns the index of the nearest point of the tree and its distance.
+
+        :param tuple point:
+        :rtype: tuple
+        :return: (index, distance)
+        """
+
+        if self.root is None:
+            raise ValueError('The tree has no points.')
+
+        point = tuple(point)
+        best_index, best_distance2 = -1, math.inf
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            index, axis, left, right = node
+            other = self.points[index]
+            d = _sub(point, other)
+            distance2 = _dot(d, d)
+            if distance2 < best_distance2:
+                best_index, best_distance2 = index, distance2
+
+            delta = point[axis] - other[axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            # the far side is searched after the near side, if it can be closer.
+            if delta * delta < best_distance2:
+                stack.append(far)
+            stack.append(near)
+
+        return best_index, math.sqrt(best_distance2)
+
+
+def nearest_distances(points: Iterable, targets: Iterable) -> list:
+    """
+    Returns, for each point, the index of the nearest target and its distance.
+
+    :param list points:
+    :param list targets:
+    :rtype: list
+    :return: [(index, distance), ...]
+    """
+
+    numpy = _numpy()
+    if numpy is not None:
+        indexes, distances = _nearest_numpy(numpy, points, targets)
+        return list(zip(indexes.tolist(), distances.tolist()))
+
+    tree = KDTree(targets)
+    return [tree.nearest(point) for point in points]
+
+
+def _grid_cell_size(numpy, extent, count: int) -> float:
+    # about two targets per cell, over the dimensions the targets spread in (flat or linear sets).
+    spread = extent[extent > extent.max() * 1e-9]
+    if not len(spread):
+        return 1.0
+    return float(numpy.prod(spread) * 2 / count) ** (1 / len(spread))
+
+
+class _Octree:
+    """
+    The targets of nearest_distances() sorted into a grid of cells, grouped
+    in blocks of 2x2x2 cells level after level up to a single block.
+    """
+
+    def __init__(self, numpy, targets):
+        self.numpy = numpy
+        self.low = targets.min(axis=0)
+        extent = targets.max(axis=0) - self.low
+        self.size = _grid_cell_size(numpy, extent, len(targets))
+        while numpy.prod(extent // self.size + 1) > 4 * len(targets):
+            self.size *= 2
+        cells = numpy.minimum((targets - self.low) // self.size, extent // self.size).astype(numpy.int64)
+
+        self.dims = [cells.max(axis=0) + 1]
+        while self.dims[-1].max() > 1:
+            self.dims.append((self.dims[-1] - 1) // 2 + 1)
+        self.levels = len(self.dims) - 1
+
+        keys = self.keys(0, cells)
+        self.order = numpy.argsort(keys, kind='stable')
+        self.targets = targets[self.order]
+        #: the targets of the cell of key k are self.targets[starts[k]:starts[k + 1]].
+        self.starts = numpy.r_[0, numpy.cumsum(numpy.bincount(keys, minlength=numpy.prod(self.dims[0])))]
+        #: whether the cells hold targets, by level.
+        self.occupied = []
+        for level, dims in enumerate(self.dims):
+            occupied = numpy.zeros(numpy.prod(dims), dtype=bool)
+            occupied[self.keys(level, cells >> level)] = True
+            self.occupied.append(occupied)
+        self.children = numpy.array([(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)])
+        self.neighbours = numpy.array([(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)])
+
+    def keys(self, level: int, cells):
+        dims = self.dims[level]
+        return (cells[..., 0] * dims[1] + cells[..., 1]) * dims[2] + cells[..., 2]
+
+    def is_occupied(self, level: int, cells):
+        inside = ((cells >= 0) & (cells < self.dims[level])).all(axis=-1)
+        return inside & self.occupied[level][self.numpy.where(inside, self.keys(level, cells), 0)]
+
+    def distances2(self, level: int, cells, points):
+        # the squared distances of the points to the boxes of the cells.
+        size = self.size * (1 << level)
+        cell_low = self.low + cells * size
+        gaps = self.numpy.maximum(self.numpy.maximum(cell_low - points, points - cell_low - size), 0)
+        return (gaps ** 2).sum(axis=-1)
+
+    def nearest_in_cells(self, rows, cells, points) -> tuple:
+        """
+        Returns the rows, target indexes and squared distances of the nearest
+        targets in the cells (level 0) given for each row of points, rows
+        being sorted.
+        """
+
+        numpy = self.numpy
+        keys = self.keys(0, cells)
+        starts = self.starts[keys]
+        counts = self.starts[keys + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return rows[:0], rows[:0], numpy.zeros(0)
+
+        candidates = numpy.repeat(starts - (numpy.cumsum(counts) - counts), counts) + numpy.arange(total)
+        candidate_rows = numpy.repeat(rows, counts)
+        d = points[candidate_rows] - self.targets[candidates]
+        distances2 = d[:, 0] ** 2 + d[:, 1] ** 2 + d[:, 2] ** 2
+
+        group_starts = numpy.flatnonzero(numpy.r_[True, candidate_rows[1:] != candidate_rows[:-1]])
+        group_min = numpy.minimum.reduceat(distances2, group_starts)
+        nearest = numpy.flatnonzero(distances2 == numpy.repeat(group_min, numpy.diff(numpy.r_[group_starts, total])))
+        nearest = nearest[numpy.r_[True, candidate_rows[nearest][1:] != candidate_rows[nearest][:-1]]]
+        return candidate_rows[nearest], candidates[nearest], distances2[nearest]
+
+    def nearest(self, points) -> tuple:
+        """
+        Returns the indexes (in the sorted targets) and the squared distances
+        of the nearest targets of the points.
+        """
+
+        numpy = self.numpy
+        count = len(points)
+        all_rows = numpy.arange(count)
+
+        # first targets, around the cell found going down to the nearest
+        # occupied block at each level.
+        cells = numpy.zeros((count, 3), dtype=numpy.int64)
+        for level in range(self.levels, 0, -1):
+            children = cells[:, None, :] * 2 + self.children
+            distances2 = self.distances2(level - 1, children, points[:, None, :])
+            distances2[~self.is_occupied(level - 1, children)] = numpy.inf
+            cells = children[all_rows, distances2.argmin(axis=1)]
+        rows = numpy.repeat(all_rows, len(self.neighbours))
+        neighbours = (cells[:, None, :] + self.neighbours).reshape(-1, 3)
+        keep = self.is_occupied(0, neighbours)
+        _, best_index, best2 = self.nearest_in_cells(rows[keep], neighbours[keep], points)
+
+        # these targets are the nearest when nearer than the sides of the
+        # neighbour cells, other than the sides of the grid.
+        below = numpy.where(cells > 0, points - self.low - (cells - 1) * self.size, numpy.inf)
+        above = numpy.where(cells < self.dims[0] - 1, self.low + (cells + 2) * self.size - points, numpy.inf)
+        margins = numpy.maximum(numpy.minimum(below, above).min(axis=1), 0)
+
+        # then the targets of the other cells nearer than these targets.
+        rows = numpy.flatnonzero(best2 > margins ** 2)
+        cells = numpy.zeros((len(rows), 3), dtype=numpy.int64)
+        for level in range(self.levels, 0, -1):
+            rows = numpy.repeat(rows, 8)
+            cells = numpy.repeat(cells, 8, axis=0) * 2 + numpy.tile(self.children, (len(cells), 1))
+            keep = self.is_occupied(level - 1, cells)
+            rows, cells = rows[keep], cells[keep]
+            keep = self.distances2(level - 1, cells, points[rows]) < best2[rows]
+            rows, cells = rows[keep], cells[keep]
+
+        found, index, distances2 = self.nearest_in_cells(rows, cells, points)
+        better = distances2 < best2[found]
+        best_index[found[better]] = index[better]
+        best2[found[better]] = distances2[better]
+
+        return best_index, best2
+
+
+def _nearest_numpy(numpy, points, targets) -> tuple:
+    """
+    Returns the indexes of the nearest targets and their distances, with an
+    octree of the targets searched for many points at once.
+    """
+
+    points = _as_array(numpy, points)
+    targets = _as_array(numpy, targets)
+    if not len(targets):
+        raise ValueError('The tree has no points.')
+
+    tree = _Octree(numpy, targets)
+    indexes = numpy.zeros(len(points), dtype=numpy.int64)
+    distances2 = numpy.zeros(len(points))
+    for start in range(0, len(points), _query_chunk_size):
+        chunk = slice(start, start + _query_chunk_size)
+        indexes[chunk], distances2[chunk] = tree.nearest(points[chunk])
+
+    return tree.order[indexes], numpy.sqrt(distances2)
+
+
+def min_distance(points: Iterable, targets: Iterable) -> float:
+    """
+    Returns the smallest distance between the two point sets.
+
+    :param list points:
+    :param list targets:
+    :rtype: float
+    """
+
+    numpy = _numpy()
+    if numpy is not None:
+        return float(_nearest_numpy(numpy, points, targets)[1].min())
+
+    return min(distance for _, distance in nearest_distances(points, targets))
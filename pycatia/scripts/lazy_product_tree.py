@@ -0,0 +1,305 @@
+#! /usr/bin/python3.9
+
+"""
+
+    A product tree read from CATIA on demand.
+
+    Each access to a Product property (part_number, revision, ...) or to
+    Product.get_children() is a call to CATIA. LazyProductTree reads the
+    children of a node, and all their properties, in a single call when they
+    are first needed and keeps them until invalidated. The breadth first walk
+    reads a whole level of the tree in a single call.
+
+    >>> from pycatia.scripts.lazy_product_tree import LazyProductTree
+    >>> tree = LazyProductTree(product_document.product)
+    >>> for node in tree.walk_depth_first(prune=lambda node: node.part_number.startswith('STD')):
+    >>>     print(node.path, node.part_number, node.revision)
+
+    The tree doesn't follow the changes made to the product structure, call
+    :meth:`LazyProductNode.invalidate` or :meth:`LazyProductTree.invalidate`
+    after modifying it.
+
+"""
+
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from pycatia.product_structure_interfaces.product import Product
+
+#: the properties read for each node, in the order returned by the routines.
+node_properties = (
+    'name',
+    'part_number',
+    'revision',
+    'nomenclature',
+    'definition',
+    'description_reference',
+    'description_instance',
+    'file_name',
+    'children_count',
+)
+
+_vba_code = """
+Dim values()
+
+Sub describe(product, n)
+    On Error Resume Next
+    Dim k
+    k = 9 * n
+    values(k) = product.Name
+    values(k + 1) = product.PartNumber
+    values(k + 2) = product.Revision
+    values(k + 3) = product.Nomenclature
+    values(k + 4) = product.Definition
+    values(k + 5) = product.DescriptionRef
+    values(k + 6) = product.DescriptionInst
+    values(k + 7) = product.ReferenceProduct.Parent.FullName
+    values(k + 8) = product.Products.Count
+    Err.Clear
+End Sub
+
+Public Function read_properties(products)
+    ReDim values(9 * (UBound(products) + 1))
+    For i = 0 To UBound(products)
+        describe products(i), i
+    Next
+    read_properties = values
+End Function
+
+Public Function read_children(parents)
+    Dim objects(), parent_indexes()
+    total = 0
+    For i = 0 To UBound(parents)
+        total = total + parents(i).Products.Count
+    Next
+    ReDim objects(total)
+    ReDim parent_indexes(total)
+    ReDim values(9 * (total + 1))
+    n = 0
+    For i = 0 To UBound(parents)
+        Set products = parents(i).Products
+        For j = 1 To products.Count
+            Set objects(n) = products.Item(j)
+            parent_indexes(n) = i
+            describe objects(n), n
+            n = n + 1
+        Next
+    Next
+    read_children = Array(objects, parent_indexes, values, n)
+End Function
+"""
+
+
+class LazyProductNode:
+    """
+
+    A product of a LazyProductTree. The properties listed in
+    :data:`node_properties` are available as attributes.
+
+    """
+
+    def __init__(self, tree: 'LazyProductTree', com_object, parent: Optional['LazyProductNode'] = None,
+                 properties: Optional[dict] = None):
+        self.tree = tree
+        self.com_object = com_object
+        self.parent = parent
+        self._properties = properties
+        self._children = None
+
+    def __getattr__(self, name: str):
+        if name not in node_properties:
+            raise AttributeError(name)
+        return self.properties[name]
+
+    @property
+    def properties(self) -> dict:
+        """
+        :rtype: dict
+        """
+
+        if self._properties is None:
+            self.tree.load_properties([self])
+        return self._properties
+
+    @property
+    def children(self) -> list:
+        """
+        The child nodes. The children of the siblings are read in the same call.
+
+        :rtype: list(LazyProductNode)
+        """
+
+        if self._children is None:
+            siblings = self.parent.children if self.parent is not None else [self]
+            self.tree.load_children([node for node in siblings if node._children is None])
+        return self._children
+
+    @property
+    def depth(self) -> int:
+        """
+        :rtype: int
+        """
+
+        depth = 0
+        node = self.parent
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
+
+    @property
+    def path(self) -> str:
+        """
+        The instance names from the top product, separated by '/'. The top
+        product is ''.
+
+        :rtype: str
+        """
+
+        names = []
+        node = self
+        while node.parent is not None:
+            names.append(node.name)
+            node = node.parent
+        return '/'.join(reversed(names))
+
+    @property
+    def product(self) -> 'Product':
+        """
+        :rtype: Product
+        """
+
+        from pycatia.product_structure_interfaces.product import Product
+        return Product(self.com_object)
+
+    def invalidate(self) -> None:
+        """
+        Forgets the properties and the children of the node, they are read
+        again on the next access.
+        """
+
+        self._properties = None
+        self._children = None
+
+    def __repr__(self):
+        if self._properties is None:
+            return 'LazyProductNode()'
+        return f'LazyProductNode(name="{self._properties["name"]}")'
+
+
+class LazyProductTree:
+    """
+
+    The product tree below product, read on demand.
+
+    :param Product product:
+    """
+
+    def __init__(self, product: 'Product'):
+        self.application = product.application
+        self.root = LazyProductNode(self, product.com_object)
+        self.calls = 0
+
+    def invalidate(self) -> None:
+        """
+        Forgets the whole tree.
+        """
+
+        self.root.invalidate()
+
+    def load_properties(self, nodes: list) -> None:
+        """
+        Reads the properties of the nodes in a single call to CATIA.
+
+        :param list nodes:
+        """
+
+        if not nodes:
+            return
+
+        values = self._evaluate('read_properties', [node.com_object for node in nodes])
+        for i, node in enumerate(nodes):
+            node._properties = _properties(values, i)
+
+    def load_children(self, nodes: list) -> None:
+        """
+        Reads the children of the nodes, and their properties, in a single call
+        to CATIA.
+
+        :param list nodes:
+        """
+
+        if not nodes:
+            return
+
+        objects, parent_indexes, values, count = self._evaluate('read_children', [node.com_object for node in nodes])
+        for node in nodes:
+            node._children = []
+        for i in range(count):
+            parent = nodes[parent_indexes[i]]
+            parent._children.append(LazyProductNode(self, objects[i], parent, _properties(values, i)))
+
+    def walk_depth_first(self, prune: Optional[Callable] = None,
+                         node: Optional[LazyProductNode] = None) -> Iterator[LazyProductNode]:
+        """
+        Yields the nodes depth first, starting with node (the top product by
+        default). The children of the nodes for which prune(node) is True are
+        skipped.
+
+        :param Callable prune: (optional) prune(node) -> bool
+        :param LazyProductNode node: (optional)
+        :rtype: Iterator[LazyProductNode]
+        """
+
+        stack = [node or self.root]
+        while stack:
+            current = stack.pop()
+            yield current
+            if current.children_count and not (prune and prune(current)):
+                stack.extend(reversed(current.children))
+
+    def walk_breadth_first(self, prune: Optional[Callable] = None,
+                           node: Optional[LazyProductNode] = None) -> Iterator[LazyProductNode]:
+        """
+        Yields the nodes level by level, starting with node (the top product by
+        default). The children of all the nodes of a level are read in a single
+        call to CATIA. The children of the nodes for which prune(node) is True
+        are skipped.
+
+        :param Callable prune: (optional) prune(node) -> bool
+        :param LazyProductNode node: (optional)
+        :rtype: Iterator[LazyProductNode]
+        """
+
+        level = [node or self.root]
+        while level:
+            expand = []
+            for current in level:
+                yield current
+                if current.children_count and not (prune and prune(current)):
+                    expand.append(current)
+
+            self.load_children([current for current in expand if current._children is None])
+            level = [child for current in expand for child in current.children]
+
+    def find(self, predicate: Callable) -> Iterator[LazyProductNode]:
+        """
+        Yields the nodes for which predicate(node) is True, breadth first.
+
+        :param Callable predicate:
+        :rtype: Iterator[LazyProductNode]
+        """
+
+        return (node for node in self.walk_breadth_first() if predicate(node))
+
+    def _evaluate(self, vba_function_name: str, com_objects: list):
+        self.calls += 1
+        system_service = self.application.system_service
+        return system_service.evaluate(_vba_code, 0, vba_function_name, [com_objects])
+
+    def __repr__(self):
+        return f'LazyProductTree(root={self.root})'
+
+
+def _properties(values: tuple, index: int) -> dict:
+    return dict(zip(node_properties, values[9 * index:9 * index + 9]))
@@ -0,0 +1,322 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Mass properties (mass, centre of gravity and inertia) of every node of a
+    product tree.
+
+    Product.analyze computes the mass properties of the whole sub tree of a
+    product in CATIA, so asking every node of a deep assembly is quadratic. The
+    rollup reads the mass properties of each part reference once, in a single
+    call to CATIA, and sums them up the tree in python using the positions of
+    the instances. The values of the parts are cached by document and
+    modification time so unchanged parts aren't analysed again on the next run.
+
+    >>> from pycatia.scripts.mass_properties import MassPropertiesRollup
+    >>> rollup = MassPropertiesRollup(cache_file='mass_properties.json')
+    >>> properties = rollup.rollup(product_document.product)
+    >>> properties['']  # the top product
+    >>> # MassProperties(mass=1.5, cog=(50.0, 50.0, 25.0))
+    >>> properties['Sub.1/Part.1'].mass
+
+    The products must be in design mode. The units are kg, mm and kg.mm2, the
+    inertia matrices given by CATIA Analyze in kg.m2 are converted when read
+    so the parallel axis shifts of the rollup use the same length unit as the
+    centres of gravity. The inertia matrices are given at the centre of
+    gravity, in the axis system of the top product.
+
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from pycatia.scripts.transforms import compose_absolute, from_components
+
+if TYPE_CHECKING:
+    from pycatia.product_structure_interfaces.product import Product
+
+_cache_version = 2
+# CATIA Analyze gives the inertia in kg.m2.
+_inertia_to_kg_mm2 = 1e6
+_zero_matrix = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+
+
+class MassProperties:
+    """
+
+    The mass, centre of gravity and inertia matrix (at the centre of
+    gravity) of a part or product, in kg, mm and kg.mm2.
+
+    :param float mass:
+    :param tuple cog: (x, y, z)
+    :param tuple inertia: 3x3 matrix, or its 9 components.
+    """
+
+    def __init__(self, mass: float = 0.0, cog: Iterable = (0.0, 0.0, 0.0), inertia: Iterable = _zero_matrix):
+        inertia = tuple(inertia)
+        if len(inertia) == 9:
+            inertia = (inertia[0:3], inertia[3:6], inertia[6:9])
+
+        self.mass = mass
+        self.cog = tuple(cog)
+        self.inertia = tuple(tuple(row) for row in inertia)
+
+    def transformed(self, matrix: tuple) -> 'MassProperties':
+        """
+        Returns the mass properties expressed in the axis system in which
+        matrix (4x4, see :mod:`pycatia.scripts.transforms`) is given.
+
+        :param tuple matrix:
+        :rtype: MassProperties
+        """
+
+        rotation = [row[:3] for row in matrix[:3]]
+        cog = tuple(
+            sum(rotation[row][k] * self.cog[k] for k in range(3)) + matrix[row][3] for row in range(3)
+        )
+        # R.I.Rt
+        ri = [[sum(rotation[row][k] * self.inertia[k][column] for k in range(3)) for column in range(3)]
+              for row in range(3)]
+        inertia = tuple(
+            tuple(sum(ri[row][k] * rotation[column][k] for k in range(3)) for column in range(3)) for row in range(3)
+        )
+
+        return MassProperties(self.mass, cog, inertia)
+
+    @classmethod
+    def combine(cls, items: Iterable['MassProperties']) -> 'MassProperties':
+        """
+        Returns the mass properties of the union of items, all expressed in the
+        same axis system. The inertia matrices are moved to the common centre
+        of gravity with the parallel axis theorem.
+
+        :param list items:
+        :rtype: MassProperties
+        """
+
+        items = [item for item in items if item.mass]
+        mass = sum(item.mass for item in items)
+        if not mass:
+            return cls()
+
+        cog = tuple(sum(item.mass * item.cog[k] for item in items) / mass for k in range(3))
+
+        inertia = [[0.0] * 3 for _ in range(3)]
+        for item in items:
+            d = [item.cog[k] - cog[k] for k in range(3)]
+            d2 = d[0] ** 2 + d[1] ** 2 + d[2] ** 2
+            for row in range(3):
+                for column in range(3):
+                    shift = item.mass * ((d2 if row == column else 0.0) - d[row] * d[column])
+                    inertia[row][column] += item.inertia[row][column] + shift
+
+        return cls(mass, cog, inertia)
+
+    def to_dict(self) -> dict:
+        """
+        :rtype: dict
+        """
+        return {'mass': self.mass, 'cog': list(self.cog), 'inertia': [list(row) for row in self.inertia]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MassProperties':
+        """
+        :param dict data:
+        :rtype: MassProperties
+        """
+        return cls(data['mass'], data['cog'], data['inertia'])
+
+    def __repr__(self):
+        return f'MassProperties(mass={self.mass}, cog={self.cog})'
+
+
+class MassPropertiesRollup:
+    """
+
+    Computes the mass properties of every node of product trees. The mass
+    properties of the part references are kept between calls and, if
+    cache_file is given, between sessions.
+
+    :param str cache_file: (optional) json file caching the mass properties of the parts.
+    """
+
+    def __init__(self, cache_file: Optional[Union[str, Path]] = None):
+        self.cache_file = cache_file
+        self.documents = {}
+        if cache_file is not None and Path(cache_file).is_file():
+            with open(cache_file, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('version') == _cache_version:
+                self.documents = data['documents']
+
+    def save(self) -> None:
+        """
+        Saves the cached mass properties of the parts to cache_file.
+        """
+
+        if self.cache_file is None:
+            return
+
+        with open(self.cache_file, 'w', encoding='utf-8') as file:
+            json.dump({'version': _cache_version, 'documents': self.documents}, file, indent=1)
+
+    def rollup(self, product: 'Product') -> dict:
+        """
+        Returns the mass properties of product and of all the instances below
+        it, keyed by instance path (see
+        :meth:`pycatia.product_structure_interfaces.products.Products.get_absolute_positions`),
+        the top product being ''.
+
+        :param Product product:
+        :rtype: dict(str, MassProperties)
+        """
+
+        paths, components, documents, references = self._read_tree(product)
+
+        if not paths:
+            # the product is a part.
+            reference = product.reference_product
+            leaf = self._leaf_properties([reference.parent.com_object.FullName], [reference.com_object])
+            return {'': leaf[0]}
+
+        local_positions = {path: from_components(values) for path, values in zip(paths, components)}
+        absolute_positions = compose_absolute(local_positions)
+
+        leaves = [i for i, document in enumerate(documents) if document]
+        leaf_properties = self._leaf_properties([documents[i] for i in leaves], [references[i] for i in leaves])
+
+        # the leaves in the axis system of the top product, then summed up the tree.
+        collected = {'': []}
+        for path in paths:
+            collected[path] = []
+        for i, properties in zip(leaves, leaf_properties):
+            path = paths[i]
+            properties = properties.transformed(absolute_positions[path])
+            collected[path].append(properties)
+            parent = path
+            while parent:
+                parent = parent.rpartition('/')[0]
+                collected[parent].append(properties)
+
+        return {path: MassProperties.combine(items) for path, items in collected.items()}
+
+    def _leaf_properties(self, documents: list, references: list) -> list:
+        """
+        Returns the mass properties of the part references, analysing only the
+        documents which aren't cached or were modified.
+        """
+
+        mtimes = {}
+        for document in set(documents):
+            mtimes[document] = os.path.getmtime(document) if os.path.isfile(document) else None
+
+        missing = {}
+        for document, reference in zip(documents, references):
+            cached = self.documents.get(document)
+            if cached is None or mtimes[document] is None or cached['mtime'] != mtimes[document]:
+                missing.setdefault(document, reference)
+
+        if missing:
+            analysed = _analyze_many(list(missing.values()))
+            for document, properties in zip(missing, analysed):
+                data = properties.to_dict()
+                data['mtime'] = mtimes[document]
+                self.documents[document] = data
+            self.save()
+
+        return [MassProperties.from_dict(self.documents[document]) for document in documents]
+
+    @staticmethod
+    def _read_tree(product: 'Product') -> tuple:
+        vba_function_name = 'read_tree'
+        vba_code = f"""
+        Dim paths(), values(), documents(), references(), n
+
+        Sub walk(products, path)
+            Dim components(11)
+            Dim i, product
+            For i = 1 To products.Count
+                Set product = products.Item(i)
+                If n > UBound(paths) Then
+                    ReDim Preserve paths(2 * UBound(paths) + 1)
+                    ReDim Preserve documents(UBound(paths))
+                    ReDim Preserve references(UBound(paths))
+                    ReDim Preserve values(12 * (UBound(paths) + 1) - 1)
+                End If
+                product.Position.GetComponents components
+                paths(n) = path & product.Name
+                For j = 0 To 11
+                    values(12 * n + j) = components(j)
+                Next
+                If product.Products.Count = 0 Then
+                    Set references(n) = product.ReferenceProduct
+                    documents(n) = product.ReferenceProduct.Parent.FullName
+                Else
+                    Set references(n) = Nothing
+                    documents(n) = ""
+                End If
+                n = n + 1
+                walk product.Products, path & product.Name & "/"
+            Next
+        End Sub
+
+        Public Function {vba_function_name}(product)
+            n = 0
+            ReDim paths(63)
+            ReDim documents(63)
+            ReDim references(63)
+            ReDim values(767)
+            walk product.Products, ""
+            {vba_function_name} = Array(paths, values, documents, references, n)
+        End Function
+        """
+
+        system_service = product.application.system_service
+        paths, values, documents, references, count = system_service.evaluate(
+            vba_code, 0, vba_function_name, [product.com_object])
+
+        components = [values[12 * i:12 * i + 12] for i in range(count)]
+        return list(paths[:count]), components, list(documents[:count]), list(references[:count])
+
+
+def _analyze_many(references: list) -> list:
+    """
+    Returns the mass properties of the products (COM objects) read with
+    Analyze in a single call to CATIA.
+    """
+
+    from pycatia.product_structure_interfaces.product import Product
+
+    vba_function_name = 'analyze_many'
+    vba_code = f"""
+    Public Function {vba_function_name}(products)
+        Dim masses(), values(), cog(2), inertia(8)
+        ReDim masses(UBound(products))
+        ReDim values(12 * (UBound(products) + 1) - 1)
+        For i = 0 To UBound(products)
+            Set analyze = products(i).Analyze
+            masses(i) = analyze.Mass
+            analyze.GetGravityCenter cog
+            analyze.GetInertia inertia
+            For j = 0 To 2
+                values(12 * i + j) = cog(j)
+            Next
+            For j = 0 To 8
+                values(12 * i + 3 + j) = inertia(j)
+            Next
+        Next
+        {vba_function_name} = Array(masses, values)
+    End Function
+    """
+
+    system_service = Product(references[0]).application.system_service
+    masses, values = system_service.evaluate(vba_code, 0, vba_function_name, [references])
+
+    return [
+        MassProperties(
+            mass, values[12 * i:12 * i + 3], [value * _inertia_to_kg_mm2 for value in values[12 * i + 3:12 * i + 12]]
+        )
+        for i, mass in enumerate(masses)
+    ]
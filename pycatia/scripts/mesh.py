@@ -0,0 +1,279 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Triangle meshes stored in compact arrays.
+
+    The vertices are a flat array of doubles (x0, y0, z0, x1, ...) and the
+    triangles a flat array of vertex indexes (a0, b0, c0, a1, ...). A mesh can
+    be saved to a file and loaded back memory mapped, or copied to a
+    :class:`multiprocessing.shared_memory.SharedMemory` block and attached to
+    from other processes, in both cases without copying the arrays.
+
+    bounding_box(), transformed() and merge() work on the whole arrays with
+    NumPy when it is installed (``pip install numpy``).
+
+    >>> mesh = part.tessellate()
+    >>> shared_memory = mesh.to_shared_memory()
+    >>> # in a worker process:
+    >>> mesh = Mesh.from_shared_memory(shared_memory.name)
+    >>> mesh.bounding_box()
+    >>> mesh.close()
+    >>> # once the workers are done:
+    >>> shared_memory.close()
+    >>> shared_memory.unlink()
+
+"""
+
+from array import array
+import mmap
+from multiprocessing import shared_memory
+import os
+from pathlib import Path
+import struct
+from typing import Iterable, Optional, Union
+
+# magic, vertex count, triangle count.
+_header = struct.Struct('<8sII')
+_magic = b'PYCMESH1'
+
+
+def _numpy():
+    try:
+        import numpy
+    except ModuleNotFoundError:
+        return None
+    return numpy
+
+
+class Mesh:
+    """
+
+    :param array vertices: flat x, y, z coordinates (array('d') or a memoryview of doubles).
+    :param array triangles: flat vertex indexes (array('i') or a memoryview of ints).
+    """
+
+    def __init__(self, vertices: Optional[Union[array, memoryview]] = None,
+                 triangles: Optional[Union[array, memoryview]] = None):
+        self.vertices = array('d') if vertices is None else vertices
+        self.triangles = array('i') if triangles is None else triangles
+        # the memory map or shared memory holding the arrays.
+        self._buffer = None
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        :rtype: int
+        """
+        return len(self.vertices) // 3
+
+    @property
+    def triangle_count(self) -> int:
+        """
+        :rtype: int
+        """
+        return len(self.triangles) // 3
+
+    def points(self) -> list:
+        """
+        Returns the vertices as (x, y, z) tuples.
+
+        :rtype: list
+        """
+
+        v = self.vertices
+        return [(v[i], v[i + 1], v[i + 2]) for i in range(0, len(v), 3)]
+
+    def triangle_points(self, index: int) -> tuple:
+        """
+        Returns the three vertices of the triangle.
+
+        :param int index:
+        :rtype: tuple
+        """
+
+        v = self.vertices
+        return tuple((v[3 * k], v[3 * k + 1], v[3 * k + 2]) for k in self.triangles[3 * index:3 * index + 3])
+
+    def bounding_box(self) -> tuple:
+        """
+        Returns the axis aligned bounding box, see :func:`pycatia.scripts.geometry.aabb`.
+
+        :rtype: tuple
+        """
+
+        if not len(self.vertices):
+            raise ValueError('The bounding box of no points is undefined.')
+
+        numpy = _numpy()
+        if numpy is not None:
+            points = numpy.frombuffer(self.vertices, dtype=numpy.float64).reshape(-1, 3)
+            return tuple(points.min(axis=0).tolist()), tuple(points.max(axis=0).tolist())
+
+        coordinates = [self.vertices[axis::3] for axis in range(3)]
+        return tuple(min(c) for c in coordinates), tuple(max(c) for c in coordinates)
+
+    def transformed(self, matrix: tuple) -> 'Mesh':
+        """
+        Returns a copy of the mesh moved by the 4x4 matrix (see
+        :mod:`pycatia.scripts.transforms`).
+
+        :param tuple matrix:
+        :rtype: Mesh
+        """
+
+        moved = self.copy()
+        numpy = _numpy()
+        if numpy is not None:
+            points = numpy.frombuffer(moved.vertices, dtype=numpy.float64).reshape(-1, 3)
+            m = numpy.asarray(matrix, dtype=numpy.float64)
+            # in place, the array shares the memory of moved.vertices.
+            points[:] = points @ m[:3, :3].T + m[:3, 3]
+            return moved
+
+        x, y, z = (array('d', self.vertices[axis::3]) for axis in range(3))
+        for axis in range(3):
+            a, b, c, d = matrix[axis]
+            moved.vertices[axis::3] = array('d', [a * xi + b * yi + c * zi + d for xi, yi, zi in zip(x, y, z)])
+
+        return moved
+
+    def copy(self) -> 'Mesh':
+        """
+        Returns a copy of the mesh in memory, independent of the memory map or
+        shared memory the mesh may have been loaded from.
+
+        :rtype: Mesh
+        """
+
+        vertices = array('d')
+        vertices.frombytes(memoryview(self.vertices).cast('B'))
+        triangles = array('i')
+        triangles.frombytes(memoryview(self.triangles).cast('B'))
+        return Mesh(vertices, triangles)
+
+    @classmethod
+    def merge(cls, meshes: Iterable['Mesh']) -> 'Mesh':
+        """
+        Returns a mesh made of the vertices and triangles of meshes.
+
+        :param list meshes:
+        :rtype: Mesh
+        """
+
+        numpy = _numpy()
+        merged = cls()
+        for mesh in meshes:
+            offset = merged.vertex_count
+            merged.vertices.frombytes(memoryview(mesh.vertices).cast('B'))
+            if numpy is not None:
+                triangles = numpy.frombuffer(mesh.triangles, dtype=numpy.intc) + offset
+                merged.triangles.frombytes(triangles.tobytes())
+            else:
+                merged.triangles.extend(array('i', map(offset.__add__, mesh.triangles)))
+
+        return merged
+
+    def to_bytes(self) -> bytes:
+        """
+        :rtype: bytes
+        """
+
+        return b''.join((
+            _header.pack(_magic, self.vertex_count, self.triangle_count),
+            array('d', self.vertices).tobytes(),
+            array('i', self.triangles).tobytes(),
+        ))
+
+    def save(self, file_name: Union[str, Path]) -> None:
+        """
+        Saves the mesh, see :meth:`load`. The file is written next to its
+        destination first so readers never see it partly written.
+
+        :param str file_name:
+        """
+
+        temporary_file = f'{file_name}.tmp'
+        with open(temporary_file, 'wb') as file:
+            file.write(self.to_bytes())
+        os.replace(temporary_file, file_name)
+
+    @classmethod
+    def load(cls, file_name: Union[str, Path]) -> 'Mesh':
+        """
+        Loads a mesh saved with :meth:`save`. The file is memory mapped, the
+        arrays are read from the disk as they are used. Call :meth:`close`
+        when done.
+
+        :param str file_name:
+        :rtype: Mesh
+        """
+
+        with open(file_name, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls._from_buffer(buffer, buffer)
+
+    def to_shared_memory(self) -> shared_memory.SharedMemory:
+        """
+        Copies the mesh to a new shared memory block. Other processes attach to
+        it with :meth:`from_shared_memory` and its name. The caller closes and
+        unlinks the block when the other processes are done.
+
+        :rtype: SharedMemory
+        """
+
+        data = self.to_bytes()
+        block = shared_memory.SharedMemory(create=True, size=len(data))
+        block.buf[:len(data)] = data
+
+        return block
+
+    @classmethod
+    def from_shared_memory(cls, name: str) -> 'Mesh':
+        """
+        Attaches to a mesh copied to shared memory by :meth:`to_shared_memory`.
+        The arrays aren't copied. Call :meth:`close` when done.
+
+        :param str name: the name of the shared memory block.
+        :rtype: Mesh
+        """
+
+        block = shared_memory.SharedMemory(name=name)
+        return cls._from_buffer(block.buf, block)
+
+    @classmethod
+    def _from_buffer(cls, buffer, owner) -> 'Mesh':
+        view = memoryview(buffer)
+        magic, vertex_count, triangle_count = _header.unpack_from(view)
+        if magic != _magic:
+            view.release()
+            owner.close()
+            raise ValueError('The data is not a mesh saved by pycatia.')
+
+        start = _header.size
+        middle = start + 24 * vertex_count
+        end = middle + 12 * triangle_count
+        mesh = cls(view[start:middle].cast('d'), view[middle:end].cast('i'))
+        mesh._buffer = (view, owner)
+
+        return mesh
+
+    def close(self) -> None:
+        """
+        Releases the memory map or the shared memory the mesh was loaded from.
+        The mesh can't be used anymore.
+        """
+
+        if self._buffer is None:
+            return
+
+        view, owner = self._buffer
+        self.vertices.release()
+        self.triangles.release()
+        view.release()
+        owner.close()
+        self._buffer = None
+
+    def __repr__(self):
+        return f'Mesh(vertices={self.vertex_count}, triangles={self.triangle_count})'
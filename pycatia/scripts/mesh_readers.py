@@ -0,0 +1,345 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Readers of the triangle meshes exported by Document.ExportData: STL
+    (binary and ASCII) and VRML 2.0 (.wrl).
+
+    The files are memory mapped. Binary STL records are unpacked straight from
+    the map, ASCII files are parsed a chunk at a time so large files are never
+    loaded in memory as text. The vertices shared by triangles are merged
+    with a hash index, optionally within a tolerance, and the meshes are
+    returned as :class:`pycatia.scripts.mesh.Mesh` compact arrays.
+
+    When NumPy is installed (``pip install numpy``) binary STL files are read
+    with numpy.frombuffer and the vertices merged with numpy.unique, which is
+    much faster for large files. The result is the same without NumPy.
+
+    >>> from pycatia.scripts.mesh_readers import read_mesh
+    >>> document.export_data('c:/temp/part.stl', 'stl')
+    >>> mesh = read_mesh('c:/temp/part.stl')
+
+    The VRML reader reads the IndexedFaceSet nodes and applies the
+    translation, rotation and scale of the Transform nodes containing them.
+    Nodes reused with USE are not read.
+
+"""
+
+from array import array
+import math
+import mmap
+import os
+from pathlib import Path
+import re
+import struct
+from typing import Iterator, Union
+
+from pycatia.scripts.mesh import Mesh
+
+_default_chunk_size = 1 << 22
+_re_stl_vertex = re.compile(rb'vertex\s+(\S+)\s+(\S+)\s+(\S+)', re.IGNORECASE)
+_re_vrml_comment = re.compile(rb'#[^\n]*')
+_re_vrml_token = re.compile(rb'"[^"]*"|[{}\[\]]|[^\s,{}\[\]"#]+')
+
+
+class VertexIndex:
+    """
+
+    Hash index of the vertices of a mesh being built. Vertices closer than
+    tolerance may be merged: the coordinates are rounded to a grid of
+    tolerance, so vertices close to the grid lines may be kept apart.
+
+    :param Mesh mesh: the mesh the vertices are added to.
+    :param float tolerance: 0 merges identical vertices only.
+    """
+
+    def __init__(self, mesh: Mesh, tolerance: float = 0.0):
+        self.mesh = mesh
+        self.tolerance = tolerance
+        self.indexes = {}
+
+    def add(self, x: float, y: float, z: float) -> int:
+        """
+        Returns the index of the vertex, adding it to the mesh if it's new.
+
+        :param float x:
+        :param float y:
+        :param float z:
+        :rtype: int
+        """
+
+        if self.tolerance:
+            key = (round(x / self.tolerance), round(y / self.tolerance), round(z / self.tolerance))
+        else:
+            key = (x, y, z)
+
+        index = self.indexes.get(key)
+        if index is None:
+            index = self.indexes[key] = len(self.indexes)
+            self.mesh.vertices.extend((x, y, z))
+
+        return index
+
+
+def weld(mesh: Mesh, tolerance: float = 0.0) -> Mesh:
+    """
+    Returns a copy of mesh with the duplicate vertices merged and the
+    triangles made degenerate by the merge removed.
+
+    :param Mesh mesh:
+    :param float tolerance:
+    :rtype: Mesh
+    """
+
+    welded = Mesh()
+    index = VertexIndex(welded, tolerance)
+    v = mesh.vertices
+    remap = [index.add(v[i], v[i + 1], v[i + 2]) for i in range(0, len(v), 3)]
+
+    t = mesh.triangles
+    for i in range(0, len(t), 3):
+        a, b, c = remap[t[i]], remap[t[i + 1]], remap[t[i + 2]]
+        if a != b and b != c and a != c:
+            welded.triangles.extend((a, b, c))
+
+    return welded
+
+
+def _chunks(data: mmap.mmap, chunk_size: int) -> Iterator[bytes]:
+    """
+    Yields the content of data in chunks ending at a line end.
+    """
+
+    start = 0
+    size = len(data)
+    while start < size:
+        end = start + chunk_size
+        if end < size:
+            line_end = data.rfind(b'\n', start, end)
+            end = line_end + 1 if line_end >= 0 else data.find(b'\n', end) + 1 or size
+        else:
+            end = size
+        yield data[start:end]
+        start = end
+
+
+def _numpy():
+    try:
+        import numpy
+    except ModuleNotFoundError:
+        return None
+    return numpy
+
+
+def _read_binary_stl_numpy(numpy, data: mmap.mmap, tolerance: float) -> Mesh:
+    """
+    Reads the triangles of a binary STL with NumPy, merging the vertices in
+    the order they are first found as VertexIndex does.
+    """
+
+    record = numpy.dtype([('normal', '<f4', 3), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+    records = numpy.frombuffer(data, dtype=record, count=struct.unpack_from('<I', data, 80)[0], offset=84)
+    points = records['vertices'].reshape(-1, 3).astype(numpy.float64)
+    keys = numpy.round(points / tolerance) if tolerance else points
+
+    _, first, inverse = numpy.unique(keys, axis=0, return_index=True, return_inverse=True)
+    # numpy.unique sorts the vertices, they are numbered in order of appearance instead.
+    order = numpy.argsort(first)
+    rank = numpy.empty_like(order)
+    rank[order] = numpy.arange(len(order))
+
+    mesh = Mesh()
+    mesh.vertices.frombytes(points[first[order]].tobytes())
+    mesh.triangles.frombytes(rank[inverse.reshape(-1)].astype(numpy.intc).tobytes())
+    return mesh
+
+
+def _is_binary_stl(data: mmap.mmap) -> bool:
+    size = len(data)
+    return size >= 84 and size == 84 + 50 * struct.unpack_from('<I', data, 80)[0]
+
+
+def read_stl(file_name: Union[str, Path], tolerance: float = 0.0, chunk_size: int = _default_chunk_size) -> Mesh:
+    """
+    Reads a binary or ASCII STL file. Binary files are read with NumPy when
+    it's installed.
+
+    :param str file_name:
+    :param float tolerance: the distance below which vertices are merged.
+    :param int chunk_size: the size of the chunks ASCII files are parsed by.
+    :rtype: Mesh
+    """
+
+    mesh = Mesh()
+    index = VertexIndex(mesh, tolerance)
+    add = index.add
+    triangles = mesh.triangles
+
+    with open(file_name, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError(f'"{file_name}" is empty.')
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            binary = _is_binary_stl(data)
+            numpy = _numpy() if binary else None
+            if numpy is not None:
+                return _read_binary_stl_numpy(numpy, data, tolerance)
+
+            if binary:
+                # an 80 bytes header, the triangle count then 50 bytes per triangle.
+                with memoryview(data) as view:
+                    for record in struct.iter_unpack('<12fH', view[84:]):
+                        triangles.append(add(record[3], record[4], record[5]))
+                        triangles.append(add(record[6], record[7], record[8]))
+                        triangles.append(add(record[9], record[10], record[11]))
+            else:
+                for chunk in _chunks(data, chunk_size):
+                    for x, y, z in _re_stl_vertex.findall(chunk):
+                        triangles.append(add(float(x), float(y), float(z)))
+
+    if len(triangles) % 3:
+        raise ValueError(f'"{file_name}" has a number of vertices which is not a multiple of 3.')
+
+    return mesh
+
+
+def _vrml_tokens(data: mmap.mmap, chunk_size: int) -> Iterator[bytes]:
+    for chunk in _chunks(data, chunk_size):
+        yield from _re_vrml_token.findall(_re_vrml_comment.sub(b'', chunk))
+
+
+def _transform_matrix(fields: dict) -> tuple:
+    """
+    Returns the 3x4 matrix of a VRML Transform: translation * rotation * scale.
+    """
+
+    tx, ty, tz = fields.get('translation', (0.0, 0.0, 0.0))
+    sx, sy, sz = fields.get('scale', (1.0, 1.0, 1.0))
+    ax, ay, az, angle = fields.get('rotation', (0.0, 0.0, 1.0, 0.0))
+
+    length = math.sqrt(ax * ax + ay * ay + az * az) or 1.0
+    ax, ay, az = ax / length, ay / length, az / length
+    c, s = math.cos(angle), math.sin(angle)
+    t = 1 - c
+    rotation = (
+        (t * ax * ax + c, t * ax * ay - s * az, t * ax * az + s * ay),
+        (t * ax * ay + s * az, t * ay * ay + c, t * ay * az - s * ax),
+        (t * ax * az - s * ay, t * ay * az + s * ax, t * az * az + c),
+    )
+
+    return tuple(
+        (row[0] * sx, row[1] * sy, row[2] * sz, translation)
+        for row, translation in zip(rotation, (tx, ty, tz))
+    )
+
+
+_transform_fields = {b'translation': 3, b'rotation': 4, b'scale': 3}
+
+
+def read_vrml(file_name: Union[str, Path], tolerance: float = 0.0, chunk_size: int = _default_chunk_size) -> Mesh:
+    """
+    Reads the IndexedFaceSet nodes of a VRML 2.0 file. The faces with more
+    than three vertices are split in triangle fans.
+
+    :param str file_name:
+    :param float tolerance: the distance below which vertices are merged.
+    :param int chunk_size: the size of the chunks the file is parsed by.
+    :rtype: Mesh
+    """
+
+    mesh = Mesh()
+    vertices = mesh.vertices
+    triangles = mesh.triangles
+    # the nodes and lists being read: [type, first vertex, fields].
+    stack = []
+    last_word = b''
+
+    with open(file_name, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError(f'"{file_name}" is empty.')
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            tokens = _vrml_tokens(data, chunk_size)
+            for token in tokens:
+                if token == b'{':
+                    stack.append([last_word, len(vertices) // 3, {}])
+                elif token == b'[':
+                    node = stack[-1] if stack else None
+                    if node is not None and node[0] == b'Coordinate' and last_word == b'point':
+                        node[2]['base'] = len(vertices) // 3
+                        for value in tokens:
+                            if value == b']':
+                                break
+                            vertices.append(float(value))
+                        last_word = b''
+                        continue
+                    if node is not None and node[0] == b'IndexedFaceSet' and last_word == b'coordIndex':
+                        indexes = node[2].setdefault('coordIndex', array('i'))
+                        for value in tokens:
+                            if value == b']':
+                                break
+                            indexes.append(int(value))
+                        last_word = b''
+                        continue
+                    stack.append([b'[', len(vertices) // 3, {}])
+                elif token in (b'}', b']'):
+                    if not stack:
+                        raise ValueError(f'"{file_name}" has unbalanced brackets.')
+                    node_type, first_vertex, fields = stack.pop()
+                    if node_type == b'Coordinate' and stack:
+                        stack[-1][2]['base'] = fields.get('base', first_vertex)
+                    elif node_type == b'IndexedFaceSet':
+                        _add_faces(triangles, fields.get('coordIndex', ()), fields.get('base', first_vertex))
+                    elif node_type == b'Transform' and fields:
+                        _transform_vertices(vertices, first_vertex, _transform_matrix(fields))
+                elif token in _transform_fields and stack and stack[-1][0] == b'Transform':
+                    stack[-1][2][token.decode()] = tuple(float(next(tokens)) for _ in range(_transform_fields[token]))
+                else:
+                    last_word = token
+
+    if stack:
+        raise ValueError(f'"{file_name}" has unbalanced brackets.')
+
+    return weld(mesh, tolerance)
+
+
+def _add_faces(triangles: array, coord_index: array, base: int) -> None:
+    face = []
+    for index in coord_index:
+        if index >= 0:
+            face.append(base + index)
+            continue
+        for k in range(1, len(face) - 1):
+            triangles.extend((face[0], face[k], face[k + 1]))
+        face = []
+
+    # the last face may not end with -1.
+    for k in range(1, len(face) - 1):
+        triangles.extend((face[0], face[k], face[k + 1]))
+
+
+def _transform_vertices(vertices: array, first_vertex: int, matrix: tuple) -> None:
+    (a, b, c, d), (e, f, g, h), (i, j, k, m) = matrix
+    for n in range(3 * first_vertex, len(vertices), 3):
+        x, y, z = vertices[n], vertices[n + 1], vertices[n + 2]
+        vertices[n] = a * x + b * y + c * z + d
+        vertices[n + 1] = e * x + f * y + g * z + h
+        vertices[n + 2] = i * x + j * y + k * z + m
+
+
+def read_mesh(file_name: Union[str, Path], tolerance: float = 0.0) -> Mesh:
+    """
+    Reads a mesh file, the reader is chosen from the suffix (.stl, .wrl or .vrml).
+
+    :param str file_name:
+    :param float tolerance: the distance below which vertices are merged.
+    :rtype: Mesh
+    """
+
+    suffix = Path(file_name).suffix.lower()
+    if suffix == '.stl':
+        return read_stl(file_name, tolerance)
+    if suffix in ('.wrl', '.vrml'):
+        return read_vrml(file_name, tolerance)
+
+    raise ValueError(f'Unsupported mesh file "{file_name}", expected .stl, .wrl or .vrml.')
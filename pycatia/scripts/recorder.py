@@ -0,0 +1,283 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Records the calls made on pycatia objects and replays them in CATIA as a
+    single generated VBA routine.
+
+    Creating a feature usually takes several calls to CATIA (add_new_*,
+    append_hybrid_shape, create_reference_from_object, ...). While recording,
+    these calls return symbolic handles instead of going to CATIA. When the
+    recording is committed the calls are written, in the order they were made,
+    into one VBA routine run with a single call to SystemService.Evaluate and
+    the handles are bound to the objects created.
+
+    >>> part = part_document.part
+    >>> hsf = part.hybrid_shape_factory
+    >>> hybrid_body = part.hybrid_bodies.add()
+    >>> with hsf.recording(part, hybrid_body) as tx:
+    >>>     points = []
+    >>>     for x, y, z in coordinates:
+    >>>         point = hsf.add_new_point_coord(x, y, z)
+    >>>         hybrid_body.append_hybrid_shape(point)
+    >>>         points.append(point)
+    >>>     spline = hsf.add_new_spline()
+    >>>     for point in points:
+    >>>         spline.add_point(part.create_reference_from_object(point))
+    >>>     hybrid_body.append_hybrid_shape(spline)
+    >>> part.update()
+    >>> spline.name  # the handles are bound once the recording is committed.
+
+    Only the calls and property assignments are recorded. Reading a property
+    while recording returns a handle which has no value until the recording is
+    committed, so the code in the recording block must not depend on values
+    read from CATIA.
+
+    If a call fails in CATIA the objects created by the previous calls are kept
+    and bound, and a CATIAApplicationException describing the call is raised.
+
+"""
+
+import time
+from typing import TYPE_CHECKING
+
+from pycatia.cat_logger import create_logger
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+if TYPE_CHECKING:
+    from pycatia.system_interfaces.system_service import SystemService
+
+_unbound = object()
+
+
+class RecordedObject:
+    """
+
+    A symbolic handle of a CATIA object while recording: an object passed to
+    the recording, the result of a recorded call or a property of a handle.
+    Once the recording is committed attribute access and calls are forwarded
+    to the CATIA object.
+
+    """
+
+    def __init__(self, recorder: 'Recorder', expression: str, parent: 'RecordedObject' = None, name: str = None):
+        object.__setattr__(self, '_recorder', recorder)
+        object.__setattr__(self, '_expression', expression)
+        object.__setattr__(self, '_parent', parent)
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_value', _unbound)
+
+    def _resolve(self):
+        if self._value is not _unbound:
+            return self._value
+        if self._recorder.state != 'committed':
+            raise CATIAApplicationException(
+                f'{self._expression} has no value, the recording is {self._recorder.state}.')
+        if self._parent is None:
+            raise CATIAApplicationException(f'{self._expression} was not created.')
+
+        # properties are read again on each access.
+        return getattr(self._parent._resolve(), self._name)
+
+    def __getattr__(self, name: str):
+        if self._recorder.recording:
+            if name.startswith('_'):
+                raise AttributeError(name)
+            return RecordedObject(self._recorder, f'{self._expression}.{name}', self, name)
+
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value):
+        if self._recorder.recording:
+            self._recorder.set_property(self, name, value)
+        else:
+            setattr(self._resolve(), name, value)
+
+    def __call__(self, *args):
+        if self._recorder.recording:
+            return self._recorder.call(self, args)
+
+        return self._resolve()(*args)
+
+    def __repr__(self):
+        return f'RecordedObject("{self._expression}")'
+
+
+class Recorder:
+    """
+
+    Records the calls made on pycatia objects, see :mod:`pycatia.scripts.recorder`.
+    Use it as a context manager, the recording is committed on exit or
+    discarded if an exception is raised.
+
+    :param SystemService system_service:
+    :param objects: the pycatia objects (HybridShapeFactory, Part, HybridBody, ...) to record.
+    """
+
+    def __init__(self, system_service: 'SystemService', *objects):
+        self.system_service = system_service
+        self.state = 'idle'
+        self.inputs = []
+        self.statements = []
+        self.handles = []
+        self.seconds = 0.0
+        self.logger = create_logger()
+
+        self._objects = list(objects)
+        self._swapped = []
+
+    @property
+    def recording(self) -> bool:
+        """
+        :rtype: bool
+        """
+        return self.state == 'recording'
+
+    def __enter__(self) -> 'Recorder':
+        self.state = 'recording'
+        for pycatia_object in self._objects:
+            self.record(pycatia_object)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def record(self, pycatia_object):
+        """
+        Records the calls made on pycatia_object until the end of the
+        recording and returns it.
+
+        :param pycatia_object: a pycatia object, Part, HybridBody, ...
+        """
+
+        if not self.recording:
+            raise CATIAApplicationException(
+                f'Objects can only be added while recording, the recording is {self.state}.')
+
+        com_object = pycatia_object.com_object
+        if isinstance(com_object, RecordedObject):
+            return pycatia_object
+
+        handle = RecordedObject(self, self._input(com_object))
+        object.__setattr__(handle, '_value', com_object)
+
+        # the wrappers keep the com object in com_object and in an attribute named after the class.
+        for name, value in list(vars(pycatia_object).items()):
+            if value is com_object:
+                self._swapped.append((pycatia_object, name, value))
+                setattr(pycatia_object, name, handle)
+
+        return pycatia_object
+
+    def call(self, target: RecordedObject, args: tuple) -> RecordedObject:
+        """
+        Records the call target(*args) and returns the handle of its result.
+
+        :param RecordedObject target:
+        :param tuple args:
+        :rtype: RecordedObject
+        """
+
+        arguments = ', '.join(self._argument(arg) for arg in args)
+        handle = RecordedObject(self, f'handles({len(self.handles)})')
+        self.statements.append(f'store {len(self.handles)}, {target._expression}({arguments})')
+        self.handles.append(handle)
+
+        return handle
+
+    def set_property(self, target: RecordedObject, name: str, value) -> None:
+        """
+        Records the assignment target.name = value.
+
+        :param RecordedObject target:
+        :param str name:
+        :param value:
+        """
+
+        argument = self._argument(value)
+        prop = f'{target._expression}.{name}'
+        self.statements.append(f'If IsObject({argument}) Then Set {prop} = {argument} Else {prop} = {argument}')
+
+    def vba_code(self) -> str:
+        """
+        Returns the VBA routine replaying the recorded calls.
+
+        :rtype: str
+        """
+
+        lines = [
+            'Dim handles()',
+            '',
+            'Sub store(n, value)',
+            '    If IsObject(value) Then',
+            '        Set handles(n) = value',
+            '    Else',
+            '        handles(n) = value',
+            '    End If',
+            'End Sub',
+            '',
+            'Public Function replay(inputs)',
+            f'    ReDim handles({len(self.handles)})',
+            '    On Error Resume Next',
+        ]
+        for i, statement in enumerate(self.statements):
+            lines.append(f'    {statement}')
+            lines.append(f'    If Err.Number <> 0 Then replay = Array(handles, {i}, Err.Description): Exit Function')
+        lines.append('    replay = Array(handles, -1, "")')
+        lines.append('End Function')
+
+        return '\n'.join(lines)
+
+    def commit(self) -> None:
+        """
+        Replays the recorded calls in a single call to CATIA and binds the
+        handles to the objects created.
+        """
+
+        self._restore()
+        self.state = 'committed'
+        if not self.statements:
+            return
+
+        start = time.perf_counter()
+        values, failed, message = self.system_service.evaluate(self.vba_code(), 0, 'replay', [self.inputs])
+        self.seconds = time.perf_counter() - start
+
+        for handle, value in zip(self.handles, values):
+            object.__setattr__(handle, '_value', value)
+
+        if failed >= 0:
+            raise CATIAApplicationException(f'Recorded call "{self.statements[failed]}" failed: {message}')
+
+        self.logger.info('Replayed %s recorded calls in %.2fs.', len(self.statements), self.seconds)
+
+    def discard(self) -> None:
+        """
+        Forgets the recorded calls, nothing is sent to CATIA.
+        """
+
+        self._restore()
+        self.state = 'discarded'
+
+    def _restore(self) -> None:
+        for pycatia_object, name, value in reversed(self._swapped):
+            setattr(pycatia_object, name, value)
+        self._swapped = []
+
+    def _input(self, value) -> str:
+        self.inputs.append(value)
+        return f'inputs({len(self.inputs) - 1})'
+
+    def _argument(self, value) -> str:
+        if isinstance(value, RecordedObject):
+            if value._recorder is not self:
+                raise CATIAApplicationException(f'{value} belongs to another recording.')
+            return value._expression
+
+        return self._input(value)
+
+    def __repr__(self):
+        return f'Recorder(state="{self.state}", statements={len(self.statements)})'
@@ -0,0 +1,248 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Static analysis of the knowledgeware relations (formulas, rules, checks,
+    ...) of a document: which parameters each relation reads and writes, the
+    order in which they are evaluated, circular dependencies, the parameters
+    driving many relations and the relations that have no effect.
+
+    The graph is built in a single call to CATIA with
+    :meth:`pycatia.knowledge_interfaces.relations.Relations.dependency_graph`.
+
+    >>> graph = part.relations.dependency_graph()
+    >>> graph.cycles()
+    >>> # [['Formula.3', 'Formula.4']]
+    >>> graph.fan_out()[:3]
+    >>> # [('Part1\\Length', 12), ('Part1\\Width', 4), ('Part1\\Mass', 2)]
+
+"""
+
+from typing import Iterable
+
+
+class RelationGraph:
+    """
+
+    Relations and the parameters they read (inputs) and write (outputs).
+    Relations and parameters are identified by their name.
+
+    """
+
+    def __init__(self):
+        self.relations = {}
+
+    def add_relation(self, relation: str, inputs: Iterable[str] = (), outputs: Iterable[str] = (),
+                     activated: bool = True) -> None:
+        """
+        :param str relation:
+        :param list inputs: the names of the input parameters.
+        :param list outputs: the names of the output parameters.
+        :param bool activated:
+        """
+
+        self.relations[relation] = {
+            'inputs': list(inputs),
+            'outputs': list(outputs),
+            'activated': activated,
+        }
+
+    @property
+    def parameters(self) -> set:
+        """
+        Returns the parameters read or written by the relations.
+
+        :rtype: set(str)
+        """
+
+        return {
+            parameter
+            for relation in self.relations.values()
+            for parameter in relation['inputs'] + relation['outputs']
+        }
+
+    def writers(self) -> dict:
+        """
+        Returns the relations writing each parameter.
+
+        :rtype: dict(str, list(str))
+        """
+
+        writers = {}
+        for name, relation in self.relations.items():
+            for parameter in relation['outputs']:
+                writers.setdefault(parameter, []).append(name)
+
+        return writers
+
+    def readers(self) -> dict:
+        """
+        Returns the relations reading each parameter.
+
+        :rtype: dict(str, list(str))
+        """
+
+        readers = {}
+        for name, relation in self.relations.items():
+            for parameter in relation['inputs']:
+                readers.setdefault(parameter, []).append(name)
+
+        return readers
+
+    def edges(self) -> list:
+        """
+        Returns the edges parameter -> relation -> parameter of the graph.
+
+        :rtype: list(tuple(str, str))
+        """
+
+        edges = []
+        for name, relation in self.relations.items():
+            edges.extend((parameter, name) for parameter in relation['inputs'])
+            edges.extend((name, parameter) for parameter in relation['outputs'])
+
+        return edges
+
+    def dependencies(self, relation: str) -> set:
+        """
+        Returns the relations writing the inputs of relation.
+
+        :param str relation:
+        :rtype: set(str)
+        """
+
+        return self._dependency_map()[relation]
+
+    def _dependency_map(self) -> dict:
+        writers = self.writers()
+        return {
+            name: {writer for parameter in relation['inputs'] for writer in writers.get(parameter, [])}
+            for name, relation in self.relations.items()
+        }
+
+    def cycles(self) -> list:
+        """
+        Returns the groups of relations depending on each other (the strongly
+        connected components of the relation graph, Tarjan's algorithm).
+
+        :rtype: list(list(str))
+        """
+
+        dependencies = {relation: sorted(required) for relation, required in self._dependency_map().items()}
+        index = {}
+        low_link = {}
+        stack = []
+        on_stack = set()
+        cycles = []
+
+        for root in sorted(self.relations):
+            if root in index:
+                continue
+
+            # iterative depth first search, the stack holds (relation, next dependency index).
+            work = [(root, 0)]
+            while work:
+                relation, i = work.pop()
+                if i == 0:
+                    index[relation] = low_link[relation] = len(index)
+                    stack.append(relation)
+                    on_stack.add(relation)
+
+                children = dependencies[relation]
+                if i < len(children):
+                    work.append((relation, i + 1))
+                    child = children[i]
+                    if child not in index:
+                        work.append((child, 0))
+                    elif child in on_stack:
+                        low_link[relation] = min(low_link[relation], index[child])
+                    continue
+
+                if low_link[relation] == index[relation]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == relation:
+                            break
+                    if len(component) > 1 or relation in dependencies[relation]:
+                        cycles.append(sorted(component))
+
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[relation])
+
+        return cycles
+
+    def evaluation_order(self) -> list:
+        """
+        Returns the relations ordered so that every relation comes after the
+        relations writing its inputs. Relations in cycles, or depending on
+        relations in cycles, are left out.
+
+        :rtype: list(str)
+        """
+
+        in_cycles = {relation for cycle in self.cycles() for relation in cycle}
+        dependencies = {
+            relation: required - {relation}
+            for relation, required in self._dependency_map().items() if relation not in in_cycles
+        }
+
+        remaining = {relation: len(required) for relation, required in dependencies.items()}
+        dependents = {relation: [] for relation in dependencies}
+        for relation, required in dependencies.items():
+            for dependency in required:
+                # relations depending on a cycle can't be ordered.
+                if dependency in in_cycles:
+                    remaining[relation] = -1
+                else:
+                    dependents[dependency].append(relation)
+
+        order = []
+        ready = sorted(relation for relation, count in remaining.items() if count == 0)
+        while ready:
+            order.extend(ready)
+            next_ready = []
+            for relation in ready:
+                for dependent in dependents[relation]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_ready.append(dependent)
+            ready = sorted(next_ready)
+
+        return order
+
+    def fan_out(self) -> list:
+        """
+        Returns the parameters and the number of relations reading them, the
+        most read first.
+
+        :rtype: list(tuple(str, int))
+        """
+
+        counts = {parameter: len(set(readers)) for parameter, readers in self.readers().items()}
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def conflicts(self) -> dict:
+        """
+        Returns the parameters written by more than one relation.
+
+        :rtype: dict(str, list(str))
+        """
+
+        return {parameter: writers for parameter, writers in self.writers().items() if len(writers) > 1}
+
+    def dead_relations(self) -> list:
+        """
+        Returns the relations which have no effect: the deactivated relations
+        and the relations with neither inputs nor outputs.
+
+        :rtype: list(str)
+        """
+
+        return sorted(
+            name for name, relation in self.relations.items()
+            if not relation['activated'] or not (relation['inputs'] or relation['outputs'])
+        )
@@ -0,0 +1,495 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Reads STEP files (ISO-10303-21), such as the files written by
+    Document.ExportData(file_name, 'stp'), without CATIA.
+
+    The file is memory mapped and never loaded as a whole. The offsets of the
+    entity instances are indexed as the file is scanned, the scan going only as
+    far as needed to find the entities asked for, and the entities are parsed
+    on access.
+
+    >>> from pycatia.scripts.step_file import StepFile
+    >>> with StepFile('c:/temp/part.stp') as step_file:
+    >>>     step_file.header['FILE_SCHEMA']
+    >>>     step_file.products()
+    >>>     step_file.units()
+    >>>     step_file.type_counts()
+
+    Strings are decoded (\\X\\, \\X2\\ and \\X4\\ encodings), references are
+    :class:`Reference`, enumerations :class:`Enumeration`, booleans bool,
+    $ None and * :data:`derived`.
+
+"""
+
+from array import array
+import mmap
+import os
+from pathlib import Path
+import re
+from typing import Iterator, Optional, Union
+
+_re_entity_start = re.compile(
+    rb"'(?:[^']|'')*'|/\*.*?\*/|#(\d+)\s*=\s*(\(|[A-Za-z_][A-Za-z0-9_]*)",
+    re.DOTALL,
+)
+_re_token = re.compile(
+    rb"(?P<space>(?:\s+|/\*.*?\*/)+)"
+    rb"|(?P<string>'(?:[^']|'')*')"
+    rb"|#(?P<reference>\d+)"
+    rb"|\.(?P<enumeration>[A-Za-z_][A-Za-z0-9_]*)\."
+    rb"|(?P<number>[+-]?\d+(?:\.\d*)?(?:[Ee][+-]?\d+)?)"
+    rb"|(?P<keyword>!?[A-Za-z_][A-Za-z0-9_]*)"
+    rb"|(?P<binary>\"[0-9A-Fa-f]*\")"
+    rb"|(?P<symbol>[(),;=$*])",
+    re.DOTALL,
+)
+_re_string_escape = re.compile(
+    r"\\X2\\((?:[0-9A-F]{4})*)\\X0\\"
+    r"|\\X4\\((?:[0-9A-F]{8})*)\\X0\\"
+    r"|\\X\\([0-9A-F]{2})"
+    r"|\\S\\(.)"
+    r"|\\\\"
+)
+
+_unit_kinds = {
+    'LENGTH_UNIT': 'length',
+    'PLANE_ANGLE_UNIT': 'plane_angle',
+    'SOLID_ANGLE_UNIT': 'solid_angle',
+    'MASS_UNIT': 'mass',
+    'TIME_UNIT': 'time',
+    'AREA_UNIT': 'area',
+    'VOLUME_UNIT': 'volume',
+}
+
+
+class _Derived:
+
+    def __repr__(self):
+        return '*'
+
+
+#: the value of the attributes derived (*).
+derived = _Derived()
+
+
+class Reference(int):
+    """
+    A reference to an entity instance, #id.
+    """
+
+    def __repr__(self):
+        return f'#{int(self)}'
+
+
+class Enumeration(str):
+    """
+    An enumeration value, .NAME.
+    """
+
+    def __repr__(self):
+        return f'.{str(self)}.'
+
+
+class Entity:
+    """
+
+    An entity instance. The complex instances are made of several records,
+    for the simple ones type and arguments are the ones of the single record.
+    The typed parameters, LENGTH_MEASURE(1.0), are entities without id.
+
+    :param int entity_id: None for the typed parameters.
+    :param list records: [(type, [arguments]), ...]
+    """
+
+    def __init__(self, entity_id: Optional[int], records: list):
+        self.id = entity_id
+        self.records = records
+
+    @property
+    def type(self) -> str:
+        """
+        The type of a simple instance or the types of a complex one, joined by spaces.
+
+        :rtype: str
+        """
+        return ' '.join(name for name, _ in self.records)
+
+    @property
+    def types(self) -> tuple:
+        """
+        :rtype: tuple(str)
+        """
+        return tuple(name for name, _ in self.records)
+
+    @property
+    def arguments(self) -> list:
+        """
+        The arguments of the first record.
+
+        :rtype: list
+        """
+        return self.records[0][1]
+
+    def get(self, type_name: str) -> Optional[list]:
+        """
+        Returns the arguments of the record type_name or None.
+
+        :param str type_name:
+        :rtype: list
+        """
+
+        for name, arguments in self.records:
+            if name == type_name:
+                return arguments
+        return None
+
+    def __repr__(self):
+        prefix = '' if self.id is None else f'#{self.id}='
+        return f'{prefix}{self.type}{tuple(self.arguments) if len(self.records) == 1 else ""}'
+
+
+def _decode_string(raw: bytes) -> str:
+    def replace(match):
+        if match.group(1) is not None:
+            return bytes.fromhex(match.group(1)).decode('utf-16-be')
+        if match.group(2) is not None:
+            return bytes.fromhex(match.group(2)).decode('utf-32-be')
+        if match.group(3) is not None:
+            return chr(int(match.group(3), 16))
+        if match.group(4) is not None:
+            return chr(ord(match.group(4)) + 128)
+        return '\\'
+
+    return _re_string_escape.sub(replace, raw[1:-1].replace(b"''", b"'").decode('latin-1'))
+
+
+class StepFile:
+    """
+
+    A STEP file, see :mod:`pycatia.scripts.step_file`. Use it as a context
+    manager or call close() when done.
+
+    :param str file_name:
+    """
+
+    def __init__(self, file_name: Union[str, Path]):
+        self.file_name = file_name
+        with open(file_name, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                raise ValueError(f'"{file_name}" is empty.')
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._data[:12] != b'ISO-10303-21':
+            self._data.close()
+            raise ValueError(f'"{file_name}" is not a STEP file.')
+
+        self._header = None
+        self._data_start = None
+        # entity offsets by id, ids far beyond the others go to the overflow.
+        self._offsets = array('q')
+        self._overflow = {}
+        self._types = {}
+        self._count = 0
+        self._scanner = None
+        self._scanned = False
+
+    def __enter__(self) -> 'StepFile':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self._scanner = None
+        self._data.close()
+
+    @property
+    def header(self) -> dict:
+        """
+        The records of the header section, FILE_DESCRIPTION, FILE_NAME,
+        FILE_SCHEMA, ..., by type.
+
+        :rtype: dict
+        """
+
+        if self._header is None:
+            self._read_header()
+        return self._header
+
+    def _read_header(self) -> None:
+        start = self._data.find(b'HEADER')
+        if start < 0:
+            raise ValueError(f'"{self.file_name}" has no header section.')
+
+        tokens = self._tokens(start)
+        self._header = {}
+        self._expect(tokens, 'keyword', b'HEADER')
+        self._expect(tokens, 'symbol', b';')
+        while True:
+            kind, value, position = next(tokens)
+            if kind == 'keyword' and value == b'ENDSEC':
+                self._expect(tokens, 'symbol', b';')
+                break
+            name = value.decode()
+            self._expect(tokens, 'symbol', b'(')
+            self._header[name] = self._parse_list(tokens)
+            self._expect(tokens, 'symbol', b';')
+
+        self._expect(tokens, 'keyword', b'DATA')
+        kind, value, position = next(tokens)
+        if value == b'(':
+            # DATA (name, schema) in the files with several data sections.
+            self._parse_list(tokens)
+            kind, value, position = next(tokens)
+        self._data_start = position + 1
+
+    def _tokens(self, position: int) -> Iterator[tuple]:
+        """
+        Yields (kind, value, position) from position, without the white spaces.
+        """
+
+        data = self._data
+        size = len(data)
+        while position < size:
+            match = _re_token.match(data, position)
+            if match is None:
+                raise ValueError(f'Unexpected character at {position} in "{self.file_name}".')
+            kind = match.lastgroup
+            if kind != 'space':
+                yield kind, match.group(kind), position
+            position = match.end()
+
+    def _expect(self, tokens: Iterator[tuple], kind: str, value: bytes) -> None:
+        token_kind, token_value, position = next(tokens)
+        if token_kind != kind or token_value != value:
+            raise ValueError(f'Expected "{value.decode()}" at {position} in "{self.file_name}".')
+
+    def _parse_list(self, tokens: Iterator[tuple]) -> list:
+        """
+        Parses the parameters up to the closing parenthesis, the opening one being read.
+        """
+
+        values = []
+        for kind, value, position in tokens:
+            if kind == 'symbol':
+                if value == b')':
+                    return values
+                if value == b',':
+                    continue
+                if value == b'(':
+                    values.append(self._parse_list(tokens))
+                elif value == b'$':
+                    values.append(None)
+                elif value == b'*':
+                    values.append(derived)
+                else:
+                    raise ValueError(f'Unexpected "{value.decode()}" at {position} in "{self.file_name}".')
+            elif kind == 'string':
+                values.append(_decode_string(value))
+            elif kind == 'reference':
+                values.append(Reference(value))
+            elif kind == 'enumeration':
+                name = value.decode().upper()
+                values.append(True if name == 'T' else False if name == 'F' else Enumeration(name))
+            elif kind == 'number':
+                values.append(float(value) if b'.' in value or b'E' in value.upper() else int(value))
+            elif kind == 'binary':
+                values.append(value[1:-1].decode())
+            elif kind == 'keyword':
+                # a typed parameter.
+                self._expect(tokens, 'symbol', b'(')
+                values.append(Entity(None, [(value.decode(), self._parse_list(tokens))]))
+
+        raise ValueError(f'Unexpected end of "{self.file_name}".')
+
+    def _parse_entity(self, entity_id: int, position: int) -> Entity:
+        tokens = self._tokens(position)
+        self._expect(tokens, 'reference', str(entity_id).encode())
+        self._expect(tokens, 'symbol', b'=')
+        kind, value, position = next(tokens)
+        if kind == 'keyword':
+            self._expect(tokens, 'symbol', b'(')
+            return Entity(entity_id, [(value.decode(), self._parse_list(tokens))])
+
+        # a complex instance: (A(...) B(...) ...).
+        records = []
+        for kind, value, position in tokens:
+            if kind == 'symbol' and value == b')':
+                return Entity(entity_id, records)
+            if kind != 'keyword':
+                raise ValueError(f'Unexpected "{value.decode()}" at {position} in "{self.file_name}".')
+            self._expect(tokens, 'symbol', b'(')
+            records.append((value.decode(), self._parse_list(tokens)))
+
+        raise ValueError(f'Unexpected end of "{self.file_name}".')
+
+    def _offset(self, entity_id: int) -> int:
+        if entity_id < len(self._offsets):
+            return self._offsets[entity_id]
+        return self._overflow.get(entity_id, -1)
+
+    def _add_offset(self, entity_id: int, offset: int, type_name: bytes) -> None:
+        offsets = self._offsets
+        if entity_id >= len(offsets) and entity_id < 2 * len(offsets) + (1 << 16):
+            offsets.extend([-1] * (max(entity_id + 1, 2 * len(offsets)) - len(offsets)))
+        if entity_id < len(offsets):
+            offsets[entity_id] = offset
+        else:
+            self._overflow[entity_id] = offset
+
+        if type_name == b'(':
+            types = self._parse_entity(entity_id, offset).types
+        else:
+            types = (type_name.decode(),)
+        for name in types:
+            self._types.setdefault(name, array('q')).append(entity_id)
+        self._count += 1
+
+    def _scan(self, entity_id: Optional[int] = None) -> None:
+        """
+        Indexes the entities until entity_id is found, to the end of the file
+        if None.
+        """
+
+        if self._scanned:
+            return
+        if self._scanner is None:
+            if self._data_start is None:
+                self._read_header()
+            self._scanner = _re_entity_start.finditer(self._data, self._data_start)
+
+        for match in self._scanner:
+            if match.group(1) is None:
+                # a string or a comment.
+                continue
+            found = int(match.group(1))
+            self._add_offset(found, match.start(), match.group(2))
+            if found == entity_id:
+                return
+
+        self._scanned = True
+        self._scanner = None
+
+    def __getitem__(self, entity_id: int) -> Entity:
+        """
+        :param int entity_id:
+        :rtype: Entity
+        """
+
+        # a Reference is an id.
+        entity_id = int(entity_id)
+        offset = self._offset(entity_id)
+        if offset < 0:
+            self._scan(entity_id)
+            offset = self._offset(entity_id)
+            if offset < 0:
+                raise KeyError(f'#{entity_id} is not in "{self.file_name}".')
+
+        return self._parse_entity(entity_id, offset)
+
+    def __len__(self) -> int:
+        self._scan()
+        return self._count
+
+    def ids(self, type_name: str) -> list:
+        """
+        Returns the ids of the entity instances of type_name (upper case).
+
+        :param str type_name:
+        :rtype: list(int)
+        """
+
+        self._scan()
+        return list(self._types.get(type_name, ()))
+
+    def find(self, type_name: str) -> Iterator[Entity]:
+        """
+        Yields the entity instances of type_name (upper case).
+
+        :param str type_name:
+        :rtype: Iterator(Entity)
+        """
+
+        for entity_id in self.ids(type_name):
+            yield self[entity_id]
+
+    def type_counts(self) -> dict:
+        """
+        Returns the number of entity instances of each type.
+
+        :rtype: dict
+        """
+
+        self._scan()
+        return {name: len(ids) for name, ids in self._types.items()}
+
+    def products(self) -> list:
+        """
+        Returns the products, CATIA writes a product per part number.
+
+        :rtype: list(dict)
+        :return: [{'entity': #id, 'id': part number, 'name': ..., 'description': ...}, ...]
+        """
+
+        return [
+            {'entity': entity.id, 'id': entity.arguments[0], 'name': entity.arguments[1],
+             'description': entity.arguments[2]}
+            for entity in self.find('PRODUCT')
+        ]
+
+    def shape_representations(self) -> list:
+        """
+        Returns the shape representations (SHAPE_REPRESENTATION,
+        ADVANCED_BREP_SHAPE_REPRESENTATION, ...).
+
+        :rtype: list(dict)
+        :return: [{'entity': #id, 'type': ..., 'name': ..., 'items': item count, 'context': #id}, ...]
+        """
+
+        self._scan()
+        representations = []
+        for type_name in sorted(self._types):
+            if not type_name.endswith('SHAPE_REPRESENTATION'):
+                continue
+            for entity in self.find(type_name):
+                arguments = entity.get(type_name)
+                representations.append({
+                    'entity': entity.id, 'type': type_name, 'name': arguments[0], 'items': len(arguments[1]),
+                    'context': arguments[2],
+                })
+
+        return representations
+
+    def units(self) -> list:
+        """
+        Returns the units of each representation context, by kind. The SI
+        units are named from their prefix and name ('millimetre', 'radian'),
+        the conversion based units by their name ('INCH', 'DEGREE').
+
+        :rtype: list(dict)
+        :return: [{'entity': #id, 'length': 'millimetre', 'plane_angle': 'radian', ...}, ...]
+        """
+
+        contexts = []
+        for context in self.find('GLOBAL_UNIT_ASSIGNED_CONTEXT'):
+            units = {'entity': context.id}
+            for reference in context.get('GLOBAL_UNIT_ASSIGNED_CONTEXT')[0]:
+                unit = self[reference]
+                kind = next((_unit_kinds[name] for name in unit.types if name in _unit_kinds), unit.type.lower())
+                si_unit = unit.get('SI_UNIT')
+                conversion = unit.get('CONVERSION_BASED_UNIT')
+                if si_unit is not None:
+                    prefix, name = si_unit[-2:]
+                    units[kind] = f'{prefix or ""}{name}'.lower()
+                elif conversion is not None:
+                    units[kind] = conversion[0]
+                else:
+                    units[kind] = unit.type
+            contexts.append(units)
+
+        return contexts
+
+    def __repr__(self):
+        return f'StepFile("{self.file_name}")'
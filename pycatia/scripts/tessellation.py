@@ -0,0 +1,325 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Tessellation of parts and products.
+
+    The parts are exported to STL with Document.ExportData and read back into
+    a :class:`pycatia.scripts.mesh.Mesh`. The meshes are cached by document
+    and modification time so unchanged parts aren't exported again. A product
+    is tessellated by exporting each of its part documents once, in a single
+    call to CATIA, and placing a copy of the part mesh for each instance.
+
+    >>> mesh = part_document.part.tessellate()
+    >>> mesh = product_document.product.tessellate()
+
+    The accuracy of the tessellation is the one of the STL export, set in the
+    CATIA options. Documents with unsaved changes are exported but not cached.
+
+"""
+
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from pycatia.cat_logger import create_logger
+from pycatia.enumeration.int_enums import cat_vis_property_show
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.scripts.mesh import Mesh
+from pycatia.scripts.mesh_readers import read_stl
+from pycatia.scripts.transforms import compose_absolute, from_components
+
+if TYPE_CHECKING:
+    from pycatia.in_interfaces.application import Application
+    from pycatia.mec_mod_interfaces.part import Part
+    from pycatia.product_structure_interfaces.product import Product
+
+
+class MeshCache:
+    """
+
+    Meshes saved in folder, keyed by document, modification time and bodies.
+    The cached meshes are read into memory and the files closed, so they can be
+    evicted or rewritten while the meshes are in use.
+
+    :param str folder: (optional) defaults to pycatia/meshes in the temporary folder.
+    """
+
+    def __init__(self, folder: Optional[Union[str, Path]] = None):
+        self.folder = Path(folder or Path(tempfile.gettempdir(), 'pycatia', 'meshes'))
+
+    def file_name(self, document: str, bodies: Iterable[str] = ()) -> Optional[Path]:
+        """
+        Returns the cache file of the mesh of document, None if the document
+        isn't saved on the disk.
+
+        :param str document: the full name of the document.
+        :param list bodies: the names of the bodies tessellated, all if empty.
+        :rtype: Path
+        """
+
+        if not os.path.isfile(document):
+            return None
+
+        key = '|'.join([document, str(os.path.getmtime(document)), *bodies])
+        return Path(self.folder, f'{hashlib.sha1(key.encode("utf-8")).hexdigest()}.mesh')
+
+    def get(self, document: str, bodies: Iterable[str] = ()) -> Optional[Mesh]:
+        """
+        :param str document:
+        :param list bodies:
+        :rtype: Mesh
+        """
+
+        file_name = self.file_name(document, bodies)
+        if file_name is None or not file_name.is_file():
+            return None
+
+        mesh = Mesh.load(file_name)
+        try:
+            return mesh.copy()
+        finally:
+            mesh.close()
+
+    def put(self, document: str, mesh: Mesh, bodies: Iterable[str] = ()) -> None:
+        """
+        :param str document:
+        :param Mesh mesh:
+        :param list bodies:
+        """
+
+        file_name = self.file_name(document, bodies)
+        if file_name is None:
+            return
+        self.folder.mkdir(parents=True, exist_ok=True)
+        mesh.save(file_name)
+
+    def clear(self) -> None:
+        """
+        Deletes the cached meshes.
+        """
+
+        for file_name in self.folder.glob('*.mesh'):
+            file_name.unlink()
+
+
+_default_cache = MeshCache()
+_logger = create_logger()
+
+
+def tessellate_part(part: 'Part', bodies: Optional[list] = None, cache: Optional[MeshCache] = None) -> Mesh:
+    """
+    Returns the mesh of the part, see :meth:`pycatia.mec_mod_interfaces.part.Part.tessellate`.
+
+    :param Part part:
+    :param list bodies: (optional) the bodies and geometrical sets to tessellate.
+    :param MeshCache cache: (optional)
+    :rtype: Mesh
+    """
+
+    from pycatia.mec_mod_interfaces.part_document import PartDocument
+
+    cache = cache or _default_cache
+    document = PartDocument(part.com_object.Parent)
+    full_name = document.full_name
+    names = sorted(body.name for body in bodies) if bodies else []
+    cacheable = document.is_saved
+
+    if cacheable:
+        mesh = cache.get(full_name, names)
+        if mesh is not None:
+            return mesh
+
+    hidden = []
+    if bodies:
+        # only the shown geometry is exported, the other bodies are hidden for the export.
+        selection = document.selection
+        kept = {body.name for body in bodies}
+        for collection in (part.bodies, part.hybrid_bodies):
+            for body in collection:
+                if body.name in kept:
+                    continue
+                selection.clear()
+                selection.add(body)
+                if selection.vis_properties.get_show() == cat_vis_property_show.catVisPropertyShowAttr:
+                    hidden.append(body)
+        selection.clear()
+
+    folder = tempfile.mkdtemp(prefix='pycatia_')
+    try:
+        file_name = str(Path(folder, 'part.stl'))
+        _export_stl(part.application, [document.com_object], [file_name], hidden)
+        if not os.path.isfile(file_name):
+            raise CATIAApplicationException(f'Could not export "{full_name}" to STL.')
+        mesh = read_stl(file_name)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    if cacheable:
+        cache.put(full_name, mesh, names)
+
+    return mesh
+
+
+def tessellate_product(product: 'Product', cache: Optional[MeshCache] = None) -> Mesh:
+    """
+    Returns the mesh of the product, see
+    :meth:`pycatia.product_structure_interfaces.product.Product.tessellate`.
+
+    :param Product product:
+    :param MeshCache cache: (optional)
+    :rtype: Mesh
+    """
+
+    cache = cache or _default_cache
+    paths, components, full_names, documents, saved = _read_tree(product)
+
+    if not paths:
+        # the product of a part document.
+        from pycatia.mec_mod_interfaces.part_document import PartDocument
+        document = product.com_object.ReferenceProduct.Parent
+        if document.Name.lower().endswith('.catpart'):
+            return tessellate_part(PartDocument(document).part, cache=cache)
+        return Mesh()
+
+    local_positions = {path: from_components(values) for path, values in zip(paths, components)}
+    absolute_positions = compose_absolute(local_positions)
+
+    meshes = {}
+    missing = {}
+    for full_name, document, is_saved in zip(full_names, documents, saved):
+        if not full_name or full_name in meshes or full_name in missing:
+            continue
+        mesh = cache.get(full_name) if is_saved else None
+        if mesh is None:
+            missing[full_name] = (document, is_saved)
+        else:
+            meshes[full_name] = mesh
+
+    if missing:
+        folder = tempfile.mkdtemp(prefix='pycatia_')
+        try:
+            file_names = [str(Path(folder, f'{i}.stl')) for i in range(len(missing))]
+            _export_stl(product.application, [document for document, _ in missing.values()], file_names)
+            for (full_name, (_, is_saved)), file_name in zip(missing.items(), file_names):
+                if not os.path.isfile(file_name):
+                    _logger.warning('Could not export "%s" to STL.', full_name)
+                    continue
+                meshes[full_name] = read_stl(file_name)
+                if is_saved:
+                    cache.put(full_name, meshes[full_name])
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    return Mesh.merge(
+        meshes[full_name].transformed(absolute_positions[path])
+        for path, full_name in zip(paths, full_names) if full_name in meshes
+    )
+
+
+def _export_stl(application: 'Application', documents: list, file_names: list, hidden: Iterable = ()) -> None:
+    """
+    Exports the documents to STL in a single call to CATIA. The bodies hidden
+    are hidden during the export.
+    """
+
+    vba_function_name = 'export_stl'
+    vba_code = f"""
+    Public Function {vba_function_name}(documents, file_names, hidden)
+        If UBound(hidden) >= 0 Then
+            Set selection = documents(0).Selection
+            selection.Clear
+            For i = 0 To UBound(hidden)
+                selection.Add hidden(i)
+            Next
+            selection.VisProperties.SetShow {cat_vis_property_show.catVisPropertyNoShowAttr:d}
+        End If
+        On Error Resume Next
+        For i = 0 To UBound(documents)
+            documents(i).ExportData file_names(i), "stl"
+            Err.Clear
+        Next
+        On Error GoTo 0
+        If UBound(hidden) >= 0 Then
+            selection.VisProperties.SetShow {cat_vis_property_show.catVisPropertyShowAttr:d}
+            selection.Clear
+        End If
+        {vba_function_name} = UBound(documents) + 1
+    End Function
+    """
+
+    display_file_alerts = application.display_file_alerts
+    application.display_file_alerts = False
+    try:
+        application.system_service.evaluate(
+            vba_code, 0, vba_function_name,
+            [documents, file_names, [body.com_object for body in hidden]])
+    finally:
+        application.display_file_alerts = display_file_alerts
+
+
+def _read_tree(product: 'Product') -> tuple:
+    """
+    Returns the instance paths, position components, part document full names
+    (empty for the products), part documents and saved states of the tree
+    below product, read in a single call to CATIA.
+    """
+
+    vba_function_name = 'read_tree'
+    vba_code = f"""
+    Dim paths(), values(), full_names(), documents(), saved(), n
+
+    Sub walk(products, path)
+        Dim components(11)
+        Dim i, product
+        For i = 1 To products.Count
+            Set product = products.Item(i)
+            If n > UBound(paths) Then
+                ReDim Preserve paths(2 * UBound(paths) + 1)
+                ReDim Preserve full_names(UBound(paths))
+                ReDim Preserve documents(UBound(paths))
+                ReDim Preserve saved(UBound(paths))
+                ReDim Preserve values(12 * (UBound(paths) + 1) - 1)
+            End If
+            product.Position.GetComponents components
+            paths(n) = path & product.Name
+            For j = 0 To 11
+                values(12 * n + j) = components(j)
+            Next
+            full_names(n) = ""
+            Set documents(n) = Nothing
+            saved(n) = False
+            If product.Products.Count = 0 Then
+                Set document = product.ReferenceProduct.Parent
+                If TypeName(document) = "PartDocument" Then
+                    full_names(n) = document.FullName
+                    Set documents(n) = document
+                    saved(n) = document.Saved
+                End If
+            End If
+            n = n + 1
+            walk product.Products, path & product.Name & "/"
+        Next
+    End Sub
+
+    Public Function {vba_function_name}(product)
+        n = 0
+        ReDim paths(63)
+        ReDim full_names(63)
+        ReDim documents(63)
+        ReDim saved(63)
+        ReDim values(767)
+        walk product.Products, ""
+        {vba_function_name} = Array(paths, values, full_names, documents, saved, n)
+    End Function
+    """
+
+    system_service = product.application.system_service
+    paths, values, full_names, documents, saved, count = system_service.evaluate(
+        vba_code, 0, vba_function_name, [product.com_object])
+
+    components = [values[12 * i:12 * i + 12] for i in range(count)]
+    return list(paths[:count]), components, list(full_names[:count]), list(documents[:count]), list(saved[:count])
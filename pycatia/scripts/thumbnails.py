@@ -0,0 +1,372 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Creates thumbnails of CATParts and CATProducts.
+
+    The viewer settings shared by the session (file alerts, compass) are set
+    once for all the documents and each document is captured from several
+    camera presets. CATIA can only capture to BMP, the conversion to PNG or
+    WebP is done by a pool of processes while CATIA captures the next document.
+
+    The thumbnails already created are recorded in a cache file keyed by the
+    hash of the documents so unchanged documents are skipped on the next run.
+
+    >>> from pathlib import Path
+    >>> from pycatia import catia
+    >>> from pycatia.scripts.thumbnails import ThumbnailService
+    >>> files = Path('//vault/project').rglob('*.CATPart')
+    >>> with ThumbnailService(catia(), 'thumbnails', formats=('png', 'webp')) as service:
+    >>>     thumbnails = service.create_many(files)
+
+    The conversion requires Pillow (``pip install pillow``).
+
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+import shutil
+import time
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from pycatia.cat_logger import create_logger
+from pycatia.enumeration.int_enums import cat_capture_format
+from pycatia.enumeration.int_enums import cat_specs_and_geom_window_layout
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.in_interfaces.specs_and_geom_window import SpecsAndGeomWindow
+from pycatia.in_interfaces.viewer_3d import Viewer3D
+from pycatia.product_structure_interfaces.product import Product
+from pycatia.product_structure_interfaces.product_document import ProductDocument
+from pycatia.scripts.file_hashes import file_hash
+from pycatia.scripts.file_hashes import output_stem
+
+if TYPE_CHECKING:
+    from pycatia.in_interfaces.application import Application
+
+#: camera presets, name: (sight direction, up direction).
+default_presets = {
+    'iso': ((-1, -1, -1), (-1, -1, 2)),
+}
+
+#: more camera presets.
+standard_presets = {
+    'iso': ((-1, -1, -1), (-1, -1, 2)),
+    'front': ((-1, 0, 0), (0, 0, 1)),
+    'right': ((0, -1, 0), (0, 0, 1)),
+    'top': ((0, 0, -1), (0, 1, 0)),
+}
+
+_cache_version = 1
+_white = (1, 1, 1)
+
+
+def _variant(thumbnail: str) -> str:
+    # '<stem> <path hash> - <preset>.<format>' -> '<preset>.<format>'
+    return Path(thumbnail).name.rsplit(' - ', 1)[-1]
+
+
+def convert_image(bmp_file: str, output_files: list, delete: bool = True) -> list:
+    """
+
+    Converts the BMP image to the output files, the format being given by the
+    file suffix (.png, .webp, .jpg, ...). Run in the worker processes of
+    ThumbnailService.
+
+    :param str bmp_file:
+    :param list output_files:
+    :param bool delete: delete the BMP file once converted.
+    :rtype: list
+    """
+
+    try:
+        from PIL import Image
+    except ModuleNotFoundError:
+        raise CATIAApplicationException('Pillow is required to convert the images: pip install pillow.')
+
+    with Image.open(bmp_file) as image:
+        for output_file in output_files:
+            image.save(output_file)
+
+    if delete:
+        os.remove(bmp_file)
+
+    return output_files
+
+
+class ThumbnailCache:
+    """
+
+    Records the thumbnails created for each document content (hash). The hash
+    of a file is only computed again when its size or modification time change.
+
+    """
+
+    def __init__(self, cache_file: Optional[Union[str, Path]] = None):
+        self.cache_file = cache_file
+        self.files = {}
+        self.thumbnails = {}
+        if cache_file is not None and Path(cache_file).is_file():
+            with open(cache_file, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('version') == _cache_version:
+                self.files = data['files']
+                self.thumbnails = data['thumbnails']
+
+    def get_hash(self, file_name: Union[str, Path]) -> str:
+        """
+        :param str file_name:
+        :rtype: str
+        """
+
+        stat = os.stat(file_name)
+        key = str(file_name)
+        entry = self.files.get(key)
+        if entry is None or entry['mtime'] != stat.st_mtime or entry['size'] != stat.st_size:
+            entry = {'mtime': stat.st_mtime, 'size': stat.st_size, 'hash': file_hash(file_name)}
+            self.files[key] = entry
+
+        return entry['hash']
+
+    def get_thumbnails(self, content_hash: str) -> list:
+        """
+        Returns the existing thumbnails created for the content hash.
+
+        :param str content_hash:
+        :rtype: list(str)
+        """
+
+        return [file for file in self.thumbnails.get(content_hash, []) if os.path.isfile(file)]
+
+    def add_thumbnails(self, content_hash: str, thumbnails: list) -> None:
+        """
+        :param str content_hash:
+        :param list thumbnails:
+        """
+
+        files = self.thumbnails.setdefault(content_hash, [])
+        files.extend(str(thumbnail) for thumbnail in thumbnails if str(thumbnail) not in files)
+
+    def save(self) -> None:
+        if self.cache_file is None:
+            return
+
+        data = {'version': _cache_version, 'files': self.files, 'thumbnails': self.thumbnails}
+        temporary_file = f'{self.cache_file}.tmp'
+        with open(temporary_file, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(temporary_file, self.cache_file)
+
+
+class ThumbnailService:
+    """
+
+    Captures thumbnails of documents with a CATIA session.
+
+    The thumbnails are named <file stem> <path hash> - <preset>.<format> in
+    output_folder, the path hash being the start of the sha1 of the full path
+    of the document.
+
+    :param Application application:
+    :param str output_folder:
+    :param dict presets: camera presets, defaults to :data:`default_presets`.
+    :param tuple formats: the formats of the thumbnails, a format supported by Pillow.
+    :param int workers: the number of conversion processes, defaults to the number of CPUs.
+    :param str cache_file: (optional) defaults to thumbnails.json in output_folder.
+    """
+
+    def __init__(self, application: 'Application', output_folder: Union[str, Path], presets: Optional[dict] = None,
+                 formats: tuple = ('png',), workers: Optional[int] = None,
+                 cache_file: Optional[Union[str, Path]] = None):
+        self.application = application
+        self.output_folder = Path(output_folder)
+        self.presets = presets or default_presets
+        self.formats = formats
+        self.workers = workers
+        self.cache = ThumbnailCache(cache_file or Path(self.output_folder, 'thumbnails.json'))
+        self.logger = create_logger()
+        self.statistics = {'captured': 0, 'skipped': 0, 'failed': 0, 'capture_time': 0.0}
+
+        self._executor = None
+        self._pending = []
+        self._display_file_alerts = None
+
+    def __enter__(self) -> 'ThumbnailService':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Sets the session state shared by all the captures and starts the
+        conversion processes.
+        """
+
+        self.output_folder.mkdir(parents=True, exist_ok=True)
+        self._executor = ProcessPoolExecutor(self.workers)
+
+        self._display_file_alerts = self.application.display_file_alerts
+        self.application.display_file_alerts = False
+        # toggles the compass off.
+        self.application.start_command('Compass')
+
+    def stop(self) -> None:
+        """
+        Waits for the conversions, saves the cache and restores the session state.
+        """
+
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+            self.application.start_command('Compass')
+            self.application.display_file_alerts = self._display_file_alerts
+
+    def thumbnail_names(self, file_name: Union[str, Path]) -> dict:
+        """
+        Returns the thumbnail file names of the document for each preset.
+
+        :param str file_name:
+        :rtype: dict
+        """
+
+        stem = output_stem(file_name)
+        return {
+            preset: [
+                str(Path(self.output_folder, f'{stem} - {preset}.{image_format}')) for image_format in self.formats
+            ]
+            for preset in self.presets
+        }
+
+    def is_up_to_date(self, file_name: Union[str, Path]) -> bool:
+        """
+        Returns True if the thumbnails of the document exist and were created
+        from the current content of the document.
+
+        :param str file_name:
+        :rtype: bool
+        """
+
+        existing = set(self.cache.get_thumbnails(self.cache.get_hash(file_name)))
+        return all(name in existing for names in self.thumbnail_names(file_name).values() for name in names)
+
+    def create(self, file_name: Union[str, Path]) -> list:
+        """
+
+        Creates the thumbnails of the document and returns their file names.
+        The conversion may not be finished when this returns, see wait().
+
+        :param str file_name:
+        :rtype: list(str)
+        """
+
+        if self._executor is None:
+            raise CATIAApplicationException('The thumbnail service must be started, use it as a context manager.')
+
+        content_hash = self.cache.get_hash(file_name)
+        stem = output_stem(file_name)
+        names = self.thumbnail_names(file_name)
+        thumbnails = [name for preset_names in names.values() for name in preset_names]
+        existing = self.cache.get_thumbnails(content_hash)
+
+        if all(name in existing for name in thumbnails):
+            self.statistics['skipped'] += 1
+            return thumbnails
+
+        # a copy of the document has already been captured, its thumbnails are reused.
+        copies = {_variant(file): file for file in existing}
+        if all(_variant(name) in copies for name in thumbnails):
+            for name in thumbnails:
+                shutil.copyfile(copies[_variant(name)], name)
+            self.cache.add_thumbnails(content_hash, thumbnails)
+            self.statistics['skipped'] += 1
+            return thumbnails
+
+        start = time.perf_counter()
+        document = self.application.documents.open(file_name)
+        try:
+            if Path(file_name).suffix.lower() == '.catproduct':
+                Product.activate_terminal_node(ProductDocument(document.com_object).product.products)
+
+            window = self.application.active_window
+            SpecsAndGeomWindow(window.com_object).layout = cat_specs_and_geom_window_layout.catWindowGeomOnly
+            viewer = Viewer3D(window.active_viewer.com_object)
+            viewer.put_background_color(_white)
+            viewer.full_screen = True
+            viewpoint = viewer.viewpoint_3d
+            document.selection.clear()
+
+            for preset, (sight, up) in self.presets.items():
+                viewpoint.put_sight_direction(sight)
+                viewpoint.put_up_direction(up)
+                viewer.reframe()
+                viewer.zoom_in()
+
+                bmp_file = str(Path(self.output_folder, f'{stem} - {preset}.bmp'))
+                viewer.capture_to_file(cat_capture_format.catCaptureFormatBMP, bmp_file)
+                future = self._executor.submit(convert_image, bmp_file, names[preset])
+                self._pending.append((future, content_hash))
+
+            viewer.full_screen = False
+        finally:
+            document.close()
+
+        self.statistics['captured'] += 1
+        self.statistics['capture_time'] += time.perf_counter() - start
+
+        return thumbnails
+
+    def create_many(self, file_names: Iterable[Union[str, Path]]) -> dict:
+        """
+
+        Creates the thumbnails of the documents and waits for the conversions.
+        The documents that fail to open or capture are logged and skipped.
+
+        :param list file_names:
+        :rtype: dict
+        :return: {file_name: [thumbnail file names]}
+        """
+
+        thumbnails = {}
+        for file_name in file_names:
+            try:
+                thumbnails[str(file_name)] = self.create(file_name)
+            except Exception as e:
+                self.statistics['failed'] += 1
+                self.logger.warning('Could not create the thumbnails of "%s": %s', file_name, e)
+
+            self._collect(wait=False)
+
+        self.wait()
+        self.logger.info('Thumbnails: %(captured)s captured, %(skipped)s skipped, %(failed)s failed.', self.statistics)
+
+        return thumbnails
+
+    def wait(self) -> None:
+        """
+        Waits for the pending conversions and saves the cache.
+        """
+
+        self._collect(wait=True)
+        self.cache.save()
+
+    def _collect(self, wait: bool) -> None:
+        pending = []
+        for future, content_hash in self._pending:
+            if not wait and not future.done():
+                pending.append((future, content_hash))
+                continue
+            self._add_result(future, content_hash)
+
+        self._pending = pending
+
+    def _add_result(self, future: Future, content_hash: str) -> None:
+        try:
+            self.cache.add_thumbnails(content_hash, future.result())
+        except Exception as e:
+            self.statistics['failed'] += 1
+            self.logger.warning('Could not convert the thumbnail: %s', e)
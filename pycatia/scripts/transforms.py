@@ -0,0 +1,156 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Helpers to work with the transformation matrices of product positions
+    without calls to CATIA.
+
+    CATIA describes a position (see :meth:`Position.get_components`) with 12
+    components: the three columns of the rotation matrix followed by the
+    translation vector. pycatia represents them as 4x4 row-major matrices
+    (tuple of 4 rows) so positions can be composed by multiplication.
+
+    >>> from pycatia.scripts.transforms import from_components, multiply
+    >>> parent = from_components(parent_product.position.get_components())
+    >>> child = from_components(child_product.position.get_components())
+    >>> absolute = multiply(parent, child)
+
+"""
+
+from typing import Iterable
+
+identity = (
+    (1.0, 0.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0, 0.0),
+    (0.0, 0.0, 0.0, 1.0),
+)
+
+
+def from_components(components: Iterable) -> tuple:
+    """
+
+    Converts the 12 components of a CATIA position into a 4x4 matrix.
+
+    :param tuple components: the rotation columns followed by the translation.
+    :rtype: tuple
+    """
+
+    c = tuple(components)
+    if len(c) != 12:
+        raise ValueError(f'A position has 12 components, {len(c)} given.')
+
+    return (
+        (c[0], c[3], c[6], c[9]),
+        (c[1], c[4], c[7], c[10]),
+        (c[2], c[5], c[8], c[11]),
+        (0.0, 0.0, 0.0, 1.0),
+    )
+
+
+def to_components(matrix: tuple) -> tuple:
+    """
+
+    Converts a 4x4 matrix into the 12 components of a CATIA position.
+
+    :param tuple matrix:
+    :rtype: tuple
+    """
+
+    return tuple(matrix[row][column] for column in range(4) for row in range(3))
+
+
+def multiply(a: tuple, b: tuple) -> tuple:
+    """
+
+    Returns the matrix product a.b, i.e. the position b expressed in the axis
+    system of which a is the position.
+
+    :param tuple a:
+    :param tuple b:
+    :rtype: tuple
+    """
+
+    return tuple(
+        tuple(sum(a[row][k] * b[k][column] for k in range(4)) for column in range(4)) for row in range(4)
+    )
+
+
+def invert(matrix: tuple) -> tuple:
+    """
+
+    Returns the inverse of the rigid transformation matrix (rotation and
+    translation only, which is always the case for CATIA positions).
+
+    :param tuple matrix:
+    :rtype: tuple
+    """
+
+    rotation = [[matrix[column][row] for column in range(3)] for row in range(3)]
+    translation = [-sum(rotation[row][k] * matrix[k][3] for k in range(3)) for row in range(3)]
+
+    return (
+        (rotation[0][0], rotation[0][1], rotation[0][2], translation[0]),
+        (rotation[1][0], rotation[1][1], rotation[1][2], translation[1]),
+        (rotation[2][0], rotation[2][1], rotation[2][2], translation[2]),
+        (0.0, 0.0, 0.0, 1.0),
+    )
+
+
+def transform_point(matrix: tuple, point: Iterable) -> tuple:
+    """
+
+    Applies the transformation matrix to the point (x, y, z).
+
+    :param tuple matrix:
+    :param tuple point:
+    :rtype: tuple
+    """
+
+    x, y, z = point
+    return tuple(matrix[row][0] * x + matrix[row][1] * y + matrix[row][2] * z + matrix[row][3] for row in range(3))
+
+
+def transform_points(matrix: tuple, points: Iterable) -> list:
+    """
+
+    Applies the transformation matrix to all the points.
+
+    :param tuple matrix:
+    :param list points: list of (x, y, z).
+    :rtype: list
+    """
+
+    (r00, r01, r02, t0), (r10, r11, r12, t1), (r20, r21, r22, t2) = matrix[:3]
+
+    return [
+        (r00 * x + r01 * y + r02 * z + t0, r10 * x + r11 * y + r12 * z + t1, r20 * x + r21 * y + r22 * z + t2)
+        for x, y, z in points
+    ]
+
+
+def compose_absolute(local_positions: dict, separator: str = '/') -> dict:
+    """
+
+    Composes the positions of the instances of a product tree into absolute
+    positions. local_positions is keyed by the instance path, the instance names
+    from the top product separated by separator, and contains the positions
+    relative to the parent instance. Parents must come before their children,
+    as they do in a depth first walk of the tree.
+
+    >>> compose_absolute({'Sub.1': sub, 'Sub.1/Part.1': part})
+    >>> # {'Sub.1': sub, 'Sub.1/Part.1': multiply(sub, part)}
+
+    :param dict local_positions:
+    :param str separator:
+    :rtype: dict
+    """
+
+    absolute = {}
+    for path, matrix in local_positions.items():
+        parent = path.rpartition(separator)[0]
+        if parent:
+            matrix = multiply(absolute[parent], matrix)
+        absolute[path] = matrix
+
+    return absolute
@@ -0,0 +1,402 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Tracks the features created or modified through pycatia and updates only
+    those which need it.
+
+    Part.Update() updates the whole part, Part.UpdateObject() and
+    Part.IsUpToDate() take a call to CATIA per feature. While tracking, the
+    com objects of the part and of the objects passed to the tracker are
+    replaced by proxies recording the features created (AddNew* calls) and
+    modified (properties set and methods called). UpdateTracker.update()
+    checks these features and updates those which aren't up to date in a
+    single call to CATIA.
+
+    >>> with part.update_tracker(hybrid_body) as tracker:
+    >>>     hsf = part.hybrid_shape_factory
+    >>>     point = hsf.add_new_point_coord(0, 0, 0)
+    >>>     hybrid_body.append_hybrid_shape(point)
+    >>>     ...
+    >>>     point.x.value = 10
+    >>>     tracker.update()
+    >>> tracker.statistics
+
+    The features are updated from the last created, updating a feature updates
+    the features it depends on, which are then skipped. When more features
+    need to be updated than an UpdateObject() costs compared to an Update(),
+    as measured by the previous updates, the part is updated with a single
+    Update() instead.
+
+    Objects returned by method calls (AddNew*, Item, FindObjectByName, ...) are
+    tracked as features, objects read from properties belong to the feature
+    they were read from: point.X.Value = 10 modifies the point. The shapes
+    appended to a hybrid body are modified. Features read before tracking
+    started aren't tracked, add them with :meth:`UpdateTracker.mark_dirty`
+    when they are modified. Changes made through parameters and relations
+    aren't tracked.
+
+    The pycatia objects created while tracking get their com objects back
+    when the tracker exits. The helpers passing com objects to
+    SystemService.Evaluate() must pass them through :func:`unwrap`.
+
+"""
+
+import time
+from typing import TYPE_CHECKING, Optional
+import weakref
+
+from pycatia.cat_logger import create_logger
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+if TYPE_CHECKING:
+    from pycatia.mec_mod_interfaces.part import Part
+
+#: the methods which don't modify the features they are called on.
+_read_prefixes = ('Get', 'Is', 'Has', 'Item', 'Count', 'Find')
+#: the properties leading out of the feature, they aren't tracked.
+_untracked_properties = ('Application', 'Parent')
+#: the methods modifying the features passed to them.
+_append_prefixes = ('Append',)
+
+
+def unwrap(value):
+    """
+    Returns the com object of a :class:`TrackedObject`, or of the items of a
+    list or tuple, and any other value as is.
+
+    :param value:
+    """
+
+    if isinstance(value, TrackedObject):
+        return value._com_object
+    if isinstance(value, (list, tuple)):
+        return type(value)(unwrap(item) for item in value)
+    return value
+
+
+class TrackedObject:
+    """
+
+    A proxy of a com object recording the modifications of the feature it
+    belongs to, see :mod:`pycatia.scripts.update_tracker`.
+
+    :param UpdateTracker tracker:
+    :param com_object:
+    :param TrackedObject owner: the feature the object belongs to, None for
+        the part, factories and collections.
+    """
+
+    def __init__(self, tracker: 'UpdateTracker', com_object, owner: Optional['TrackedObject'] = None):
+        object.__setattr__(self, '_tracker', tracker)
+        object.__setattr__(self, '_com_object', com_object)
+        object.__setattr__(self, '_owner', owner)
+
+    def _track_result(self, value):
+        # the objects returned by methods are tracked as features.
+        if not hasattr(value, '_oleobj_'):
+            return value
+
+        tracked = TrackedObject(self._tracker, value)
+        object.__setattr__(tracked, '_owner', tracked)
+        return tracked
+
+    def __getattr__(self, name: str):
+        value = getattr(self._com_object, name)
+        if name.startswith('_') or name in _untracked_properties or not self._tracker.tracking:
+            return value
+
+        if hasattr(value, '_oleobj_'):
+            # a property holding an object, it belongs to the same feature.
+            return TrackedObject(self._tracker, value, self._owner)
+
+        if not callable(value):
+            return value
+
+        def method(*args):
+            result = self._track_result(value(*unwrap(args)))
+            if name.startswith('AddNew') and isinstance(result, TrackedObject):
+                self._tracker.add_dirty(result)
+            elif self._owner is not None and not name.startswith(_read_prefixes):
+                self._tracker.add_dirty(self._owner)
+            if name.startswith(_append_prefixes):
+                for arg in args:
+                    if isinstance(arg, TrackedObject):
+                        self._tracker.add_dirty(arg._owner or arg)
+            return result
+
+        return method
+
+    def __setattr__(self, name: str, value):
+        setattr(self._com_object, name, unwrap(value))
+        if self._owner is not None and self._tracker.tracking:
+            self._tracker.add_dirty(self._owner)
+
+    def __call__(self, *args):
+        return self._com_object(*unwrap(args))
+
+    def __repr__(self):
+        return f'TrackedObject({self._com_object!r})'
+
+
+class UpdateTracker:
+    """
+
+    Tracks the features created or modified through pycatia, see
+    :mod:`pycatia.scripts.update_tracker`. Use it as a context manager, the
+    com objects are restored on exit.
+
+    :param Part part:
+    :param objects: other pycatia objects (HybridShapeFactory, HybridBody, ...)
+        obtained before tracking started.
+    :param int max_objects: the number of features above which the part is
+        updated with Update(), until the cost of the updates is measured.
+    """
+
+    def __init__(self, part: 'Part', *objects, max_objects: int = 20):
+        self.part = part
+        self.max_objects = max_objects
+        self.dirty = []
+        self.tracking = False
+        self._dirty_ids = set()
+        self.logger = create_logger()
+        self.statistics = {
+            'updates': 0, 'checked': 0, 'stale': 0, 'objects_updated': 0, 'full_updates': 0,
+            'check_seconds': 0.0, 'object_seconds': 0.0, 'full_update_seconds': 0.0, 'seconds': 0.0,
+        }
+
+        self._part_com_object = part.com_object
+        self._objects = [part, *objects]
+        self._swapped = []
+        # weak references to the pycatia objects created from proxies, see add_wrapper().
+        self._wrappers = []
+
+    def __enter__(self) -> 'UpdateTracker':
+        self.tracking = True
+        for pycatia_object in self._objects:
+            self.track(pycatia_object)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.tracking = False
+        for pycatia_object, name, value in reversed(self._swapped):
+            setattr(pycatia_object, name, value)
+        self._swapped = []
+
+        for reference in self._wrappers:
+            pycatia_object = reference()
+            if pycatia_object is None:
+                continue
+            for name, value in list(vars(pycatia_object).items()):
+                if isinstance(value, TrackedObject) and value._tracker is self:
+                    setattr(pycatia_object, name, value._com_object)
+        self._wrappers = []
+
+    def track(self, pycatia_object):
+        """
+        Tracks the features created or read through pycatia_object, a Part,
+        a factory, a HybridBody, ... and returns it.
+
+        :param pycatia_object:
+        """
+
+        if not self.tracking:
+            raise CATIAApplicationException('Objects can only be tracked in the context of the tracker.')
+
+        com_object = pycatia_object.com_object
+        if isinstance(com_object, TrackedObject):
+            return pycatia_object
+
+        tracked = TrackedObject(self, com_object)
+        # the wrappers keep the com object in com_object and in an attribute named after the class.
+        for name, value in list(vars(pycatia_object).items()):
+            if value is com_object:
+                self._swapped.append((pycatia_object, name, value))
+                setattr(pycatia_object, name, tracked)
+
+        return pycatia_object
+
+    def add_wrapper(self, pycatia_object) -> None:
+        """
+        Records a pycatia object created from a proxy of the tracker, its com
+        object is restored when the tracker exits. Called by the pycatia
+        objects when they are created.
+
+        :param pycatia_object:
+        """
+
+        if self.tracking:
+            self._wrappers.append(weakref.ref(pycatia_object))
+
+    def add_dirty(self, feature: TrackedObject) -> None:
+        """
+        :param TrackedObject feature:
+        """
+
+        if id(feature) not in self._dirty_ids:
+            self._dirty_ids.add(id(feature))
+            self.dirty.append(feature)
+
+    def clear(self) -> None:
+        """
+        Forgets the dirty features.
+        """
+
+        self.dirty = []
+        self._dirty_ids = set()
+
+    def mark_dirty(self, *features) -> None:
+        """
+        Adds features (pycatia objects) to the features checked by the next update.
+
+        :param features:
+        """
+
+        for feature in features:
+            com_object = feature.com_object
+            if isinstance(com_object, TrackedObject):
+                self.add_dirty(com_object._owner or com_object)
+            else:
+                self.add_dirty(TrackedObject(self, com_object))
+
+    def max_stale_objects(self) -> int:
+        """
+        Returns the number of features above which updating the part is
+        cheaper than updating the features, from the durations of the
+        previous updates or max_objects.
+
+        :rtype: int
+        """
+
+        statistics = self.statistics
+        if not statistics['full_updates'] or not statistics['objects_updated'] or not statistics['object_seconds']:
+            return self.max_objects
+
+        full_update = statistics['full_update_seconds'] / statistics['full_updates']
+        object_update = statistics['object_seconds'] / statistics['objects_updated']
+        return max(1, int(full_update / object_update))
+
+    def update(self) -> dict:
+        """
+        Checks the features created or modified since the last update and
+        updates those which aren't up to date, in a single call to CATIA. The
+        features which fail to update stay dirty.
+
+        :return: {'checked', 'stale', 'updated', 'mode' ('objects', 'part' or
+            None), 'errors': [(feature, message) of the features which failed
+            to update], 'seconds'}
+        :rtype: dict
+        """
+
+        features = list(self.dirty)
+        if not features:
+            return {'checked': 0, 'stale': 0, 'updated': 0, 'mode': None, 'errors': [], 'seconds': 0.0}
+
+        max_objects = self.max_stale_objects()
+
+        vba_function_name = 'update_dirty'
+        vba_code = f"""
+        Public Function {vba_function_name}(part, objects, max_objects)
+            Dim stale(), errors()
+            count = UBound(objects)
+            ReDim stale(count)
+            ReDim errors(count)
+            stale_count = 0
+            updated = 0
+            failure = ""
+            started = Timer
+            On Error Resume Next
+            For i = 0 To count
+                errors(i) = ""
+                stale(i) = False
+                stale(i) = Not part.IsUpToDate(objects(i))
+                If Err.Number <> 0 Then
+                    errors(i) = Err.Description
+                    stale(i) = False
+                    Err.Clear
+                End If
+                If stale(i) Then stale_count = stale_count + 1
+            Next
+            checked = Timer
+            If stale_count > max_objects Then
+                part.Update
+                If Err.Number <> 0 Then
+                    failure = Err.Description
+                    Err.Clear
+                End If
+            ElseIf stale_count > 0 Then
+                ' the last created first, updating a feature updates the features it depends on.
+                For i = count To 0 Step -1
+                    If stale(i) Then
+                        If Not part.IsUpToDate(objects(i)) Then
+                            part.UpdateObject objects(i)
+                            updated = updated + 1
+                            If Err.Number <> 0 Then
+                                errors(i) = Err.Description
+                                Err.Clear
+                            End If
+                        End If
+                    End If
+                Next
+            End If
+            {vba_function_name} = Array(stale, errors, stale_count, updated, failure, started, checked, Timer)
+        End Function
+        """
+
+        start = time.perf_counter()
+        # the references of the features updated may change.
+        self.part.clear_reference_cache()
+        system_service = self.part.application.system_service
+        stale, errors, stale_count, updated, failure, started, checked, finished = system_service.evaluate(
+            vba_code, 0, vba_function_name,
+            [self._part_com_object, [feature._com_object for feature in features], max_objects])
+        seconds = time.perf_counter() - start
+
+        # Timer counts the seconds since midnight.
+        check_seconds = (checked - started) % 86400
+        update_seconds = (finished - checked) % 86400
+        mode = None
+        if stale_count > max_objects:
+            mode = 'part'
+        elif stale_count:
+            mode = 'objects'
+
+        statistics = self.statistics
+        statistics['updates'] += 1
+        statistics['checked'] += len(features)
+        statistics['stale'] += stale_count
+        statistics['check_seconds'] += check_seconds
+        statistics['seconds'] += seconds
+
+        if failure:
+            raise CATIAApplicationException(f'The update of the part failed: {failure}')
+
+        if mode == 'part':
+            statistics['full_updates'] += 1
+            statistics['full_update_seconds'] += update_seconds
+        elif mode == 'objects':
+            statistics['objects_updated'] += updated
+            # the time of an update which updated nothing would skew the cost of an UpdateObject().
+            if updated:
+                statistics['object_seconds'] += update_seconds
+
+        failed = [(feature, error) for feature, is_stale, error in zip(features, stale, errors) if is_stale and error]
+        self.clear()
+        for feature, _ in failed:
+            self.add_dirty(feature)
+
+        if mode == 'part':
+            self.logger.info('Checked %s features, %s not up to date, updated the part in %.2fs.',
+                             len(features), stale_count, seconds)
+        else:
+            self.logger.info('Checked %s features, %s not up to date, updated %s features in %.2fs.',
+                             len(features), stale_count, updated, seconds)
+
+        return {
+            'checked': len(features), 'stale': stale_count, 'updated': updated, 'mode': mode,
+            'errors': failed,
+            'seconds': seconds,
+        }
+
+    def __repr__(self):
+        return f'UpdateTracker(tracking={self.tracking}, dirty={len(self.dirty)})'
@@ -9,6 +9,7 @@
         
 """
 
+from pycatia.enumeration.int_enums import decode
 from pycatia.product_structure_interfaces.product import Product
 from pycatia.system_interfaces.any_object import AnyObject
 from pycatia.system_interfaces.system_service import SystemService
@@ -179,7 +180,7 @@ class Conflict(AnyObject):
         :rtype: int
         """
 
-        return self.conflict.Status
+        return decode('cat_conflict_status', self.conflict.Status)
 
     @status.setter
     def status(self, value: int):
@@ -212,7 +213,7 @@ class Conflict(AnyObject):
         :rtype: int
         """
 
-        return self.conflict.Type
+        return decode('cat_conflict_type', self.conflict.Type)
 
     @property
     def value(self) -> float:
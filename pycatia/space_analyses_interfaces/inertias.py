@@ -8,7 +8,7 @@
         and thus help debugging in pycatia.
         
 """
-from typing import Iterator
+from typing import Iterator, Optional
 
 from pycatia.space_analyses_interfaces.inertia import Inertia
 from pycatia.system_interfaces.any_object import AnyObject
@@ -75,6 +75,109 @@ class Inertias(Collection):
         """
         return Inertia(self.inertias.Add(i_object.com_object))
 
+    def compute_many(self, objects: list, density: Optional[float] = None, keep: bool = False) -> list:
+        """
+        Creates an Inertia for each object and reads all its results in a
+        single call to CATIA. Each object gets a dictionary::
+
+            {
+                'mass': 1.5,
+                'density': 1000.0,
+                'cog': (50.0, 50.0, 25.0),
+                'matrix': ((Ixx, Ixy, Ixz), (Iyx, Iyy, Iyz), (Izx, Izy, Izz)),
+                'principal_moments': (M1, M2, M3),
+                'principal_axes': ((A1x, A1y, A1z), (A2x, A2y, A2z), (A3x, A3y, A3z)),
+                'error': None,
+            }
+
+        When the inertia can't be computed the values are None and error is
+        the CATIA error description.
+
+        :param list objects: the objects (bodies, products, ...) to analyse.
+        :param float density: (optional) the density used for the computation,
+            the densities attached to the objects by default.
+        :param bool keep: keep the Inertia objects in the collection, they are removed by default.
+        :rtype: list(dict)
+        """
+
+        if not objects:
+            return []
+
+        vba_function_name = 'compute_many'
+        vba_code = f"""
+        Public Function {vba_function_name}(inertias, objects, density, keep)
+            count = UBound(objects)
+            Dim masses(), densities(), values(), errors()
+            Dim cog(2), matrix(8), moments(2), axes(8)
+            ReDim masses(count)
+            ReDim densities(count)
+            ReDim values(24 * (count + 1) - 1)
+            ReDim errors(count)
+            On Error Resume Next
+            For i = 0 To count
+                errors(i) = ""
+                Set inertia = inertias.Add(objects(i))
+                If Err.Number = 0 Then
+                    If density > 0 Then inertia.Density = density
+                    masses(i) = inertia.Mass
+                    densities(i) = inertia.Density
+                    inertia.GetCOGPosition cog
+                    inertia.GetInertiaMatrix matrix
+                    inertia.GetPrincipalMoments moments
+                    inertia.GetPrincipalAxes axes
+                    For j = 0 To 2
+                        values(24 * i + j) = cog(j)
+                        values(24 * i + 12 + j) = moments(j)
+                    Next
+                    For j = 0 To 8
+                        values(24 * i + 3 + j) = matrix(j)
+                        values(24 * i + 15 + j) = axes(j)
+                    Next
+                    If Not keep Then inertias.Remove inertias.Count
+                End If
+                If Err.Number <> 0 Then
+                    errors(i) = Err.Description
+                    Err.Clear
+                End If
+            Next
+            {vba_function_name} = Array(masses, densities, values, errors)
+        End Function
+        """
+
+        com_objects = [item.com_object if isinstance(item, AnyObject) else item for item in objects]
+
+        system_service = self.application.system_service
+        masses, densities, values, errors = system_service.evaluate(
+            vba_code, 0, vba_function_name, [self.com_object, com_objects, density or 0, keep])
+
+        results = []
+        for i, error in enumerate(errors):
+            v = values[24 * i:24 * i + 24]
+            if error:
+                self.logger.warning('Could not compute the inertia of object %s. %s', i, error)
+                results.append({
+                    'mass': None,
+                    'density': None,
+                    'cog': None,
+                    'matrix': None,
+                    'principal_moments': None,
+                    'principal_axes': None,
+                    'error': error,
+                })
+                continue
+
+            results.append({
+                'mass': masses[i],
+                'density': densities[i],
+                'cog': tuple(v[0:3]),
+                'matrix': (tuple(v[3:6]), tuple(v[6:9]), tuple(v[9:12])),
+                'principal_moments': tuple(v[12:15]),
+                'principal_axes': (tuple(v[15:18]), tuple(v[18:21]), tuple(v[21:24])),
+                'error': None,
+            })
+
+        return results
+
     def item(self, i_index: cat_variant) -> Inertia:
         """
         .. note::
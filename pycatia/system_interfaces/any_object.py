@@ -11,6 +11,7 @@
 from typing import TYPE_CHECKING
 
 from pycatia.base_interfaces.pycatia import PyCATIA
+from pycatia.scripts.update_tracker import TrackedObject
 
 if TYPE_CHECKING:
     from pycatia.in_interfaces.application import Application
@@ -39,6 +40,8 @@ class AnyObject(PyCATIA):
     def __init__(self, com_object):
         super().__init__()
         self.com_object = com_object
+        if isinstance(com_object, TrackedObject):
+            com_object._tracker.add_wrapper(self)
 
     @property
     def application(self) -> 'Application':
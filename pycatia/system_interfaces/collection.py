@@ -12,6 +12,7 @@ from typing import Iterator
 from typing import TYPE_CHECKING
 
 from pycatia.base_interfaces.pycatia import PyCATIA
+from pycatia.scripts.update_tracker import TrackedObject
 from pycatia.system_interfaces.any_object import AnyObject
 
 # from pycatia.system_interfaces.cat_base_dispatch import CATBaseDispatch
@@ -43,6 +44,8 @@ class Collection(PyCATIA):
         super().__init__()
         self.com_object = com_object
         self.child_object = child_object
+        if isinstance(com_object, TrackedObject):
+            com_object._tracker.add_wrapper(self)
 
     @property
     def application(self) -> 'Application':
@@ -9,6 +9,7 @@
         
 """
 
+from pycatia.exception_handling.com_errors import translate_com_errors
 from pycatia.system_interfaces.any_object import AnyObject
 
 
@@ -60,6 +61,7 @@ class SystemService(AnyObject):
         """
         return str(self.system_service.Environ(i_env_string))
 
+    @translate_com_errors('The evaluation of the script function "{i_function_name}" failed.')
     def evaluate(self, i_script_text: str, i_language: int, i_function_name: str, i_parameters: list):
         """
         .. note::
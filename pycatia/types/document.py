@@ -7,6 +7,7 @@ from pycatia.in_interfaces.document import Document
 from pycatia.mec_mod_interfaces.part_document import PartDocument
 from pycatia.product_structure_interfaces.product_document import ProductDocument
 from pycatia.funct_system_interfaces.functional_document import FunctionalDocument
+from pycatia.types.document_header import DocumentHeader, read_document_header, read_document_headers
 
 
 document_types = {
@@ -0,0 +1,357 @@
+#! /usr/bin/python3.9
+
+"""
+
+    Reads the readable header information of CATIA V5 documents without
+    launching CATIA.
+
+    The file is memory-mapped and only the parts of interest are decoded: the
+    typed document properties (version information, product properties when
+    stored by the document), the names of the documents it links to and the
+    offsets of the preview image.
+
+    This module does not require pywin32 and can be used on any platform.
+
+    >>> from pycatia.types.document_header import read_document_header
+    >>> header = read_document_header('tests/cat_files/FunctionalSystem1.CATSystem')
+    >>> header.last_save_version['Release']
+    '21'
+    >>> header.links
+    []
+
+    .. warning::
+        The V5 file format is not documented. The values are extracted from the
+        property blocks CATIA writes in clear and will be None when a document
+        does not store them.
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+from pathlib import Path, PureWindowsPath
+import re
+import struct
+from typing import Iterator, Optional, Union
+
+from pycatia.cat_logger import create_logger
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+
+#: The first bytes of every CATIA V5 document.
+v5_magic = b'V5_CFV2'
+
+#: Extensions of the documents CATIA V5 documents can link to.
+v5_link_extensions = (
+    'CATPart',
+    'CATProduct',
+    'CATDrawing',
+    'CATAnalysis',
+    'CATMaterial',
+    'CATProcess',
+    'CATSystem',
+    'CATfct',
+    'catalog',
+    'cgr',
+    'model',
+)
+
+# property types as stored in the property blocks.
+_property_int16 = 0x02
+_property_int32 = 0x03
+_property_string = 0x0e
+
+# <uint16 key length><key><uint32 type>
+_re_property = re.compile(rb'([\x03-\x40])\x00([A-Za-z_][A-Za-z0-9_]{2,63})([\x02\x03\x0e])\x00\x00\x00')
+_re_key = re.compile(rb'[A-Za-z_][A-Za-z0-9_]{2,63}')
+_re_version_tag = re.compile(r'<(\w+)>([^<]*)/<\1>')
+_re_link_ascii = re.compile(
+    rb'\.(?:' + b'|'.join(e.encode('ascii') for e in v5_link_extensions) + rb')(?![A-Za-z0-9_])'
+)
+_re_link_utf16 = re.compile(
+    rb'\.\x00(?:' + b'|'.join(e.encode('utf-16-le') for e in v5_link_extensions) + rb')(?![A-Za-z0-9_]\x00)'
+)
+
+# longest file path that will be looked for in front of a link extension.
+_max_path_length = 1024
+_printable = frozenset(range(0x20, 0x7f))
+
+
+def _read_properties(buffer: Union[mmap.mmap, bytes]) -> dict:
+    """
+
+    Returns all the typed properties found in buffer. If a property is stored
+    more than once the first value found is kept.
+
+    :param buffer:
+    :rtype: dict
+    """
+
+    properties = {}
+    size = len(buffer)
+
+    for match in _re_property.finditer(buffer):
+        key = match.group(2)
+        if match.group(1)[0] != len(key):
+            continue
+
+        key = key.decode('ascii')
+        if key in properties:
+            continue
+
+        offset = match.end()
+        # a property set is stored as <key><uint32 count> followed by its properties.
+        # the count can be confused with a type so skip those.
+        if offset + 2 <= size and buffer[offset + 1] == 0:
+            key_length = buffer[offset]
+            if _re_key.fullmatch(buffer[offset + 2:offset + 2 + key_length]):
+                continue
+
+        property_type = match.group(3)[0]
+        if property_type == _property_string:
+            if offset + 4 > size:
+                continue
+            length, = struct.unpack_from('<I', buffer, offset)
+            if offset + 4 + length > size:
+                continue
+            properties[key] = buffer[offset + 4:offset + 4 + length].decode('utf-8', errors='replace')
+        elif property_type == _property_int32 and offset + 4 <= size:
+            properties[key], = struct.unpack_from('<i', buffer, offset)
+        elif property_type == _property_int16 and offset + 2 <= size:
+            properties[key], = struct.unpack_from('<h', buffer, offset)
+
+    return properties
+
+
+def _read_links(buffer: Union[mmap.mmap, bytes]) -> list:
+    """
+
+    Returns the file names of the linked documents, in order of appearance.
+    Both the ASCII and UTF-16 link tables are searched.
+
+    :param buffer:
+    :rtype: list(str)
+    """
+
+    links = []
+
+    for match in _re_link_ascii.finditer(buffer):
+        start = match.start()
+        limit = max(0, start - _max_path_length)
+        while start > limit and buffer[start - 1] in _printable:
+            start -= 1
+        if start < match.start():
+            links.append(buffer[start:match.end()].decode('ascii'))
+
+    for match in _re_link_utf16.finditer(buffer):
+        start = match.start()
+        limit = max(0, start - 2 * _max_path_length)
+        while start - 2 >= limit and buffer[start - 2] in _printable and buffer[start - 1] == 0:
+            start -= 2
+        if start < match.start():
+            links.append(buffer[start:match.end()].decode('utf-16-le'))
+
+    return list(dict.fromkeys(links))
+
+
+def _version_tags(value: Optional[str]) -> Optional[dict]:
+    """
+    Converts '<Version>5/<Version><Release>21/<Release>' into {'Version': '5', 'Release': '21'}.
+    """
+
+    if value is None:
+        return None
+
+    return dict(_re_version_tag.findall(value))
+
+
+class DocumentHeader:
+    """
+
+    The readable header information of a CATIA V5 document.
+
+    Use :func:`read_document_header` to create it.
+
+    """
+
+    def __init__(self, file_name: Path, properties: dict, links: list, preview_offsets: Optional[tuple] = None):
+        self.file_name = file_name
+        self.properties = properties
+        self.links = links
+        self.preview_offsets = preview_offsets
+
+    @property
+    def part_number(self) -> Optional[str]:
+        """
+        :rtype: str
+        """
+        return self.properties.get('PartNumber')
+
+    @property
+    def revision(self) -> Optional[str]:
+        """
+        :rtype: str
+        """
+        return self.properties.get('Revision')
+
+    @property
+    def nomenclature(self) -> Optional[str]:
+        """
+        :rtype: str
+        """
+        return self.properties.get('Nomenclature')
+
+    @property
+    def definition(self) -> Optional[str]:
+        """
+        :rtype: str
+        """
+        return self.properties.get('Definition')
+
+    @property
+    def description(self) -> Optional[str]:
+        """
+        :rtype: str
+        """
+        return self.properties.get('DescriptionRef')
+
+    @property
+    def first_streamed_version(self) -> Optional[dict]:
+        """
+        The CATIA version the document was created with.
+
+        :rtype: dict
+        """
+        return _version_tags(self.properties.get('FirstStreamed'))
+
+    @property
+    def last_save_version(self) -> Optional[dict]:
+        """
+        The CATIA version the document was last saved with.
+
+        >>> header.last_save_version
+        >>> # {'Version': '5', 'Release': '21', 'ServicePack': '0', 'BuildDate': '04-14-2011.20.00', 'HotFix': '0'}
+
+        :rtype: dict
+        """
+        return _version_tags(self.properties.get('LastSaveVersion'))
+
+    @property
+    def minimal_version_to_read(self) -> Optional[str]:
+        """
+        The oldest CATIA version that can read the document. For example 'CATIAV5R21'.
+
+        :rtype: str
+        """
+        return self.properties.get('MinimalVersionToRead')
+
+    def read_preview(self) -> Optional[bytes]:
+        """
+        Returns the preview image (JPEG) stored in the document or None.
+
+        :rtype: bytes
+        """
+
+        if self.preview_offsets is None:
+            return None
+
+        start, end = self.preview_offsets
+        with open(self.file_name, 'rb') as file:
+            file.seek(start)
+            return file.read(end - start)
+
+    def __repr__(self):
+        return f'DocumentHeader(file_name="{self.file_name.name}")'
+
+
+def read_document_header(file_name: Union[str, Path]) -> DocumentHeader:
+    """
+
+    Reads the header of the CATIA V5 document file_name.
+
+    :param Path file_name:
+    :rtype: DocumentHeader
+    """
+
+    # legacy support for strings.
+    if type(file_name) is str:
+        file_name = Path(file_name)
+
+    if not file_name.is_file():
+        raise FileNotFoundError(f'Could not find file {file_name}.')
+
+    with open(file_name, 'rb') as file:
+        if file.read(len(v5_magic)) != v5_magic:
+            raise CATIAApplicationException(f'File "{file_name}" is not a CATIA V5 document.')
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            properties = _read_properties(buffer)
+            links = _without_self(_read_links(buffer), file_name)
+
+            preview_offsets = None
+            preview_start = buffer.find(b'CATPreview')
+            if preview_start != -1:
+                jpeg_start = buffer.find(b'\xff\xd8\xff', preview_start)
+                jpeg_end = buffer.find(b'\xff\xd9', jpeg_start)
+                if jpeg_start != -1 and jpeg_end != -1:
+                    preview_offsets = (jpeg_start, jpeg_end + 2)
+
+    return DocumentHeader(file_name, properties, links, preview_offsets)
+
+
+def _without_self(links: list, file_name: Path) -> list:
+    """
+    Returns the links without the path the document was saved to, which is
+    stored with them. Only one entry is removed, the path of file_name if
+    stored, or else the first with its name: links to documents of the same
+    name in other folders are kept.
+    """
+
+    # the links are stored with the paths of Windows, whatever the OS reading them.
+    name = file_name.name.lower()
+    same_name = [i for i, link in enumerate(links) if PureWindowsPath(link).name.lower() == name]
+    if not same_name:
+        return links
+
+    path = PureWindowsPath(file_name.resolve())
+    own = next((i for i in same_name if PureWindowsPath(links[i]) == path), same_name[0])
+    return links[:own] + links[own + 1:]
+
+
+def _read_document_header_or_none(file_name: Path) -> Optional[DocumentHeader]:
+    try:
+        return read_document_header(file_name)
+    except CATIAApplicationException as e:
+        create_logger().warning(e.message)
+        return None
+
+
+def read_document_headers(file_names: list, workers: Optional[int] = None,
+                          chunk_size: int = 64) -> Iterator[tuple]:
+    """
+
+    Reads the headers of many CATIA V5 documents in parallel processes.
+
+    Yields (file_name, DocumentHeader) in the order of file_names. The header
+    is None for files that are not CATIA V5 documents.
+
+    >>> from pathlib import Path
+    >>> from pycatia.types.document_header import read_document_headers
+    >>> files = Path('//vault/parts').rglob('*.CATPart')
+    >>> for file_name, header in read_document_headers(files):
+    >>>     print(file_name, header.part_number, header.links)
+
+    :param list file_names: list of Path or str.
+    :param int workers: the number of processes. None uses the number of CPUs and 1 reads in this process.
+    :param int chunk_size: the number of files sent to a process at a time.
+    :rtype: Iterator[tuple(Path, DocumentHeader)]
+    """
+
+    file_names = [Path(file_name) for file_name in file_names]
+
+    if workers == 1:
+        for file_name in file_names:
+            yield file_name, _read_document_header_or_none(file_name)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        headers = executor.map(_read_document_header_or_none, file_names, chunksize=chunk_size)
+        yield from zip(file_names, headers)
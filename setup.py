@@ -10,7 +10,7 @@ exclude_files = [
 ]
 
 requires = [
-    'pywin32>=224',
+    'pywin32>=224; platform_system=="Windows"',
 ]
 
 test_requirements = [
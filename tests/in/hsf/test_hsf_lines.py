@@ -59,3 +59,30 @@ def test_line_point_point():
         measurable = spa_wb.get_measurable(line_ref)
 
         assert measurable.length == length
+
+
+def test_classify_many():
+    with CATIADocHandler(new_document="Part") as caa:
+        part_document: PartDocument = caa.document
+        part = part_document.part
+        hsf = part.hybrid_shape_factory
+
+        hybrid_bodies = part.hybrid_bodies
+        gs_new = hybrid_bodies.add()
+
+        point_1 = hsf.add_new_point_coord(0, 0, 0)
+        point_2 = hsf.add_new_point_coord(100, 0, 0)
+        gs_new.append_hybrid_shapes([point_1, point_2])
+
+        line = hsf.add_new_line_pt_pt(Reference(point_1.com_object), Reference(point_2.com_object))
+        gs_new.append_hybrid_shape(line)
+
+        part.update()
+
+        objects = [point_1, line, Reference(point_2.com_object)]
+        assert [1, 3, 1] == hsf.classify_many(objects)
+        assert 'Line' == hsf.classify_many([line])[0].name
+        # the types are remembered by the part, for the factories obtained from it.
+        assert line in part.hybrid_shape_factory._feature_types
+        # and for each feature, whichever pycatia object of the feature is given.
+        assert gs_new.hybrid_shapes.item(line.name) in part.hybrid_shape_factory._feature_types
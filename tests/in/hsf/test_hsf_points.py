@@ -108,6 +108,33 @@ def test_point_coord_reference():
         assert point_1.get_coordinates() == r
 
 
+def test_point_coord_recording():
+    coordinates = [(0, 0, 0), (100, 0, 0), (100, 50, 0)]
+
+    with CATIADocHandler(new_document="Part") as caa:
+        part_document: PartDocument = caa.document
+        part = part_document.part
+        hsf = part.hybrid_shape_factory
+
+        hybrid_bodies = part.hybrid_bodies
+        gs_new = hybrid_bodies.add()
+
+        with hsf.recording(part, gs_new) as tx:
+            points = []
+            for x, y, z in coordinates:
+                point = hsf.add_new_point_coord(x, y, z)
+                gs_new.append_hybrid_shape(point)
+                points.append(point)
+            points[0].name = 'Recorded'
+
+        part.update()
+
+        assert tx.state == 'committed'
+        assert 'Recorded' == points[0].name
+        assert [point.get_coordinates() for point in points] == coordinates
+        assert 3 == gs_new.hybrid_shapes.count
+
+
 def test_point_datum():
     # todo: write this test.
     pass
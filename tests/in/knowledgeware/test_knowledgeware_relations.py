@@ -44,6 +44,33 @@ def test_relations_create_design_table():
         assert design_table.name == "new-design-table"
 
 
+def test_relations_design_table_sweep():
+    with CATIADocHandler(new_document="Part") as caa:
+        part_document: PartDocument = caa.document
+        part = part_document.part
+        relations = part.relations
+
+        design_table = relations.create_design_table("new-design-table", "this is a comment", True, design_table_1)
+        length = part.parameters.create_dimension("a", "LENGTH", 0)
+        design_table.add_association(length, "a(mm)")
+
+        cells = design_table.to_array()
+        assert cells[0] == ("design", "d(mm)", "a(mm)", "b(mm)")
+        assert cells[1] == ("110", "1", "5", "10")
+        assert len(cells) == design_table.configurations_nb + 1
+
+        design_table.configuration = 2
+        part.update()
+        results = design_table.sweep(collect=[length])
+        assert [row[length.name] for row in results] == [5.0, 6.0, 7.0]
+        assert [row["configuration"] for row in results] == [1, 2, 3]
+        assert all(row["error"] is None for row in results)
+
+        # the active configuration is restored.
+        assert design_table.configuration == 2
+        assert length.value == 6.0
+
+
 def test_relations_create_formula():
     with CATIADocHandler(new_document="Part") as caa:
         name = "new-formula"
@@ -93,6 +120,35 @@ def test_relations_create_law():
         assert law.name == "new-law"
 
 
+def test_relations_create_many():
+    with CATIADocHandler(new_document="Part") as caa:
+        part_document: PartDocument = caa.document
+        part = part_document.part
+        parameters = part.parameters
+        relations = part.relations
+
+        lower_mass = parameters.create_dimension("lower_mass", "MASS", 5)
+        lm_name = parameters.get_name_to_use_in_relation(lower_mass)
+        target_mass = parameters.create_dimension("target_mass", "MASS", 0)
+        tm_name = parameters.get_name_to_use_in_relation(target_mass)
+
+        specs = [
+            {"type": "formula", "name": "new-formula", "body": f"{lm_name}*2", "output": target_mass},
+            {"type": "check", "name": "new-check", "comment": "a comment", "body": f"{tm_name}<20kg"},
+            {"type": "program", "name": "new-program", "body": "/* code comments */"},
+        ]
+        formula, check, program = relations.create_many(specs)
+
+        assert [formula.name, check.name, program.name] == ["new-formula", "new-check", "new-program"]
+        assert target_mass.value == 10
+
+        graph = relations.dependency_graph()
+        assert graph.relations["new-formula"]["inputs"] == [lower_mass.name]
+        assert graph.relations["new-formula"]["outputs"] == [target_mass.name]
+        assert graph.evaluation_order().index("new-formula") < graph.evaluation_order().index("new-check")
+        assert graph.cycles() == []
+
+
 def test_relations_create_program():
     with CATIADocHandler(new_document="Part") as caa:
         part_document: PartDocument = caa.document
@@ -7,6 +7,8 @@ from pycatia.exception_handling.exceptions import CATIAApplicationException
 from pycatia.mec_mod_interfaces.part import Part
 from pycatia.mec_mod_interfaces.part_document import PartDocument
 from pycatia.product_structure_interfaces.product_document import ProductDocument
+from pycatia.scripts.tessellation import MeshCache
+from pycatia.scripts.transforms import identity
 from tests.source_files import cat_part_measurable
 from tests.source_files import cat_product
 
@@ -35,6 +37,16 @@ def test_axis_systems():
         assert axis_systems.com_object.Item(1).name == "Axis.1"
 
 
+def test_axis_system_get_matrix():
+    with CATIADocHandler(cat_part_measurable) as caa:
+        part_document: PartDocument = caa.document
+        part = part_document.part
+
+        axis_system = part.axis_systems.item(1)
+
+        assert identity == axis_system.get_matrix()
+
+
 # todo: look into automation this.
 # I haven't yet imported the module into pycatia that seems to handle annotation sets.
 # def test_annotation_sets():
@@ -68,6 +80,32 @@ def test_create_geometrical_set():
         assert geometrical_set.name == "lala"
 
 
+def test_create_references():
+    with CATIADocHandler(new_document="Part") as caa:
+        part_document: PartDocument = caa.document
+        part = part_document.part
+        hsf = part.hybrid_shape_factory
+        geometrical_set = part.hybrid_bodies.add()
+        plane_xy = part.origin_elements.plane_xy
+        plane_yz = part.origin_elements.plane_yz
+
+        reference = part.create_reference_from_object(plane_xy)
+        assert reference is part.create_reference_from_object(plane_xy)
+        # a new pycatia object of the same plane shares its reference.
+        assert reference is part.create_reference_from_object(part.origin_elements.plane_xy)
+
+        references = part.create_references([plane_xy, plane_yz, plane_yz])
+        assert reference is references[0]
+        assert references[1] is references[2]
+        assert plane_yz.name in references[1].display_name
+
+        point = hsf.add_new_point_on_plane(references[1], 10, 10)
+        geometrical_set.append_hybrid_shape(point)
+        part.update()
+        # the cache is cleared by the updates.
+        assert reference is not part.create_reference_from_object(plane_xy)
+
+
 def test_density_of_part():
     with CATIADocHandler(cat_part_measurable) as caa:
         part_document: PartDocument = caa.document
@@ -112,6 +150,55 @@ def test_find_object_by_name():
             pass
 
 
+def test_hybrid_body_append_and_rename_many():
+    with CATIADocHandler(new_document="Part") as caa:
+        part_document: PartDocument = caa.document
+        part = part_document.part
+        hsf = part.hybrid_shape_factory
+        geometrical_set = part.hybrid_bodies.add()
+
+        points = hsf.add_new_point_coords([(0, 0, 0), (10, 0, 0), (20, 0, 0)])
+        geometrical_set.append_hybrid_shapes(points)
+        assert 3 == geometrical_set.hybrid_shapes.count
+
+        points[0].name = 'A'
+        points[1].name = 'B'
+        third = points[2].name
+        renamed = geometrical_set.rename_many({'A': 'B', points[1]: 'A', points[2]: 'C'})
+
+        assert {'A': 'B', 'B': 'A', third: 'C'} == renamed
+        assert ['B', 'A', 'C'] == [point.name for point in points]
+
+        with pytest.raises(CATIAApplicationException):
+            geometrical_set.rename_many({'A': 'C'})
+        with pytest.raises(CATIAApplicationException):
+            geometrical_set.rename_many({'A': 'D', 'B': 'D'})
+        assert ['B', 'A', 'C'] == [point.name for point in points]
+
+
+def test_update_tracker():
+    with CATIADocHandler(new_document="Part") as caa:
+        part_document: PartDocument = caa.document
+        part = part_document.part
+        geometrical_set = part.hybrid_bodies.add()
+
+        with part.update_tracker(geometrical_set) as tracker:
+            hsf = part.hybrid_shape_factory
+            point = hsf.add_new_point_coord(0, 0, 0)
+            geometrical_set.append_hybrid_shape(point)
+            result = tracker.update()
+
+            assert 1 == result['checked']
+            assert 'objects' == result['mode']
+            assert part.is_up_to_date(point)
+
+            point.x.value = 10
+            assert 1 == len(tracker.dirty)
+            tracker.update()
+            assert part.is_up_to_date(point)
+            assert (10, 0, 0) == tuple(point.get_coordinates())
+
+
 def test_in_work_object():
     with CATIADocHandler(cat_part_measurable) as caa:
         part_document: PartDocument = caa.document
@@ -156,6 +243,21 @@ def test_path():
                 assert part.path() == cat_part_measurable
 
 
+def test_tessellate(tmp_path):
+    with CATIADocHandler(cat_part_measurable) as caa:
+        part_document: PartDocument = caa.document
+        part = part_document.part
+        cache = MeshCache(tmp_path)
+
+        mesh = part.tessellate(cache=cache)
+        assert mesh.triangle_count > 0
+        assert 1 == len(list(tmp_path.glob('*.mesh')))
+
+        cached = part.tessellate(cache=cache)
+        assert mesh.points() == cached.points()
+        cached.close()
+
+
 def test_repr():
     with CATIADocHandler(cat_part_measurable) as caa:
         part_document: PartDocument = caa.document
@@ -3,11 +3,16 @@
 import os
 from pathlib import Path
 
+from pytest import approx
+
 from pycatia import CATIADocHandler
 from pycatia.enumeration.enumeration_types import cat_work_mode_type
 from pycatia.mec_mod_interfaces.part_document import PartDocument
 from pycatia.product_structure_interfaces.product import Product
 from pycatia.product_structure_interfaces.product_document import ProductDocument
+from pycatia.scripts.lazy_product_tree import LazyProductTree
+from pycatia.scripts.mass_properties import MassPropertiesRollup
+from pycatia.scripts.tessellation import MeshCache
 from tests.source_files import cat_part_measurable
 from tests.source_files import cat_product
 
@@ -59,6 +64,34 @@ def test_attributes():
         assert product.attributes() == attributes
 
 
+def test_build_from_manifest():
+    with CATIADocHandler(cat_product) as caa:
+        product_document: ProductDocument = caa.document
+        products = product_document.product.products
+        count = len(products)
+
+        translation = (
+            (1.0, 0.0, 0.0, 10.0),
+            (0.0, 1.0, 0.0, 20.0),
+            (0.0, 0.0, 1.0, 30.0),
+            (0.0, 0.0, 0.0, 1.0),
+        )
+        rows = [
+            (cat_part_measurable, 'Manifest.1', translation, {'nomenclature': 'manifest'}),
+            (cat_part_measurable, 'Manifest.2', None, {}),
+            (cat_part_measurable, '', translation),
+        ]
+        result = products.build_from_manifest(rows, chunk_size=2)
+
+        assert not result['errors']
+        assert [2, 1] == [chunk['rows'] for chunk in result['chunks']]
+        assert [1, 0] == [chunk['new_files'] for chunk in result['chunks']]
+        assert count + 3 == len(products)
+        assert 'Manifest.1' == result['products'][0].name
+        assert 'manifest' == result['products'][0].nomenclature
+        assert translation == products.get_positions()[count]
+
+
 def test_count_children():
     with CATIADocHandler(cat_product) as caa:
         product_document: ProductDocument = caa.document
@@ -161,6 +194,49 @@ def test_is_catproduct_is_catpart():
         assert not product.is_catproduct()
 
 
+def test_lazy_product_tree():
+    with CATIADocHandler(cat_product) as caa:
+        product_document: ProductDocument = caa.document
+        product = product_document.product
+        tree = LazyProductTree(product)
+
+        nodes = list(tree.walk_breadth_first())
+        assert nodes[0].part_number == product.part_number
+        assert [node.name for node in tree.root.children] == [child.name for child in product.get_children()]
+        assert len(nodes) == 1 + len(product.get_children())
+        assert [node.path for node in tree.walk_depth_first(prune=lambda node: True)] == [""]
+
+        calls = tree.calls
+        assert [node.revision for node in tree.walk_depth_first()]
+        assert tree.calls == calls
+
+        tree.invalidate()
+        assert tree.root.children[0].part_number == product.get_children()[0].part_number
+        assert tree.calls > calls
+
+
+def test_mass_properties_rollup(tmp_path):
+    with CATIADocHandler(cat_product) as caa:
+        product_document: ProductDocument = caa.document
+        product = product_document.product
+        product.activate_terminal_node(product.products)
+        product.apply_work_mode(cat_work_mode_type.index("DESIGN_MODE"))
+
+        cache_file = Path(tmp_path, "mass_properties.json")
+        properties = MassPropertiesRollup(cache_file).rollup(product)
+
+        assert properties[""].mass == approx(product.analyze.mass)
+        assert properties[""].cog == approx(product.analyze.get_gravity_center())
+        # Analyze gives the inertia in kg.m2, the rollup in kg.mm2.
+        inertia = [value / 1e6 for row in properties[""].inertia for value in row]
+        assert inertia == approx(product.analyze.get_inertia())
+        assert sum(properties[child.name].mass for child in product.products) == approx(properties[""].mass)
+        assert cache_file.is_file()
+
+        cached = MassPropertiesRollup(cache_file).rollup(product)
+        assert cached[""].mass == approx(properties[""].mass)
+
+
 def test_move():
     with CATIADocHandler(cat_product) as caa:
         product_document: ProductDocument = caa.document
@@ -230,6 +306,23 @@ def test_position():
     pass
 
 
+def test_positions():
+    with CATIADocHandler(cat_product) as caa:
+        product_document: ProductDocument = caa.document
+        products = product_document.product.products
+
+        translation = (
+            (1.0, 0.0, 0.0, 10.0),
+            (0.0, 1.0, 0.0, 20.0),
+            (0.0, 0.0, 1.0, 30.0),
+            (0.0, 0.0, 0.0, 1.0),
+        )
+        products.set_positions([translation] * len(products))
+
+        assert [translation] * len(products) == products.get_positions()
+        assert translation == products.get_absolute_positions()[products[0].name]
+
+
 def test_proudcts():
     # todo: write test feature
     pass
@@ -371,11 +464,36 @@ def test_remove_shape_representation():
     pass
 
 
+def test_tessellate(tmp_path):
+    with CATIADocHandler(cat_product) as caa:
+        product_document: ProductDocument = caa.document
+        product = product_document.product
+
+        mesh = product.tessellate(cache=MeshCache(tmp_path))
+        assert mesh.triangle_count > 0
+
+
 def test_update():
     # todp: write test feature
     pass
 
 
+def test_vis_properties_apply_many():
+    with CATIADocHandler(cat_product) as caa:
+        product_document: ProductDocument = caa.document
+        products = product_document.product.products
+        selection = product_document.selection
+        vis_properties = selection.vis_properties
+
+        failed = vis_properties.apply_many({(255, 0, 0, 255, None): [products[0]]})
+        assert failed == 0
+        assert selection.count == 0
+
+        selection.add(products[0])
+        assert (255, 0, 0) == vis_properties.get_real_color()[1:]
+        selection.clear()
+
+
 def test_repr():
     with CATIADocHandler(cat_part_measurable) as caa:
         part_document: PartDocument = caa.document
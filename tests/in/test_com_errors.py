@@ -0,0 +1,76 @@
+#! /usr/bin/python3.9
+
+import pytest
+from pywintypes import com_error
+
+from pycatia.exception_handling import CATIAApplicationException
+from pycatia.exception_handling.com_errors import CATIABusyException
+from pycatia.exception_handling.com_errors import CATIAMethodFailedException
+from pycatia.exception_handling.com_errors import DISP_E_EXCEPTION
+from pycatia.exception_handling.com_errors import E_FAIL
+from pycatia.exception_handling.com_errors import RPC_E_CALL_REJECTED
+from pycatia.exception_handling.com_errors import RetryPolicy
+from pycatia.exception_handling.com_errors import get_com_error_counters
+from pycatia.exception_handling.com_errors import reset_com_error_counters
+from pycatia.exception_handling.com_errors import translate_com_errors
+
+no_delay = RetryPolicy(retries=3, delay=0)
+
+
+def test_retry_busy():
+    reset_com_error_counters()
+    calls = []
+
+    @translate_com_errors(retry_policy=no_delay)
+    def busy_twice():
+        calls.append(True)
+        if len(calls) < 3:
+            raise com_error(RPC_E_CALL_REJECTED, "Call was rejected by callee.", None, None)
+        return "done"
+
+    assert busy_twice() == "done"
+    assert get_com_error_counters() == {"retries": 2}
+
+
+def test_retry_busy_exhausted():
+    reset_com_error_counters()
+
+    @translate_com_errors(retry_policy=no_delay)
+    def always_busy():
+        raise com_error(RPC_E_CALL_REJECTED, "Call was rejected by callee.", None, None)
+
+    with pytest.raises(CATIABusyException):
+        always_busy()
+
+    assert get_com_error_counters() == {"retries": 3, "CATIABusyException": 1}
+
+
+def test_translate_method_failed():
+    reset_com_error_counters()
+    excepinfo = (0, "CATIAPart", "The method Open failed", None, 0, E_FAIL)
+
+    @translate_com_errors('Could not open "{file_name}".', retry_policy=no_delay)
+    def open_document(file_name):
+        raise com_error(DISP_E_EXCEPTION, "Exception occurred.", excepinfo, None)
+
+    with pytest.raises(CATIAMethodFailedException) as e:
+        open_document("part.CATPart")
+
+    # existing except clauses still work.
+    assert isinstance(e.value, CATIAApplicationException)
+    assert isinstance(e.value, com_error)
+    assert e.value.hresult == E_FAIL
+    assert str(e.value) == 'Could not open "part.CATPart". The method Open failed'
+    assert get_com_error_counters() == {"CATIAMethodFailedException": 1}
+
+
+def test_translate_message_defaults():
+    # the placeholders can name arguments left to their default value.
+    @translate_com_errors('Could not open "{file_name}" in {mode} mode.', retry_policy=no_delay)
+    def open_document(file_name, mode="read"):
+        raise com_error(E_FAIL, "Unspecified error", None, None)
+
+    with pytest.raises(CATIAMethodFailedException) as e:
+        open_document("part.CATPart")
+
+    assert str(e.value) == 'Could not open "part.CATPart" in read mode. Unspecified error'
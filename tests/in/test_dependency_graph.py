@@ -0,0 +1,89 @@
+#! /usr/bin/python3.9
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pycatia.exception_handling import CATIAApplicationException
+from pycatia.scripts.dependency_graph import DependencyGraph
+
+
+def create_assembly(folder):
+    """
+    top.CATProduct -> sub.CATProduct -> part_1.CATPart
+                   -> part_2.CATPart
+    """
+
+    files = {
+        "top.CATProduct": [r"C:\project\sub.CATProduct", r"C:\project\part_2.CATPart"],
+        "sub.CATProduct": [r"C:\project\part_1.CATPart"],
+        "part_1.CATPart": [],
+        "part_2.CATPart": [],
+    }
+
+    for name, links in files.items():
+        content = b"V5_CFV2\x00" + b"".join(link.encode("ascii") + b"\x00\x00" for link in links)
+        Path(folder, name).write_bytes(content)
+
+    return [Path(folder, name) for name in files]
+
+
+def worker_session():
+    # stands for the CATIA session of a worker.
+    return os.getpid()
+
+
+def process_document(application, document):
+    return application, document.upper()
+
+
+def test_waves():
+    graph = DependencyGraph()
+    graph.add_document("top", ["sub", "part_2"])
+    graph.add_document("sub", ["part_1"])
+
+    assert graph.waves() == [["part_1", "part_2"], ["sub"], ["top"]]
+    assert graph.topological_order() == ["part_1", "part_2", "sub", "top"]
+    assert graph.dependents("part_1") == {"sub"}
+    assert graph.all_dependencies("top") == {"sub", "part_1", "part_2"}
+
+
+def test_circular_links():
+    graph = DependencyGraph()
+    graph.add_document("a", ["b"])
+    graph.add_document("b", ["a"])
+
+    with pytest.raises(CATIAApplicationException):
+        graph.waves()
+
+
+def test_from_files(tmp_path):
+    files = create_assembly(tmp_path)
+    cache_file = Path(tmp_path, "links.json")
+
+    graph = DependencyGraph.from_files(files, cache_file=cache_file, workers=1)
+    top, sub, part_1, part_2 = [str(file) for file in files]
+
+    assert graph.dependencies(top) == {sub, part_2}
+    assert graph.dependencies(sub) == {part_1}
+    assert graph.waves() == [sorted([part_1, part_2]), [sub], [top]]
+    assert cache_file.is_file()
+
+    cached = DependencyGraph.from_files(files, cache_file=cache_file, workers=1)
+    assert cached.links == graph.links
+    assert DependencyGraph.load(cache_file).links == graph.links
+
+
+def test_execute():
+    graph = DependencyGraph()
+    graph.add_document("top", ["sub", "part_2"])
+    graph.add_document("sub", ["part_1"])
+
+    results = graph.execute(process_document, worker_session, workers=2)
+
+    assert {document: name for document, (_, name) in results.items()} == {
+        "part_1": "PART_1", "part_2": "PART_2", "sub": "SUB", "top": "TOP"
+    }
+    # each worker has its own session.
+    assert os.getpid() not in {application for application, _ in results.values()}
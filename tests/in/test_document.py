@@ -11,6 +11,7 @@ from pycatia.in_interfaces.document import Document
 from pycatia.mec_mod_interfaces.part_document import PartDocument
 from pycatia.product_structure_interfaces.product_document import ProductDocument
 from pycatia.types.document import document_types
+from pycatia.types.document_header import read_document_header
 from tests.common_vars import caa
 from tests.source_files import cat_part_measurable
 from tests.source_files import cat_product
@@ -223,6 +224,37 @@ def test_open_document_stp():
     document.close()
 
 
+def test_open_many_documents():
+    documents = caa.documents
+    results = documents.open_many([cat_part_measurable, cat_product], mode="read", concurrency=1)
+
+    assert type(results[Path(cat_part_measurable)]["document"]) is PartDocument
+    assert type(results[Path(cat_product)]["document"]) is ProductDocument
+
+    for result in results.values():
+        assert result["error"] is None
+        assert result["load_time"] >= 0
+        assert result["memory_delta"] is None
+        result["document"].close()
+
+
+def test_read_document_header_source_files():
+    # the headers of the documents saved by CATIA for the tests, read without CATIA.
+    header = read_document_header(cat_part_measurable)
+    assert header.part_number == "cat_part_measurable"
+    assert header.revision == "A.1"
+    assert header.last_save_version["Version"] == "5"
+    assert header.links == []
+
+    header = read_document_header(cat_product)
+    assert header.part_number == "cat_product_1"
+    assert header.revision == "A.1"
+    assert header.nomenclature == "pycatia product for testing"
+    link_names = [Path(link).name for link in header.links]
+    assert "product_sub_1.CATProduct" in link_names
+    assert "product_sub_2.CATProduct" in link_names
+
+
 def test_read_document():
     documents = caa.documents
     document = documents.read(cat_part_measurable)
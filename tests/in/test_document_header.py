@@ -0,0 +1,86 @@
+#! /usr/bin/python3.9
+
+from pathlib import Path
+
+import pytest
+
+from pycatia.exception_handling import CATIAApplicationException
+from pycatia.types.document_header import read_document_header
+from pycatia.types.document_header import read_document_headers
+
+cat_system = Path("tests/cat_files/FunctionalSystem1.CATSystem")
+design_table = Path("tests/cat_files/design_table_1.txt")
+
+
+def product_header_bytes(own_path=b"Product1.CATProduct", links=b""):
+    return (
+        b"V5_CFV2\x00\x00\x00"
+        b"C:\\parts\\Part1.CATPart\x00\x00\x00\x00"
+        + links
+        + "D:\\parts\\Sub.CATProduct".encode("utf-16-le")
+        + b"\x00\x00\x00\x00" + own_path + b"\x00"
+        b"\x0a\x00PartNumber\x0e\x00\x00\x00\x05\x00\x00\x00PN-01"
+        b"\x08\x00Revision\x0e\x00\x00\x00\x01\x00\x00\x00A"
+    )
+
+
+def test_read_document_header():
+    header = read_document_header(cat_system)
+
+    assert header.minimal_version_to_read == "CATIAV5R21"
+    assert header.last_save_version["Version"] == "5"
+    assert header.last_save_version["Release"] == "21"
+    assert header.first_streamed_version["BuildDate"] == "04-14-2011.20.00"
+    assert header.part_number is None
+    assert header.links == []
+
+    preview = header.read_preview()
+    assert preview.startswith(b"\xff\xd8")
+    assert preview.endswith(b"\xff\xd9")
+
+
+def test_read_document_header_str():
+    header = read_document_header(str(cat_system))
+
+    assert header.minimal_version_to_read == "CATIAV5R21"
+
+
+def test_read_document_header_product(tmp_path):
+    file_name = Path(tmp_path, "Product1.CATProduct")
+    file_name.write_bytes(product_header_bytes())
+
+    header = read_document_header(file_name)
+
+    assert header.part_number == "PN-01"
+    assert header.revision == "A"
+    assert header.links == ["C:\\parts\\Part1.CATPart", "D:\\parts\\Sub.CATProduct"]
+
+
+def test_read_document_header_own_path(tmp_path):
+    file_name = Path(tmp_path, "Product1.CATProduct")
+
+    # the Windows path the document was saved to isn't a link, on any OS.
+    file_name.write_bytes(product_header_bytes(b"C:\\work\\Product1.CATProduct"))
+    assert read_document_header(file_name).links == ["C:\\parts\\Part1.CATPart", "D:\\parts\\Sub.CATProduct"]
+
+    # a document of the same name in another folder is a link.
+    other = b"E:\\other\\product1.CATProduct\x00\x00\x00\x00"
+    file_name.write_bytes(product_header_bytes(str(file_name.resolve()).encode(), other))
+    assert read_document_header(file_name).links == [
+        "C:\\parts\\Part1.CATPart", "E:\\other\\product1.CATProduct", "D:\\parts\\Sub.CATProduct"
+    ]
+
+
+def test_read_document_header_not_v5():
+    with pytest.raises(CATIAApplicationException):
+        read_document_header(design_table)
+
+    with pytest.raises(FileNotFoundError):
+        read_document_header("tests/cat_files/missing.CATPart")
+
+
+def test_read_document_headers():
+    headers = dict(read_document_headers([cat_system, design_table], workers=1))
+
+    assert headers[cat_system].minimal_version_to_read == "CATIAV5R21"
+    assert headers[design_table] is None
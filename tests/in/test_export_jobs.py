@@ -0,0 +1,181 @@
+#! /usr/bin/python3.9
+
+import os
+import zipfile
+
+import pytest
+
+from pycatia.exception_handling.exceptions import CATIAApplicationException
+from pycatia.scripts.export_jobs import ExportEngine
+from pycatia.scripts.export_jobs import ZipSink
+from pycatia.scripts.file_hashes import output_stem
+
+
+class FakeDocument:
+
+    def __init__(self, application, file_name):
+        self.application = application
+        self.file_name = file_name
+
+    def export_data(self, file_name, file_type, overwrite=False):
+        if file_type == 'bad':
+            raise ValueError('unsupported format')
+        self.application.exports.append((self.file_name, file_type))
+        with open(file_name, 'wb') as file:
+            file.write(open(self.file_name, 'rb').read() + file_type.encode())
+
+    def close(self):
+        if self.application.fail_close:
+            raise RuntimeError('close failed')
+
+
+class FakeDocuments:
+
+    def __init__(self, application):
+        self.application = application
+
+    def open(self, file_name):
+        return FakeDocument(self.application, file_name)
+
+
+class FakeApplication:
+    """
+    Exports the documents by appending the format to their content.
+    """
+
+    def __init__(self):
+        self.exports = []
+        self.documents = FakeDocuments(self)
+        self.fail_close = False
+
+
+def failing_session():
+    # the session function of the workers, which can't connect to CATIA.
+    raise RuntimeError('CATIA is not running')
+
+
+@pytest.fixture
+def sources(tmp_path):
+    files = []
+    for name in ('part_1.CATPart', 'part_2.CATPart'):
+        file_name = tmp_path / name
+        file_name.write_bytes(name.encode())
+        files.append(str(file_name))
+    return files
+
+
+def test_export_engine(tmp_path, sources):
+    application = FakeApplication()
+    sent = []
+    engine = ExportEngine(tmp_path / 'out', application=application, sink=lambda *args: sent.append(args))
+
+    jobs = [(file_name, ('stp', 'stl', 'bad')) for file_name in sources]
+    outputs = engine.run(jobs)
+    assert 4 == len(application.exports)
+    assert {'stp', 'stl'} == set(outputs[sources[0]])
+    assert b'part_1.CATPartstp' == open(outputs[sources[0]]['stp'], 'rb').read()
+    assert 4 == len(sent)
+    assert 2 == engine.statistics['stp']['exported']
+    assert 0 == engine.statistics['stp']['skipped']
+    assert 2 == engine.statistics['bad']['failed']
+    assert set(engine.throughput()) == {'stp', 'stl', 'bad'}
+
+    # the outputs of unchanged documents are skipped, also by a new engine reading the cache.
+    application.exports.clear()
+    sent.clear()
+    engine = ExportEngine(tmp_path / 'out', application=application, sink=lambda *args: sent.append(args))
+    outputs = engine.run(jobs)
+    assert not application.exports
+    assert 2 == engine.statistics['stp']['skipped']
+    assert not sent
+    assert {'stp', 'stl'} == set(outputs[sources[1]])
+
+    # a changed document is exported again.
+    with open(sources[1], 'ab') as file:
+        file.write(b' v2')
+    os.utime(sources[1], (1, 1))
+    engine.run(jobs)
+    assert [(sources[1], 'stp'), (sources[1], 'stl')] == application.exports
+
+
+def test_zip_sink(tmp_path, sources):
+    archive = tmp_path / 'release.zip'
+    with ZipSink(archive) as sink:
+        engine = ExportEngine(tmp_path / 'out', application=FakeApplication(), sink=sink)
+        engine.run([(file_name, ('stp',)) for file_name in sources])
+
+    names = sorted(f'{output_stem(file_name)}.stp' for file_name in sources)
+    with zipfile.ZipFile(archive) as zip_file:
+        assert names == sorted(zip_file.namelist())
+
+    # a document exported again replaces its output in the archive.
+    with open(sources[0], 'ab') as file:
+        file.write(b' v2')
+    os.utime(sources[0], (1, 1))
+    with ZipSink(archive) as sink:
+        engine = ExportEngine(tmp_path / 'out', application=FakeApplication(), sink=sink)
+        engine.run([(file_name, ('stp',)) for file_name in sources])
+
+    with zipfile.ZipFile(archive) as zip_file:
+        assert names == sorted(zip_file.namelist())
+        assert b'part_1.CATPart v2stp' == zip_file.read(f'{output_stem(sources[0])}.stp')
+
+
+def test_output_name(tmp_path):
+    engine = ExportEngine(tmp_path / 'out', application=FakeApplication())
+
+    # documents with the same name in different folders have different outputs.
+    first = engine.output_name(tmp_path / 'a' / 'part.CATPart', 'stp')
+    second = engine.output_name(tmp_path / 'b' / 'part.CATPart', 'stp')
+    assert first != second
+    assert first.endswith('.stp')
+    assert os.path.basename(first).startswith('part ')
+
+
+def test_stale_output(tmp_path, sources):
+    class SilentDocument(FakeDocument):
+        def export_data(self, file_name, file_type, overwrite=False):
+            pass
+
+    application = FakeApplication()
+    application.documents.open = lambda file_name: SilentDocument(application, file_name)
+    engine = ExportEngine(tmp_path / 'out', application=application)
+    (tmp_path / 'out').mkdir()
+    output = engine.output_name(sources[0], 'stp')
+    with open(output, 'wb') as file:
+        file.write(b'stale')
+
+    # the output of a previous run isn't taken for the output of an export writing nothing.
+    outputs = engine.run([(sources[0], ('stp',))])
+    assert not outputs[sources[0]]
+    assert 1 == engine.statistics['stp']['failed']
+    assert not os.path.isfile(output)
+
+
+def test_failing_session(tmp_path, sources):
+    engine = ExportEngine(tmp_path / 'out', workers=2, session=failing_session, chunk_size=1)
+
+    # the failures of the workers are counted, the run isn't interrupted.
+    outputs = engine.run([(file_name, ('stp', 'stl')) for file_name in sources])
+    assert {sources[0]: {}, sources[1]: {}} == outputs
+    assert 2 == engine.statistics['stp']['failed']
+    assert 2 == engine.statistics['stl']['failed']
+    assert (tmp_path / 'out' / 'exports.json').is_file()
+
+
+def test_failing_close(tmp_path, sources):
+    application = FakeApplication()
+    application.fail_close = True
+    engine = ExportEngine(tmp_path / 'out', application=application)
+
+    # the outputs are kept when a document fails to close.
+    outputs = engine.run([(sources[0], ('stp',))])
+    assert {'stp'} == set(outputs[sources[0]])
+    assert 1 == engine.statistics['stp']['exported']
+
+
+def test_export_engine_arguments(tmp_path):
+    with pytest.raises(CATIAApplicationException):
+        ExportEngine(tmp_path, workers=2)
+    with pytest.raises(CATIAApplicationException):
+        ExportEngine(tmp_path)
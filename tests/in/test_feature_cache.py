@@ -0,0 +1,81 @@
+#! /usr/bin/python3.9
+
+import pytest
+
+from pycatia.scripts.feature_cache import FeatureCache
+from pycatia.system_interfaces.any_object import AnyObject
+
+
+class ComObject:
+    # _oleobj_ identifies the CATIA object like the IUnknown of the win32com objects.
+
+    def __init__(self, name):
+        self._oleobj_ = name
+        self.Name = name
+        self.calls = []
+
+    def CreateReferenceFromObject(self, feature):
+        self.calls.append(feature.Name)
+        return ComObject(f'Reference of {feature.Name}')
+
+
+def test_feature_cache():
+    cache = FeatureCache()
+    plane = ComObject('xy plane')
+
+    # the pycatia objects of the same feature share its value.
+    cache[AnyObject(plane)] = 'reference'
+    assert AnyObject(plane) in cache
+    assert 'reference' == cache[AnyObject(ComObject('xy plane'))]
+    assert AnyObject(ComObject('yz plane')) not in cache
+    assert 1 == len(cache)
+
+    assert 'reference' == cache.pop(AnyObject(plane))
+    assert cache.get(AnyObject(plane)) is None
+    cache[AnyObject(plane)] = 'reference'
+    cache.clear()
+    assert not len(cache)
+
+
+def test_part_references():
+    pytest.importorskip('pywintypes')
+    from pycatia.mec_mod_interfaces.part import Part
+
+    part_com_object = ComObject('Part1')
+    part = Part(part_com_object)
+    plane = ComObject('xy plane')
+
+    # like part.origin_elements.plane_xy, a new pycatia object of the plane each time.
+    first = part.create_reference_from_object(AnyObject(plane))
+    second = part.create_reference_from_object(AnyObject(plane))
+
+    assert first is second
+    assert ['xy plane'] == part_com_object.calls
+
+    part.clear_reference_cache()
+    assert first is not part.create_reference_from_object(AnyObject(plane))
+
+
+def test_classify_many():
+    pytest.importorskip('pywintypes')
+    from pycatia.hybrid_shape_interfaces.hybrid_shape_factory import HybridShapeFactory
+    from pycatia.mec_mod_interfaces.part import Part
+
+    class SystemService(ComObject):
+        def Evaluate(self, vba_code, language, vba_function_name, args):
+            self.calls.append([feature.Name for feature in args[1]])
+            return [1] * len(args[1])
+
+    system_service = SystemService('SystemService')
+    application = ComObject('CATIA')
+    application.SystemService = system_service
+    factory_com_object = ComObject('HybridShapeFactory')
+    factory_com_object.Application = application
+    part = Part(ComObject('Part1'))
+    point = ComObject('Point.1')
+
+    types = HybridShapeFactory(factory_com_object, part).classify_many([AnyObject(point), AnyObject(point)])
+    assert ['Point', 'Point'] == [feature_type.name for feature_type in types]
+    # another pycatia object of the classified feature, from another factory of the part, isn't sent again.
+    HybridShapeFactory(factory_com_object, part).classify_many([AnyObject(point)])
+    assert [['Point.1']] == system_service.calls
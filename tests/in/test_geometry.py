@@ -0,0 +1,110 @@
+#! /usr/bin/python3.9
+
+import random
+
+import pytest
+from pytest import approx
+
+from pycatia.scripts import geometry
+from pycatia.scripts.geometry import KDTree
+from pycatia.scripts.geometry import aabb
+from pycatia.scripts.geometry import axis_system_matrix
+from pycatia.scripts.geometry import box_corners
+from pycatia.scripts.geometry import min_distance
+from pycatia.scripts.geometry import nearest_distances
+from pycatia.scripts.geometry import obb
+from pycatia.scripts.geometry import to_global
+from pycatia.scripts.geometry import to_local
+
+# an axis system rotated 45 degrees around z, at (10, 20, 30).
+matrix = axis_system_matrix((10, 20, 30), (1, 1, 0), (-1, 1, 0))
+# the corners of a 100 x 40 x 10 box centered on the origin.
+box = [(x, y, z) for x in (-50, 50) for y in (-20, 20) for z in (-5, 5)]
+
+
+@pytest.fixture(autouse=True, params=['numpy', 'python'])
+def implementation(request, monkeypatch):
+    # each test runs with NumPy and with the fallback without it.
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(geometry, '_numpy', lambda: None)
+    return request.param
+
+
+def test_aabb():
+    assert ((-50, -20, -5), (50, 20, 5)) == aabb(box)
+
+    with pytest.raises(ValueError):
+        aabb([])
+
+
+def test_axis_system_matrix():
+    assert matrix[0][:3] == approx((2 ** -0.5, -2 ** -0.5, 0))
+    assert (10, 20, 30) == (matrix[0][3], matrix[1][3], matrix[2][3])
+
+    left_handed = axis_system_matrix((0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, -1))
+    assert -1 == left_handed[2][2]
+
+
+def test_local_global():
+    points = to_global(matrix, box)
+    assert [approx(point) for point in box] == to_local(matrix, points)
+    assert approx((10, 20, 30)) == to_global(matrix, [(0, 0, 0)])[0]
+
+
+def test_obb():
+    points = to_global(matrix, box)
+    center, axes, half_sizes = obb(points)
+
+    assert approx((10, 20, 30)) == center
+    assert approx((50, 20, 5)) == half_sizes
+    # the longest axis is the x axis of the rotated box, in either direction.
+    assert abs(axes[0][0] * matrix[0][0] + axes[0][1] * matrix[1][0]) == approx(1)
+
+    def rounded(corners):
+        return {tuple(round(c, 6) for c in corner) for corner in corners}
+
+    assert rounded(points) == rounded(box_corners(center, axes, half_sizes))
+
+
+def test_nearest_distances():
+    random.seed(0)
+    targets = [(random.uniform(0, 100), random.uniform(0, 100), random.uniform(0, 100)) for _ in range(500)]
+    points = [(random.uniform(0, 100), random.uniform(0, 100), random.uniform(0, 100)) for _ in range(50)]
+
+    def brute_force(point):
+        distances = [sum((a - b) ** 2 for a, b in zip(point, target)) ** 0.5 for target in targets]
+        return min(range(len(targets)), key=distances.__getitem__), min(distances)
+
+    assert [brute_force(point) for point in points] == nearest_distances(points, targets)
+    assert min(distance for _, distance in map(brute_force, points)) == min_distance(points, targets)
+
+    # far from the targets, and from generators.
+    far = [(x + 1000, y, z) for x, y, z in points]
+    nearest = nearest_distances((point for point in far), iter(targets))
+    assert [brute_force(point) for point in far] == [(index, approx(distance)) for index, distance in nearest]
+
+
+def test_arrays(implementation):
+    if implementation == 'python':
+        pytest.skip('NumPy arrays are returned with NumPy only.')
+    import numpy
+
+    points = numpy.array(box, dtype=float)
+    local = to_local(matrix, points)
+    assert isinstance(local, numpy.ndarray)
+    assert numpy.allclose(points, to_global(matrix, local))
+    assert isinstance(to_local(matrix, box), list)
+
+    assert ((-50, -20, -5), (50, 20, 5)) == aabb(points)
+    assert [(index, 0) for index in range(len(box))] == nearest_distances(points, points)
+    assert 0 == min_distance(points[:4], points)
+
+
+def test_kd_tree():
+    tree = KDTree([(0, 0, 0), (10, 0, 0), (0, 10, 0)])
+    assert (1, 1.0) == tree.nearest((9, 0, 0))
+
+    with pytest.raises(ValueError):
+        KDTree([]).nearest((0, 0, 0))
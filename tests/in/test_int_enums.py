@@ -0,0 +1,39 @@
+#! /usr/bin/python3.9
+
+import pytest
+
+from pycatia.enumeration import enumeration_types
+from pycatia.enumeration.int_enums import cat_capture_format
+from pycatia.enumeration.int_enums import decode
+from pycatia.enumeration.int_enums import enum_name
+from pycatia.enumeration.int_enums import enum_value
+from pycatia.enumeration.int_enums import get_enum
+
+
+def test_int_enums():
+    for name, names in vars(enumeration_types).items():
+        if isinstance(names, tuple):
+            enum = get_enum(name)
+            assert len(enum) == len(names)
+            assert [member.value for member in enum] == list(range(len(names)))
+
+    assert cat_capture_format.catCaptureFormatBMP == enumeration_types.cat_capture_format.index("catCaptureFormatBMP")
+    assert get_enum("cat_capture_format") is cat_capture_format
+
+
+def test_names_and_values():
+    assert enum_value("geometrical_feature_type", "Solid / Volume") == 7
+    assert enum_name("geometrical_feature_type", 7) == "Solid / Volume"
+    assert get_enum("geometrical_feature_type").Solid_Volume == 7
+
+    with pytest.raises(ValueError):
+        enum_value("cat_capture_format", "catCaptureFormatGIF")
+    with pytest.raises(ValueError):
+        enum_name("geometrical_feature_type", -1)
+    with pytest.raises(ValueError):
+        enum_name("geometrical_feature_type", 100)
+
+
+def test_decode():
+    assert decode("cat_conflict_status", 1) is get_enum("cat_conflict_status")(1)
+    assert decode("cat_conflict_status", 99) == 99
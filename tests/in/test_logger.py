@@ -0,0 +1,67 @@
+#! /usr/bin/python3.9
+
+import json
+import logging
+
+from pycatia.cat_logger import ContextFilter
+from pycatia.cat_logger import JSONFormatter
+from pycatia.cat_logger import RateLimitFilter
+from pycatia.cat_logger import com_call
+from pycatia.cat_logger import create_logger
+from pycatia.cat_logger import silence
+
+
+def make_record(message, level=logging.WARNING, line_number=10):
+    return logging.LogRecord("pycatia", level, "module.py", line_number, message, None, None)
+
+
+def test_create_logger_once():
+    logger = create_logger()
+
+    assert create_logger() is logger
+    assert len(logger.handlers) == 1
+
+
+def test_silence():
+    logger = create_logger()
+
+    silence()
+    assert not logger.isEnabledFor(logging.WARNING)
+
+    silence(False)
+    assert logger.isEnabledFor(logging.WARNING)
+
+
+def test_json_format():
+    record = make_record("Could not open %s.", logging.INFO)
+    record.args = ("part.CATPart",)
+
+    with com_call("Documents.Open", file_name="part.CATPart"):
+        ContextFilter().filter(record)
+
+    data = json.loads(JSONFormatter().format(record))
+
+    assert data["level"] == "INFO"
+    assert data["message"] == "Could not open part.CATPart."
+    assert data["com_call"] == {"name": "Documents.Open", "file_name": "part.CATPart"}
+
+
+def test_rate_limit():
+    rate_limit = RateLimitFilter(interval=60)
+
+    assert rate_limit.filter(make_record("first"))
+    assert not rate_limit.filter(make_record("second"))
+    assert not rate_limit.filter(make_record("third"))
+    # another line or a lower level is not limited.
+    assert rate_limit.filter(make_record("other", line_number=20))
+    assert rate_limit.filter(make_record("info", level=logging.INFO))
+
+    rate_limit.interval = 0
+    record = make_record("fourth")
+    assert rate_limit.filter(record)
+
+    rate_limit.interval = 60
+    rate_limit._last_seen.clear()
+    record = make_record("fifth")
+    assert rate_limit.filter(record)
+    assert record.suppressed == 2
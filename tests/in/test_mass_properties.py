@@ -0,0 +1,59 @@
+#! /usr/bin/python3.9
+
+from pytest import approx
+
+from pycatia.scripts.mass_properties import MassProperties
+
+
+def test_combine():
+    left = MassProperties(1.0, (-1.0, 0.0, 0.0))
+    right = MassProperties(1.0, (1.0, 0.0, 0.0))
+
+    combined = MassProperties.combine([left, right])
+
+    assert combined.mass == 2.0
+    assert combined.cog == (0.0, 0.0, 0.0)
+    assert combined.inertia == ((0.0, 0.0, 0.0), (0.0, 2.0, 0.0), (0.0, 0.0, 2.0))
+    assert MassProperties.combine([]).mass == 0.0
+
+
+def test_combine_point_masses():
+    # 2 kg at the origin and 3 kg at x = 10 mm: the centre of gravity is at x = 6 mm
+    # and the inertia around y and z is 2 * 6**2 + 3 * 4**2 = 120 kg.mm2.
+    combined = MassProperties.combine([MassProperties(2.0, (0.0, 0.0, 0.0)), MassProperties(3.0, (10.0, 0.0, 0.0))])
+
+    assert combined.mass == 5.0
+    assert combined.cog == approx((6.0, 0.0, 0.0))
+    assert combined.inertia[0] == approx((0.0, 0.0, 0.0))
+    assert combined.inertia[1] == approx((0.0, 120.0, 0.0))
+    assert combined.inertia[2] == approx((0.0, 0.0, 120.0))
+
+    # the inertia of the items is added to the shift.
+    rod = MassProperties(3.0, (10.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0, 25.0, 0.0, 0.0, 0.0, 25.0))
+    combined = MassProperties.combine([MassProperties(2.0, (0.0, 0.0, 0.0)), rod])
+    assert combined.inertia[1][1] == approx(145.0)
+
+
+def test_transformed():
+    box = MassProperties(2.0, (1.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0, 2.0, 0.0, 0.0, 0.0, 3.0))
+    # rotation of 90 degrees around z and translation of 10 along x.
+    matrix = (
+        (0.0, -1.0, 0.0, 10.0),
+        (1.0, 0.0, 0.0, 0.0),
+        (0.0, 0.0, 1.0, 0.0),
+        (0.0, 0.0, 0.0, 1.0),
+    )
+
+    moved = box.transformed(matrix)
+
+    assert moved.mass == 2.0
+    assert moved.cog == approx((10.0, 1.0, 0.0))
+    assert moved.inertia == ((2.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 3.0))
+
+
+def test_dict():
+    box = MassProperties(2.0, (1.0, 2.0, 3.0), (1.0, 0.0, 0.0, 0.0, 2.0, 0.0, 0.0, 0.0, 3.0))
+
+    loaded = MassProperties.from_dict(box.to_dict())
+
+    assert (loaded.mass, loaded.cog, loaded.inertia) == (box.mass, box.cog, box.inertia)
@@ -458,6 +458,26 @@ def test_centre_of_gravity():
         )
 
 
+def test_inertias_compute_many():
+    with CATIADocHandler(cat_part_measurable) as caa:
+        document = caa.document
+        spa_workbench = document.spa_workbench()
+        part = PartDocument(document.com_object).part
+        inertias = spa_workbench.inertias
+        count = inertias.count
+
+        body = part.bodies.item(1)
+        results = inertias.compute_many([body, body], density=1000)
+
+        assert len(results) == 2
+        assert results[0]["error"] is None
+        assert round(results[0]["mass"], 6) == 0.5
+        assert round_tuple(results[0]["cog"]) == (50, 50, 25)
+        assert len(results[0]["matrix"]) == 3
+        assert results[0] == results[1]
+        assert inertias.count == count
+
+
 def test_angle():
     with CATIADocHandler(cat_part_measurable) as caa:
         document = caa.document
@@ -0,0 +1,91 @@
+#! /usr/bin/python3.9
+
+from array import array
+
+import pytest
+
+from pycatia.scripts import mesh as mesh_module
+from pycatia.scripts.mesh import Mesh
+
+# a unit square made of two triangles.
+square = Mesh(array('d', [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0]), array('i', [0, 1, 2, 0, 2, 3]))
+translation = (
+    (1.0, 0.0, 0.0, 10.0),
+    (0.0, 1.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0, 0.0),
+    (0.0, 0.0, 0.0, 1.0),
+)
+# 90 degrees around z.
+rotation = (
+    (0.0, -1.0, 0.0, 0.0),
+    (1.0, 0.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0, 0.0),
+    (0.0, 0.0, 0.0, 1.0),
+)
+
+
+@pytest.fixture(autouse=True, params=['numpy', 'python'])
+def implementation(request, monkeypatch):
+    # each test runs with NumPy and with the fallback without it.
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(mesh_module, '_numpy', lambda: None)
+    return request.param
+
+
+def test_mesh():
+    assert 4 == square.vertex_count
+    assert 2 == square.triangle_count
+    assert ((0, 0, 0), (1, 1, 0), (0, 1, 0)) == square.triangle_points(1)
+    assert ((0, 0, 0), (1, 1, 0)) == square.bounding_box()
+
+    with pytest.raises(ValueError):
+        Mesh().bounding_box()
+
+
+def test_transformed_and_merge():
+    moved = square.transformed(translation)
+    assert ((10, 0, 0), (11, 1, 0)) == moved.bounding_box()
+
+    merged = Mesh.merge([square, moved])
+    assert 8 == merged.vertex_count
+    assert [0, 1, 2, 0, 2, 3, 4, 5, 6, 4, 6, 7] == list(merged.triangles)
+    assert ((0, 0, 0), (11, 1, 0)) == merged.bounding_box()
+
+    turned = square.transformed(rotation)
+    assert [(0, 0, 0), (0, 1, 0), (-1, 1, 0), (-1, 0, 0)] == turned.points()
+    # the mesh itself isn't moved.
+    assert (1, 0, 0) == square.points()[1]
+
+
+def test_save_load(tmp_path):
+    file_name = tmp_path / 'square.mesh'
+    square.save(file_name)
+
+    mesh = Mesh.load(file_name)
+    assert list(square.vertices) == list(mesh.vertices)
+    assert list(square.triangles) == list(mesh.triangles)
+    assert ((10, 0, 0), (11, 1, 0)) == mesh.transformed(translation).bounding_box()
+    assert 8 == Mesh.merge([mesh, mesh]).vertex_count
+    copy = mesh.copy()
+    mesh.close()
+    # the copy doesn't use the memory map.
+    assert square.points() == copy.points()
+    assert list(square.triangles) == list(copy.triangles)
+
+    (tmp_path / 'other.mesh').write_bytes(b'\0' * 32)
+    with pytest.raises(ValueError):
+        Mesh.load(tmp_path / 'other.mesh')
+
+
+def test_shared_memory():
+    block = square.to_shared_memory()
+    try:
+        mesh = Mesh.from_shared_memory(block.name)
+        assert square.points() == mesh.points()
+        assert list(square.triangles) == list(mesh.triangles)
+        mesh.close()
+    finally:
+        block.close()
+        block.unlink()
@@ -0,0 +1,135 @@
+#! /usr/bin/python3.9
+
+from array import array
+import math
+import struct
+
+import pytest
+
+from pycatia.scripts.mesh import Mesh
+from pycatia.scripts.mesh_readers import read_mesh
+from pycatia.scripts.mesh_readers import read_stl
+from pycatia.scripts.mesh_readers import read_vrml
+from pycatia.scripts.mesh_readers import weld
+
+# a unit square made of two triangles.
+square = Mesh(array('d', [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0]), array('i', [0, 1, 2, 0, 2, 3]))
+
+vrml_square = """#VRML V2.0 utf8
+# exported square, the face is a quad.
+Transform {
+  translation 10 0 0
+  rotation 0 0 1 1.5707963267948966
+  children [
+    Shape {
+      appearance Appearance { material Material { diffuseColor 0.8 0.8 0.8 } }
+      geometry IndexedFaceSet {
+        coord Coordinate {
+          point [ 0 0 0, 1 0 0,
+                  1 1 0, 0 1 0 ]
+        }
+        coordIndex [ 0, 1, 2, 3, -1 ]
+      }
+    }
+  ]
+}
+WorldInfo { title "a [title] with {brackets}" }
+"""
+
+
+def write_binary_stl(file_name, triangles):
+    with open(file_name, 'wb') as file:
+        file.write(b'\0' * 80)
+        file.write(struct.pack('<I', len(triangles)))
+        for triangle in triangles:
+            file.write(struct.pack('<12fH', 0, 0, 1, *[c for point in triangle for c in point], 0))
+
+
+def write_ascii_stl(file_name, triangles):
+    with open(file_name, 'w') as file:
+        file.write('solid square\n')
+        for triangle in triangles:
+            file.write('facet normal 0 0 1\n outer loop\n')
+            for point in triangle:
+                file.write(f'  vertex {point[0]} {point[1]} {point[2]}\n')
+            file.write(' endloop\nendfacet\n')
+        file.write('endsolid square\n')
+
+
+@pytest.mark.parametrize('write', [write_binary_stl, write_ascii_stl])
+def test_read_stl(tmp_path, write):
+    file_name = tmp_path / 'square.stl'
+    write(file_name, [square.triangle_points(0), square.triangle_points(1)])
+
+    # a small chunk size to parse the ascii file in several chunks.
+    mesh = read_stl(file_name, chunk_size=64)
+    # the shared vertices are merged.
+    assert square.points() == mesh.points()
+    assert list(square.triangles) == list(mesh.triangles)
+
+
+@pytest.mark.parametrize('tolerance', [0.0, 1e-4])
+def test_read_binary_stl_numpy(tmp_path, monkeypatch, tolerance):
+    pytest.importorskip('numpy')
+    from pycatia.scripts import mesh_readers
+
+    file_name = tmp_path / 'squares.stl'
+    moved = [(x + 1e-7, y, z) for x, y, z in square.triangle_points(1)]
+    write_binary_stl(file_name, [square.triangle_points(1), square.triangle_points(0), moved])
+
+    mesh = read_stl(file_name, tolerance=tolerance)
+    # the same mesh as read without NumPy.
+    monkeypatch.setattr(mesh_readers, '_numpy', lambda: None)
+    expected = read_stl(file_name, tolerance=tolerance)
+    assert expected.points() == mesh.points()
+    assert list(expected.triangles) == list(mesh.triangles)
+    assert isinstance(mesh.vertices, array) and isinstance(mesh.triangles, array)
+
+
+def test_read_stl_tolerance(tmp_path):
+    file_name = tmp_path / 'square.stl'
+    moved = [(x + 1e-7, y, z) for x, y, z in square.triangle_points(1)]
+    write_ascii_stl(file_name, [square.triangle_points(0), moved])
+
+    assert 6 == read_stl(file_name).vertex_count
+    assert 4 == read_stl(file_name, tolerance=1e-4).vertex_count
+
+    (tmp_path / 'empty.stl').write_bytes(b'')
+    with pytest.raises(ValueError):
+        read_stl(tmp_path / 'empty.stl')
+
+
+@pytest.mark.parametrize('chunk_size', [16, 1 << 22])
+def test_read_vrml(tmp_path, chunk_size):
+    file_name = tmp_path / 'square.wrl'
+    file_name.write_text(vrml_square)
+
+    mesh = read_vrml(file_name, chunk_size=chunk_size)
+    assert 4 == mesh.vertex_count
+    # the quad is split in two triangles.
+    assert [0, 1, 2, 0, 2, 3] == list(mesh.triangles)
+    # rotated a quarter turn around z then moved along x.
+    expected = [(10, 0, 0), (10, 1, 0), (9, 1, 0), (9, 0, 0)]
+    for point, expected_point in zip(mesh.points(), expected):
+        assert all(math.isclose(a, b, abs_tol=1e-9) for a, b in zip(point, expected_point))
+
+
+def test_weld():
+    mesh = Mesh.merge([square, square])
+    welded = weld(mesh)
+    assert 4 == welded.vertex_count
+    assert 4 == welded.triangle_count
+
+    # triangles collapsed by the merge are removed.
+    sliver = Mesh(array('d', [0, 0, 0, 1, 0, 0, 1, 1e-9, 0]), array('i', [0, 1, 2]))
+    assert 0 == weld(sliver, tolerance=1e-6).triangle_count
+
+
+def test_read_mesh(tmp_path):
+    write_binary_stl(tmp_path / 'square.STL', [square.triangle_points(0), square.triangle_points(1)])
+    (tmp_path / 'square.wrl').write_text(vrml_square)
+
+    assert 2 == read_mesh(tmp_path / 'square.STL').triangle_count
+    assert 2 == read_mesh(tmp_path / 'square.wrl').triangle_count
+    with pytest.raises(ValueError):
+        read_mesh(tmp_path / 'square.3dxml')
@@ -0,0 +1,85 @@
+#! /usr/bin/python3.9
+
+import pytest
+
+from pycatia.exception_handling import CATIAApplicationException
+from pycatia.scripts.recorder import Recorder
+
+
+class Wrapper:
+    # keeps its com object like the pycatia wrappers.
+
+    def __init__(self, com_object):
+        self.com_object = com_object
+        self.wrapper = com_object
+
+    def add_new_point_coord(self, x, y, z):
+        return Wrapper(self.wrapper.AddNewPointCoord(x, y, z))
+
+    def append_hybrid_shape(self, shape):
+        return self.wrapper.AppendHybridShape(shape.com_object)
+
+
+class SystemService:
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def evaluate(self, vba_code, language, vba_function_name, args):
+        self.calls.append((vba_code, vba_function_name, args))
+        return self.result
+
+
+def test_recorder_replays_in_one_call():
+    system_service = SystemService((('point', None), -1, ''))
+    factory = Wrapper('factory')
+    hybrid_body = Wrapper('hybrid_body')
+
+    with Recorder(system_service, factory, hybrid_body) as tx:
+        point = factory.add_new_point_coord(1.5, 2, 0)
+        hybrid_body.append_hybrid_shape(point)
+        point.wrapper.Name = 'Point.1'
+
+    assert 1 == len(system_service.calls)
+    vba_code, vba_function_name, args = system_service.calls[0]
+    assert 'replay' == vba_function_name
+    assert [['factory', 'hybrid_body', 1.5, 2, 0, 'Point.1']] == args
+    assert 'store 0, inputs(0).AddNewPointCoord(inputs(2), inputs(3), inputs(4))' in vba_code
+    assert 'store 1, inputs(1).AppendHybridShape(handles(0))' in vba_code
+    assert 'handles(0).Name = inputs(5)' in vba_code
+
+    # the wrappers are restored and the handles bound, attributes are forwarded to the bound objects.
+    assert 'factory' == factory.wrapper
+    assert 'hybrid_body' == hybrid_body.com_object
+    assert 'POINT' == point.com_object.upper()
+    assert 'committed' == tx.state
+
+
+def test_recorder_discards_on_exception():
+    system_service = SystemService(None)
+    factory = Wrapper('factory')
+
+    with pytest.raises(ZeroDivisionError):
+        with Recorder(system_service, factory):
+            point = factory.add_new_point_coord(0, 0, 0)
+            1 / 0
+
+    assert not system_service.calls
+    assert 'factory' == factory.com_object
+    with pytest.raises(CATIAApplicationException):
+        point.com_object.Name
+
+
+def test_recorder_failed_call():
+    system_service = SystemService((('point', None), 1, 'Method failed'))
+    factory = Wrapper('factory')
+    hybrid_body = Wrapper('hybrid_body')
+
+    with pytest.raises(CATIAApplicationException, match='AppendHybridShape'):
+        with Recorder(system_service, factory, hybrid_body):
+            point = factory.add_new_point_coord(0, 0, 0)
+            hybrid_body.append_hybrid_shape(point)
+
+    # the objects created before the failure are bound.
+    assert 'POINT' == point.com_object.upper()
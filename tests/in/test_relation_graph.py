@@ -0,0 +1,42 @@
+#! /usr/bin/python3.9
+
+from pycatia.scripts.relation_graph import RelationGraph
+
+
+def create_graph():
+    graph = RelationGraph()
+    graph.add_relation("Formula.1", ["length"], ["width"])
+    graph.add_relation("Formula.2", ["width", "length"], ["area"])
+    graph.add_relation("Check.1", ["area"])
+    graph.add_relation("Formula.3", ["a"], ["b"])
+    graph.add_relation("Formula.4", ["b"], ["a"])
+    graph.add_relation("Formula.5", ["b"], ["c"])
+    graph.add_relation("Rule.1", ["length"], ["depth"], activated=False)
+    graph.add_relation("Rule.2")
+    return graph
+
+
+def test_cycles():
+    graph = create_graph()
+
+    assert graph.cycles() == [["Formula.3", "Formula.4"]]
+    assert graph.dependencies("Formula.5") == {"Formula.3"}
+
+
+def test_evaluation_order():
+    order = create_graph().evaluation_order()
+
+    assert order.index("Formula.1") < order.index("Formula.2") < order.index("Check.1")
+    # relations in or depending on a cycle can't be ordered.
+    assert "Formula.3" not in order
+    assert "Formula.5" not in order
+
+
+def test_fan_out_and_dead_relations():
+    graph = create_graph()
+
+    assert graph.fan_out()[0] == ("length", 3)
+    assert graph.dead_relations() == ["Rule.1", "Rule.2"]
+    assert ("length", "Formula.1") in graph.edges()
+    assert ("Formula.1", "width") in graph.edges()
+    assert graph.conflicts() == {}
@@ -0,0 +1,100 @@
+#! /usr/bin/python3.9
+
+import pytest
+
+from pycatia.scripts.step_file import Enumeration
+from pycatia.scripts.step_file import Reference
+from pycatia.scripts.step_file import StepFile
+from pycatia.scripts.step_file import derived
+
+# the entities of a part exported by CATIA, shortened.
+step_text = r"""ISO-10303-21;
+HEADER;
+/* Generated by software containing ST-Developer */
+FILE_DESCRIPTION(('CATIA V5 STEP Exchange'),'2;1');
+FILE_NAME('C:\\temp\\part.stp','2020-01-01T00:00:00+00:00',('none'),('none'),'CATIA Version 5','CATIA V5','none');
+FILE_SCHEMA(('AUTOMOTIVE_DESIGN { 1 0 10303 214 1 1 1 1 }'));
+ENDSEC;
+DATA;
+#1=PRODUCT('Part1','Part1 \X2\00E9\X0\ ''quoted'' #99=X;','',(#2));
+#2=PRODUCT_CONTEXT(' ',#3,'mechanical');
+#3=APPLICATION_CONTEXT('automotive design');
+#5=SHAPE_REPRESENTATION('Part1',(#6),#10);
+#6=AXIS2_PLACEMENT_3D('',#7,$,$);
+#7=CARTESIAN_POINT('',(0.,1.5E1,-2));
+#8=ADVANCED_BREP_SHAPE_REPRESENTATION('NONE',(#6,#7),#10);
+#10=(GEOMETRIC_REPRESENTATION_CONTEXT(3)GLOBAL_UNCERTAINTY_ASSIGNED_CONTEXT((#14))
+GLOBAL_UNIT_ASSIGNED_CONTEXT((#11,#12,#13))REPRESENTATION_CONTEXT('NONE','WORKSPACE'));
+#11=(LENGTH_UNIT()NAMED_UNIT(*)SI_UNIT(.MILLI.,.METRE.));
+#12=(NAMED_UNIT(*)PLANE_ANGLE_UNIT()SI_UNIT($,.RADIAN.));
+#13=(NAMED_UNIT(*)SI_UNIT($,.STERADIAN.)SOLID_ANGLE_UNIT());
+#14=UNCERTAINTY_MEASURE_WITH_UNIT(LENGTH_MEASURE(0.005),#11,'distance_accuracy_value','CKD');
+#15=SURFACE_SIDE_STYLE('',(#16));
+#16=PRESENTATION_STYLE_ASSIGNMENT(.T.);
+ENDSEC;
+END-ISO-10303-21;
+"""
+
+
+@pytest.fixture
+def step_file(tmp_path):
+    file_name = tmp_path / 'part.stp'
+    file_name.write_bytes(step_text.encode('latin-1'))
+    with StepFile(file_name) as step:
+        yield step
+
+
+def test_header(step_file):
+    assert [['AUTOMOTIVE_DESIGN { 1 0 10303 214 1 1 1 1 }']] == step_file.header['FILE_SCHEMA']
+    assert 'C:\\temp\\part.stp' == step_file.header['FILE_NAME'][0]
+
+
+def test_entities(step_file):
+    # the file is only scanned as far as needed.
+    point = step_file[7]
+    assert 'CARTESIAN_POINT' == point.type
+    assert ['', [0.0, 15.0, -2]] == point.arguments
+    assert not step_file._scanned
+
+    placement = step_file[6]
+    assert [Reference(7), None, None] == placement.arguments[1:]
+    assert '#7' == repr(placement.arguments[1])
+
+    unit = step_file[11]
+    assert ('LENGTH_UNIT', 'NAMED_UNIT', 'SI_UNIT') == unit.types
+    assert [derived] == unit.get('NAMED_UNIT')
+    assert [Enumeration('MILLI'), Enumeration('METRE')] == unit.get('SI_UNIT')
+
+    measure = step_file[14].arguments[0]
+    assert ('LENGTH_MEASURE', [0.005]) == (measure.type, measure.arguments)
+    assert [True] == step_file[16].arguments
+
+    with pytest.raises(KeyError):
+        step_file[4]
+
+
+def test_queries(step_file):
+    assert 14 == len(step_file)
+    assert [{'entity': 1, 'id': 'Part1', 'name': "Part1 \u00e9 'quoted' #99=X;", 'description': ''}] == \
+        step_file.products()
+
+    representations = step_file.shape_representations()
+    assert [8, 5] == [representation['entity'] for representation in representations]
+    assert 2 == representations[0]['items']
+    assert Reference(10) == representations[1]['context']
+
+    assert [{'entity': 10, 'length': 'millimetre', 'plane_angle': 'radian', 'solid_angle': 'steradian'}] == \
+        step_file.units()
+
+    counts = step_file.type_counts()
+    assert 2 == counts['PRODUCT'] + counts['PRODUCT_CONTEXT']
+    assert 1 == counts['GLOBAL_UNIT_ASSIGNED_CONTEXT']
+    # the entity in the string is not indexed.
+    assert 'X' not in counts
+
+
+def test_not_a_step_file(tmp_path):
+    file_name = tmp_path / 'part.stp'
+    file_name.write_bytes(b'solid part\n')
+    with pytest.raises(ValueError):
+        StepFile(file_name)
@@ -0,0 +1,70 @@
+#! /usr/bin/python3.9
+
+from pathlib import Path
+
+import pytest
+
+from pycatia.scripts.thumbnails import ThumbnailCache
+from pycatia.scripts.thumbnails import ThumbnailService
+from pycatia.scripts.thumbnails import convert_image
+from pycatia.scripts.thumbnails import file_hash
+
+
+def test_thumbnail_cache(tmp_path):
+    part = Path(tmp_path, "part.CATPart")
+    part.write_bytes(b"V5_CFV2\x00part")
+    cache_file = Path(tmp_path, "thumbnails.json")
+    thumbnail = Path(tmp_path, "part - iso.png")
+    thumbnail.write_bytes(b"png")
+
+    cache = ThumbnailCache(cache_file)
+    content_hash = cache.get_hash(part)
+    assert content_hash == file_hash(part)
+
+    cache.add_thumbnails(content_hash, [thumbnail])
+    cache.save()
+
+    cached = ThumbnailCache(cache_file)
+    assert cached.files == cache.files
+    assert cached.get_thumbnails(content_hash) == [str(thumbnail)]
+
+    thumbnail.unlink()
+    assert cached.get_thumbnails(content_hash) == []
+
+
+def test_is_up_to_date(tmp_path):
+    part = Path(tmp_path, "part.CATPart")
+    part.write_bytes(b"V5_CFV2\x00part")
+
+    service = ThumbnailService(None, tmp_path, formats=("png", "webp"))
+    names = service.thumbnail_names(part)
+    assert list(names) == ["iso"]
+    assert [Path(name).suffix for name in names["iso"]] == [".png", ".webp"]
+    assert all(Path(name).name.startswith("part ") for name in names["iso"])
+    assert not service.is_up_to_date(part)
+
+    # a document with the same name in another folder has its own thumbnails.
+    other = Path(tmp_path, "other", "part.CATPart")
+    other.parent.mkdir()
+    other.write_bytes(b"V5_CFV2\x00other part")
+    assert not set(service.thumbnail_names(other)["iso"]) & set(names["iso"])
+
+    for name in names["iso"]:
+        Path(name).write_bytes(b"image")
+    service.cache.add_thumbnails(service.cache.get_hash(part), names["iso"])
+    assert service.is_up_to_date(part)
+
+    part.write_bytes(b"V5_CFV2\x00modified part")
+    assert not service.is_up_to_date(part)
+
+
+def test_convert_image(tmp_path):
+    image = pytest.importorskip("PIL.Image")
+
+    bmp_file = Path(tmp_path, "part - iso.bmp")
+    image.new("RGB", (8, 8), (255, 255, 255)).save(bmp_file)
+    png_file = str(Path(tmp_path, "part - iso.png"))
+
+    assert convert_image(str(bmp_file), [png_file]) == [png_file]
+    assert Path(png_file).is_file()
+    assert not bmp_file.is_file()
@@ -0,0 +1,45 @@
+#! /usr/bin/python3.9
+
+from pycatia.scripts.transforms import compose_absolute
+from pycatia.scripts.transforms import from_components
+from pycatia.scripts.transforms import identity
+from pycatia.scripts.transforms import invert
+from pycatia.scripts.transforms import multiply
+from pycatia.scripts.transforms import to_components
+from pycatia.scripts.transforms import transform_point
+from pycatia.scripts.transforms import transform_points
+
+# 90 degree rotation around z and a translation of (10, 20, 30).
+components = (0, 1, 0, -1, 0, 0, 0, 0, 1, 10, 20, 30)
+
+
+def test_components():
+    matrix = from_components(components)
+
+    assert matrix[0] == (0, -1, 0, 10)
+    assert matrix[3] == (0.0, 0.0, 0.0, 1.0)
+    assert to_components(matrix) == components
+
+
+def test_transform_point():
+    matrix = from_components(components)
+
+    assert transform_point(matrix, (1, 0, 0)) == (10, 21, 30)
+    assert transform_points(matrix, [(1, 0, 0), (0, 1, 0)]) == [(10, 21, 30), (9, 20, 30)]
+
+
+def test_invert():
+    matrix = from_components(components)
+
+    assert multiply(matrix, invert(matrix)) == identity
+
+
+def test_compose_absolute():
+    parent = from_components(components)
+    child = from_components((1, 0, 0, 0, 1, 0, 0, 0, 1, 5, 0, 0))
+
+    absolute = compose_absolute({"Sub.1": parent, "Sub.1/Part.1": child, "Part.2": child})
+
+    assert absolute["Sub.1"] == parent
+    assert transform_point(absolute["Sub.1/Part.1"], (0, 0, 0)) == (10, 25, 30)
+    assert absolute["Part.2"] == child
@@ -0,0 +1,247 @@
+#! /usr/bin/python3.9
+
+import pytest
+
+from pycatia.exception_handling import CATIAApplicationException
+from pycatia.scripts.update_tracker import TrackedObject
+from pycatia.scripts.update_tracker import UpdateTracker
+from pycatia.scripts.update_tracker import unwrap
+from pycatia.system_interfaces.any_object import AnyObject
+
+
+class ComObject:
+    # has _oleobj_ like the win32com objects.
+
+    def __init__(self, name):
+        self._oleobj_ = name
+        self.Name = name
+        self.X = None
+        self.Parent = None
+        self.calls = []
+
+    def AddNewPointCoord(self, x, y, z):
+        point = ComObject(f'Point.{x}')
+        point.X = ComObject('X')
+        point.Parent = ComObject('Part1')
+        return point
+
+    def AppendHybridShape(self, shape):
+        self.calls.append(('AppendHybridShape', shape))
+
+    def Evaluate(self, vba_code, language, vba_function_name, args):
+        self.calls.append(('Evaluate', vba_function_name, args))
+
+    def CreateReferenceFromObject(self, feature):
+        self.calls.append(('CreateReferenceFromObject', feature))
+        return ComObject(f'Reference of {feature.Name}')
+
+    def GetCoordinates(self):
+        return 0, 0, 0
+
+    def SetCoordinates(self, coordinates):
+        self.calls.append(('SetCoordinates', coordinates))
+
+
+class Wrapper:
+    # keeps its com object like the pycatia wrappers.
+
+    def __init__(self, com_object):
+        self.com_object = com_object
+        self.wrapper = com_object
+
+
+class SystemService:
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def evaluate(self, vba_code, language, vba_function_name, args):
+        self.calls.append((vba_function_name, args))
+        return self.result
+
+
+class Application:
+
+    def __init__(self, system_service):
+        self.system_service = system_service
+
+
+class Part(Wrapper):
+
+    def __init__(self, com_object, system_service):
+        super().__init__(com_object)
+        self.application = Application(system_service)
+        self.reference_cache_cleared = 0
+
+    def clear_reference_cache(self):
+        self.reference_cache_cleared += 1
+
+
+def test_tracks_created_and_modified_features():
+    part = Part(ComObject('Part1'), SystemService(None))
+    factory = Wrapper(ComObject('HybridShapeFactory'))
+    hybrid_body = Wrapper(ComObject('Geometrical Set.1'))
+    existing = Wrapper(ComObject('Point.existing'))
+
+    with UpdateTracker(part, factory, hybrid_body) as tracker:
+        first = factory.wrapper.AddNewPointCoord(1, 0, 0)
+        second = factory.wrapper.AddNewPointCoord(2, 0, 0)
+        hybrid_body.wrapper.AppendHybridShape(first)
+        assert [first, second] == tracker.dirty
+        # the com objects are passed to CATIA.
+        assert ('AppendHybridShape', first._com_object) == hybrid_body.com_object._com_object.calls[0]
+
+        tracker.clear()
+        # reading doesn't modify the features, setting a property of a property does.
+        assert (0, 0, 0) == first.GetCoordinates()
+        assert 'Point.1' == first.Name
+        assert not isinstance(first.Parent, TrackedObject)
+        assert not tracker.dirty
+        second.X.Name = 'changed'
+        assert [second] == tracker.dirty
+        first.SetCoordinates([second])
+        assert [second, first] == tracker.dirty
+        assert ('SetCoordinates', [second._com_object]) == first._com_object.calls[0]
+
+        tracker.mark_dirty(existing)
+        assert 3 == len(tracker.dirty)
+
+    # the wrappers are restored.
+    assert not isinstance(factory.com_object, TrackedObject)
+    assert part.wrapper is part.com_object
+    second.X.Name = 'not tracked'
+    assert 3 == len(tracker.dirty)
+
+
+def test_update():
+    system_service = SystemService(((True, False), ('', ''), 1, 1, '', 10.0, 10.5, 11.0))
+    part = Part(ComObject('Part1'), system_service)
+    factory = Wrapper(ComObject('HybridShapeFactory'))
+
+    with UpdateTracker(part, factory) as tracker:
+        points = [factory.wrapper.AddNewPointCoord(i, 0, 0) for i in range(2)]
+        result = tracker.update()
+
+    vba_function_name, args = system_service.calls[0]
+    assert 'update_dirty' == vba_function_name
+    assert [part.com_object, [point._com_object for point in points], 20] == args
+    assert {'checked': 2, 'stale': 1, 'updated': 1, 'mode': 'objects', 'errors': []} == \
+        {key: value for key, value in result.items() if key != 'seconds'}
+    assert not tracker.dirty
+    assert 0.5 == tracker.statistics['object_seconds']
+    assert 1 == part.reference_cache_cleared
+
+    # no call without dirty features.
+    assert 'mode' in tracker.update()
+    assert 1 == len(system_service.calls)
+
+    # the measured costs decide between updating the features and the part.
+    tracker.statistics.update({'full_updates': 1, 'full_update_seconds': 5.0})
+    assert 10 == tracker.max_stale_objects()
+
+
+def test_update_failures():
+    system_service = SystemService(((True,), ('Update error',), 1, 1, '', 0.0, 0.0, 0.0))
+    part = Part(ComObject('Part1'), system_service)
+
+    with UpdateTracker(part) as tracker:
+        point = part.wrapper.AddNewPointCoord(0, 0, 0)
+        result = tracker.update()
+
+    # the features which failed to update stay dirty.
+    assert [(point, 'Update error')] == result['errors']
+    assert [point] == tracker.dirty
+
+    tracker.max_objects = 0
+    system_service.result = ((True,), ('',), 1, 0, 'Part update failed', 0.0, 0.0, 0.0)
+    with pytest.raises(CATIAApplicationException):
+        tracker.update()
+
+
+def test_update_without_updated_features():
+    system_service = SystemService(((True,), ('',), 1, 0, '', 10.0, 10.5, 11.0))
+    part = Part(ComObject('Part1'), system_service)
+
+    with UpdateTracker(part) as tracker:
+        part.wrapper.AddNewPointCoord(0, 0, 0)
+        assert 'objects' == tracker.update()['mode']
+
+    # the duration of an update which updated nothing isn't counted as the cost of the features.
+    assert 0 == tracker.statistics['objects_updated']
+    assert 0.0 == tracker.statistics['object_seconds']
+
+
+def test_appended_shapes_are_modified():
+    part = Part(ComObject('Part1'), SystemService(None))
+    hybrid_body = Wrapper(ComObject('Geometrical Set.1'))
+
+    with UpdateTracker(part, hybrid_body) as tracker:
+        point = part.wrapper.AddNewPointCoord(0, 0, 0)
+        tracker.clear()
+        hybrid_body.wrapper.AppendHybridShape(point)
+        assert [point] == tracker.dirty
+
+
+def test_wrappers_are_restored():
+    part = Part(ComObject('Part1'), SystemService(None))
+
+    with UpdateTracker(part):
+        point = AnyObject(part.wrapper.AddNewPointCoord(0, 0, 0))
+        coordinate = AnyObject(point.com_object.X)
+        assert isinstance(point.com_object, TrackedObject)
+
+    # the pycatia objects created while tracking can be passed to CATIA after the tracker exits.
+    assert 'Point.0' == point.com_object.Name
+    assert not isinstance(point.com_object, TrackedObject)
+    assert not isinstance(coordinate.com_object, TrackedObject)
+
+
+def test_unwrap():
+    part = Part(ComObject('Part1'), SystemService(None))
+
+    with UpdateTracker(part):
+        point = part.wrapper.AddNewPointCoord(0, 0, 0)
+        assert [part.com_object._com_object, (point._com_object, 1)] == unwrap([part.com_object, (point, 1)])
+
+
+def test_append_hybrid_shapes():
+    pytest.importorskip('pywintypes')
+    from pycatia.mec_mod_interfaces.hybrid_body import HybridBody
+
+    application = ComObject('CATIA')
+    application.SystemService = ComObject('SystemService')
+    hybrid_body_com_object = ComObject('Geometrical Set.1')
+    hybrid_body_com_object.Application = application
+    part = Part(ComObject('Part1'), SystemService(None))
+    hybrid_body = HybridBody(hybrid_body_com_object)
+
+    with UpdateTracker(part, hybrid_body) as tracker:
+        points = [AnyObject(part.wrapper.AddNewPointCoord(i, 0, 0)) for i in range(2)]
+        tracker.clear()
+        hybrid_body.append_hybrid_shapes(points)
+        assert [point.com_object for point in points] == tracker.dirty
+
+    # the com objects, not their proxies, are passed to CATIA.
+    _, vba_function_name, args = application.SystemService.calls[0]
+    assert 'append_hybrid_shapes' == vba_function_name
+    assert [hybrid_body_com_object, [point.com_object for point in points]] == args
+
+
+def test_cached_references():
+    pytest.importorskip('pywintypes')
+    from pycatia.mec_mod_interfaces.part import Part as CATIAPart
+
+    part_com_object = ComObject('Part1')
+    part = CATIAPart(part_com_object)
+
+    with UpdateTracker(part) as tracker:
+        point = AnyObject(part.part.AddNewPointCoord(0, 0, 0))
+        tracker.clear()
+        reference = part.create_reference_from_object(point)
+        assert reference is part.create_reference_from_object(point)
+
+        # the cached references are created from the com objects and don't modify the features.
+        assert [('CreateReferenceFromObject', point.com_object._com_object)] == part_com_object.calls
+        assert not isinstance(reference.com_object, TrackedObject)
+        assert not tracker.dirty
@@ -29,6 +29,7 @@ sys.path.insert(0, os.path.abspath('..\\pycatia'))
 
 from pycatia import catia
 from pycatia.mec_mod_interfaces.part_document import PartDocument
+from pycatia.scripts.geometry import to_local
 
 caa = catia()
 part_document: PartDocument = caa.active_document
@@ -38,43 +39,13 @@ spa_workbench = part_document.spa_workbench()
 
 
 def coords_relative_to_axis(axis_system, point, precision=6):
-    a_origin = axis_system.get_origin()
-    a_xaxis = axis_system.get_x_axis()
-    a_yaxis = axis_system.get_y_axis()
-    a_zaxis = axis_system.get_z_axis()
-
-    n_x = normalize_vector(a_xaxis)
-    n_y = normalize_vector(a_yaxis)
-    n_z = normalize_vector(a_zaxis)
-
     reference = part.create_reference_from_object(point)
     measurable = spa_workbench.get_measurable(reference)
     coordinates = measurable.get_point()
 
-    diff = [0] * 3
-    diff[0] = coordinates[0] - a_origin[0]
-    diff[1] = coordinates[1] - a_origin[1]
-    diff[2] = coordinates[2] - a_origin[2]
-
-    x = round(dot_product(diff, n_x), precision)
-    y = round(dot_product(diff, n_y), precision)
-    z = round(dot_product(diff, n_z), precision)
-
-    return x, y, z
-
-
-def normalize_vector(vec):
-    magnitude = (vec[0] ** 2 + vec[1] ** 2 + vec[2] ** 2) ** 0.5
-    if magnitude != 0:
-        x = vec[0] / magnitude
-        y = vec[1] / magnitude
-        z = vec[2] / magnitude
-
-        return x, y, z
-
+    local_coordinates = to_local(axis_system.get_matrix(), [coordinates])[0]
 
-def dot_product(vec1, vec2):
-    return vec1[0] * vec2[0] + vec1[1] * vec2[1] + vec1[2] * vec2[2]
+    return tuple(round(value, precision) for value in local_coordinates)
 
 
 # Get first axis system in collection